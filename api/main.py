@@ -1,16 +1,19 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 
 import os
-from fastapi import FastAPI, HTTPException
+import uuid
+from pathlib import Path
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from qt.engine.engine import SimulationEngine
 from qt.strategies.market_maker import AvellanedaMarketMaker
 from qt.strategies.pairs import PairsStrategy
-from qt.analytics.reports import full_report
+from qt.analytics.downsample import downsample_history
+from qt.analytics.reports import CsvSink, JsonSink, RunReport, build_report
 from qt.data import get_prices_with_quality
 from qt.analytics.walk_forward import walk_forward_intraday
 from data_platform.api import router as platform_router
@@ -32,11 +35,29 @@ def _expected_freq_seconds(interval: str) -> Optional[int]:
     return mapping.get(interval)
 
 
-def _serialize_equity(eq_history) -> List[Dict[str, float]]:
+def _schedule_report_sinks(background_tasks: BackgroundTasks, report: RunReport, run_name: str) -> None:
+    """Persist the report after the response is sent, if QT_REPORT_DIR is set.
+
+    Each request gets its own file names, so concurrent runs never share a CSV.
+    """
+    out_dir = os.getenv("QT_REPORT_DIR")
+    if not out_dir:
+        return
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    base = Path(out_dir) / f"{run_name}_{uuid.uuid4().hex[:8]}"
+    background_tasks.add_task(report.write, CsvSink(f"{base}.csv"), JsonSink(f"{base}.json"))
+
+
+def _serialize_equity(eq_history, max_points: Optional[int] = None, method: str = "lttb") -> List[Dict[str, float]]:
+    if max_points:
+        eq_history = downsample_history(eq_history, max_points, method=method)
     return [{"timestamp": float(ts), "equity": float(eq)} for ts, eq in eq_history]
 
 
-def _serialize_trades(trade_log) -> List[Dict[str, Any]]:
+def _serialize_trades(trade_log, max_trades: Optional[int] = None) -> List[Dict[str, Any]]:
+    if max_trades:
+        # most recent trades only
+        trade_log = trade_log[-max_trades:]
     return [
         {
             "timestamp": float(t.get("timestamp", 0.0)),
@@ -65,6 +86,9 @@ class MarketMakerRequest(BaseModel):
     slippage_coeff: float = 0.0001
     half_spread_bps: float = 2.0
     impact_coeff: float = 0.0001
+    max_points: Optional[int] = None
+    downsample_method: Literal["lttb", "minmax"] = "lttb"
+    max_trades: Optional[int] = None
 
 
 class PairsRequest(BaseModel):
@@ -85,6 +109,9 @@ class PairsRequest(BaseModel):
     slippage_coeff: float = 0.0001
     half_spread_bps: float = 2.0
     impact_coeff: float = 0.0001
+    max_points: Optional[int] = None
+    downsample_method: Literal["lttb", "minmax"] = "lttb"
+    max_trades: Optional[int] = None
 
 
 class QualityRequest(BaseModel):
@@ -128,7 +155,7 @@ def data_quality(req: QualityRequest) -> Dict[str, Any]:
 
 
 @app.post("/run/market-maker")
-def run_market_maker(req: MarketMakerRequest) -> Dict[str, Any]:
+def run_market_maker(req: MarketMakerRequest, background_tasks: BackgroundTasks) -> Dict[str, Any]:
     if req.interval in {"1m", "2m", "5m"} and not os.getenv("YAHOO_RANGE"):
         os.environ["YAHOO_RANGE"] = "5d"
     eng = SimulationEngine(
@@ -147,12 +174,19 @@ def run_market_maker(req: MarketMakerRequest) -> Dict[str, Any]:
     eng.register_strategy(mm)
     eng.run_demo(data_source=req.data_source, start_date=req.start_date, end_date=req.end_date, interval=req.interval)
     eq_hist = eng.account.equity_history
-    summary = full_report(eq_hist, trade_log=eng.trade_log, exposure_history=eng.account.exposure_history)
-    return {"summary": summary, "equity": _serialize_equity(eq_hist), "trades": _serialize_trades(eng.trade_log)}
+    report = build_report(eq_hist, trade_log=eng.trade_log, exposure_history=eng.account.exposure_history)
+    _schedule_report_sinks(background_tasks, report, f"market_maker_{req.symbol}")
+    return {
+        "summary": report.summary,
+        "equity": _serialize_equity(eq_hist, req.max_points, req.downsample_method),
+        "trades": _serialize_trades(eng.trade_log, req.max_trades),
+        "n_equity_points": len(eq_hist),
+        "n_trades": len(eng.trade_log),
+    }
 
 
 @app.post("/run/pairs")
-def run_pairs(req: PairsRequest) -> Dict[str, Any]:
+def run_pairs(req: PairsRequest, background_tasks: BackgroundTasks) -> Dict[str, Any]:
     if req.interval in {"1m", "2m", "5m"} and not os.getenv("YAHOO_RANGE"):
         os.environ["YAHOO_RANGE"] = "5d"
     eng = SimulationEngine(
@@ -175,8 +209,15 @@ def run_pairs(req: PairsRequest) -> Dict[str, Any]:
     eng.register_strategy(ps)
     eng.run_demo(data_source=req.data_source, start_date=req.start_date, end_date=req.end_date, interval=req.interval)
     eq_hist = eng.account.equity_history
-    summary = full_report(eq_hist, trade_log=eng.trade_log, exposure_history=eng.account.exposure_history)
-    return {"summary": summary, "equity": _serialize_equity(eq_hist), "trades": _serialize_trades(eng.trade_log)}
+    report = build_report(eq_hist, trade_log=eng.trade_log, exposure_history=eng.account.exposure_history)
+    _schedule_report_sinks(background_tasks, report, f"pairs_{req.symbol_x}_{req.symbol_y}")
+    return {
+        "summary": report.summary,
+        "equity": _serialize_equity(eq_hist, req.max_points, req.downsample_method),
+        "trades": _serialize_trades(eng.trade_log, req.max_trades),
+        "n_equity_points": len(eq_hist),
+        "n_trades": len(eng.trade_log),
+    }
 
 
 @app.post("/walk-forward")
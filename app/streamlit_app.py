@@ -13,11 +13,13 @@ from qt.analytics.metrics import (
     compute_returns,
     compute_sharpe,
     compute_sortino,
+    drawdown_episodes,
     rolling_sharpe,
     rolling_volatility,
 )
 from qt.analytics.risk import stress_test_equity, monte_carlo_horizon_var, compute_var, compute_cvar
 from qt.analytics.risk_ext import multi_asset_monte_carlo_var, bootstrap_var, garch_var
+from qt.analytics.garch import fit_garch
 from qt.data import get_data_source
 from qt.data.prep import prepare_price_frame
 from qt.data.yahoo_api import fetch_yahoo_chart
@@ -187,6 +189,15 @@ with tabs[2]:
         dd_series = pd.Series(dd.get("drawdown_series", []))
         st.line_chart(dd_series, height=200)
 
+        episodes = pd.DataFrame(drawdown_episodes([v for (_t, v) in equity_history]))
+        if not episodes.empty:
+            ts = df_eq["timestamp"]
+            for col in ("peak", "trough", "recovery"):
+                idx = episodes[col]
+                episodes[f"{col}_time"] = ts.iloc[idx.clip(lower=0)].where(idx.ge(0).values).values
+            st.markdown("**Drawdown Episodes** (deepest first)")
+            st.dataframe(episodes.sort_values("depth").head(20), use_container_width=True)
+
         rolling = rolling_sharpe([v for (_t, v) in equity_history], window=20)
         st.line_chart(pd.Series(rolling), height=200)
 
@@ -372,20 +383,31 @@ with tabs[4]:
     elif var_method == "GARCH":
         st.subheader("GARCH VaR")
         if returns_data is not None:
+            fit_params = st.checkbox("Fit parameters by maximum likelihood", value=True)
             col_g1, col_g2 = st.columns(2)
             with col_g1:
-                omega = st.number_input("Omega", value=0.000001, format="%.8f")
-                alpha_garch = st.number_input("Alpha", value=0.05, format="%.3f")
+                omega = st.number_input("Omega", value=0.000001, format="%.8f", disabled=fit_params)
+                alpha_garch = st.number_input("Alpha", value=0.05, format="%.3f", disabled=fit_params)
             with col_g2:
-                beta_garch = st.number_input("Beta", value=0.94, format="%.3f")
+                beta_garch = st.number_input("Beta", value=0.94, format="%.3f", disabled=fit_params)
             if st.button("Calculate VaR", key="calc_garch"):
+                if fit_params:
+                    try:
+                        garch_fit = fit_garch(returns_data)
+                        omega, alpha_garch, beta_garch = garch_fit.omega, garch_fit.alpha, garch_fit.beta
+                        st.write(f"Fitted omega={omega:.3e}, alpha={alpha_garch:.3f}, beta={beta_garch:.3f}")
+                    except ValueError as exc:
+                        # too few returns to fit: garch_var falls back to constant-variance simulation
+                        st.warning(f"GARCH fit unavailable ({exc}); using constant variance.")
+                        omega = alpha_garch = beta_garch = None
                 var_result = garch_var(
                     returns_data,
                     alpha=alpha,
                     horizon=horizon,
+                    simulations=simulations,
                     omega=omega,
-                    alpha_param=alpha_garch,
-                    beta_param=beta_garch,
+                    alpha_g=alpha_garch,
+                    beta=beta_garch,
                     portfolio_value=portfolio_value,
                 )
                 st.success(f"GARCH VaR (95%): ${var_result:,.2f}")
@@ -0,0 +1,169 @@
+"""Performance metrics for many equity curves in one pass.
+
+`batch_metrics` takes a 2D array (curves x time), a list of ragged curves or
+a dict of name -> curve, packs them into a NaN-padded matrix and runs a
+single numba kernel over it (plain Python loops without numba). Metric
+definitions match the per-curve functions in `qt.analytics.metrics`.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.numba_helpers import njit
+from .metrics import EPSILON, TRADING_DAYS_PER_YEAR
+
+METRIC_COLUMNS = [
+    "n_points",
+    "final_equity",
+    "total_return",
+    "mean_return",
+    "volatility",
+    "sharpe",
+    "sortino",
+    "hit_rate",
+    "cagr",
+    "calmar",
+    "max_drawdown",
+    "max_drawdown_duration",
+    "avg_drawdown_duration",
+    "skew",
+    "kurtosis",
+]
+
+
+@njit
+def _curve_metrics_kernel(eq, lengths, annualization, eps):
+    n_curves = eq.shape[0]
+    out = np.zeros((n_curves, 15))
+    for c in range(n_curves):
+        n = lengths[c]
+        out[c, 0] = n
+        if n == 0:
+            out[c, 1] = np.nan
+            continue
+        first = eq[c, 0]
+        last = eq[c, n - 1]
+        out[c, 1] = last
+        out[c, 2] = last / max(first, eps) - 1.0
+
+        # pass 1: return moments, downside moments, hit rate, drawdowns
+        n_ret = n - 1
+        mean = 0.0
+        m2 = 0.0
+        n_pos = 0
+        n_down = 0
+        d_mean = 0.0
+        d_m2 = 0.0
+        hwm = eq[c, 0]
+        max_dd = (eq[c, 0] - max(hwm, eps)) / max(hwm, eps)
+        run = 0
+        runs = 0
+        run_total = 0
+        run_max = 0
+        for t in range(1, n):
+            prev = eq[c, t - 1]
+            x = eq[c, t]
+            r = x / max(prev, eps) - 1.0
+            k = t
+            delta = r - mean
+            mean += delta / k
+            m2 += delta * (r - mean)
+            if r > 0:
+                n_pos += 1
+            elif r < 0:
+                n_down += 1
+                dd_delta = r - d_mean
+                d_mean += dd_delta / n_down
+                d_m2 += dd_delta * (r - d_mean)
+            if x > hwm:
+                hwm = x
+            h = max(hwm, eps)
+            dd = (x - h) / h
+            if dd < max_dd:
+                max_dd = dd
+            if x < hwm:
+                run += 1
+                if run > run_max:
+                    run_max = run
+            elif run > 0:
+                runs += 1
+                run_total += run
+                run = 0
+        if run > 0:
+            runs += 1
+            run_total += run
+
+        std = np.sqrt(m2 / (n_ret - 1)) if n_ret > 1 else 0.0
+        out[c, 3] = mean
+        out[c, 4] = std
+        if n_ret > 1 and std >= eps:
+            out[c, 5] = mean / std * np.sqrt(annualization)
+        if n_down > 1:
+            d_std = np.sqrt(d_m2 / (n_down - 1))
+            if d_std >= eps:
+                out[c, 6] = mean / d_std * np.sqrt(annualization)
+        if n_ret > 0:
+            out[c, 7] = n_pos / n_ret
+        cagr = 0.0
+        if n > 1:
+            cagr = (last / max(first, eps)) ** (annualization / (n - 1)) - 1.0
+        out[c, 8] = cagr
+        out[c, 9] = cagr / abs(max_dd) if abs(max_dd) >= eps else 0.0
+        out[c, 10] = max_dd
+        out[c, 11] = run_max
+        out[c, 12] = run_total / runs if runs > 0 else 0.0
+
+        # pass 2: central moments for skew / excess kurtosis
+        if n_ret > 1:
+            m3 = 0.0
+            m4 = 0.0
+            for t in range(1, n):
+                r = eq[c, t] / max(eq[c, t - 1], eps) - 1.0 - mean
+                r2 = r * r
+                m3 += r2 * r
+                m4 += r2 * r2
+            s = max(std, eps)
+            out[c, 13] = (m3 / n_ret) / (s * s * s)
+            out[c, 14] = (m4 / n_ret) / (s * s * s * s) - 3.0
+    return out
+
+
+def _pack_curves(curves: Union[np.ndarray, Sequence[Iterable[float]]]):
+    if isinstance(curves, np.ndarray) and curves.ndim == 2:
+        eq = np.ascontiguousarray(curves, dtype=np.float64)
+        return eq, np.full(eq.shape[0], eq.shape[1], dtype=np.int64)
+    arrays: List[np.ndarray] = [np.asarray(c, dtype=np.float64).ravel() for c in curves]
+    lengths = np.array([a.size for a in arrays], dtype=np.int64)
+    eq = np.full((len(arrays), int(lengths.max()) if len(arrays) else 0), np.nan)
+    for i, a in enumerate(arrays):
+        eq[i, : a.size] = a
+    return eq, lengths
+
+
+def batch_metrics(
+    curves: Union[np.ndarray, Sequence[Iterable[float]], Dict[Any, Iterable[float]]],
+    annualization: float = TRADING_DAYS_PER_YEAR,
+    names: Optional[Sequence[Any]] = None,
+) -> pd.DataFrame:
+    """Compute summary metrics for every equity curve in `curves`.
+
+    Args:
+        curves: 2D array (curves x time), list of (possibly ragged) curves,
+            or dict of name -> curve (names become the index)
+        annualization: Periods per year
+        names: Optional index labels (defaults to dict keys or 0..n-1)
+
+    Returns:
+        DataFrame with one row per curve and the columns in `METRIC_COLUMNS`.
+    """
+    if isinstance(curves, dict):
+        names = list(curves.keys()) if names is None else names
+        curves = list(curves.values())
+    eq, lengths = _pack_curves(curves)
+    values = _curve_metrics_kernel(eq, lengths, float(annualization), EPSILON)
+    df = pd.DataFrame(values, columns=METRIC_COLUMNS, index=names)
+    for col in ("n_points", "max_drawdown_duration"):
+        df[col] = df[col].astype(np.int64)
+    return df
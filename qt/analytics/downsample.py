@@ -0,0 +1,136 @@
+"""Point-count reduction for chart payloads.
+
+`lttb_indices` implements Largest-Triangle-Three-Buckets, which keeps the
+points that best preserve the visual shape of a line; `minmax_indices`
+keeps the extreme points of each bucket, so spikes and drawdown troughs
+are never dropped. Both return indices into the original arrays so the
+caller can pick timestamps and values (or whole records) exactly.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.numba_helpers import njit
+
+
+@njit
+def _lttb_kernel(x, y, n_out):
+    n = x.shape[0]
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        cnt = avg_end - avg_start
+        if cnt > 0:
+            avg_x /= cnt
+            avg_y /= cnt
+        else:
+            avg_x = x[n - 1]
+            avg_y = y[n - 1]
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        ax = x[a]
+        ay = y[a]
+        best = -1.0
+        best_j = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best:
+                best = area
+                best_j = j
+        out[i + 1] = best_j
+        a = best_j
+    return out
+
+
+@njit
+def _minmax_kernel(y, n_buckets):
+    n = y.shape[0]
+    out = np.empty(2 * n_buckets, dtype=np.int64)
+    k = 0
+    for b in range(n_buckets):
+        start = (b * n) // n_buckets
+        end = ((b + 1) * n) // n_buckets
+        if end <= start:
+            continue
+        lo = start
+        hi = start
+        for j in range(start + 1, end):
+            if y[j] < y[lo]:
+                lo = j
+            if y[j] > y[hi]:
+                hi = j
+        if lo == hi:
+            out[k] = lo
+            k += 1
+        elif lo < hi:
+            out[k] = lo
+            out[k + 1] = hi
+            k += 2
+        else:
+            out[k] = hi
+            out[k + 1] = lo
+            k += 2
+    return out[:k]
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """Indices of at most `n_out` points chosen by LTTB (first and last always kept)."""
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    n = x.shape[0]
+    if n_out >= n or n <= 2:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[: max(n_out, 0)]
+    return _lttb_kernel(x, y, int(n_out))
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """Indices of at most `n_out` points, in order: the first and last, plus the
+    min and max of each of ``(n_out - 2) // 2`` buckets over the interior."""
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    n = y.shape[0]
+    if n_out >= n or n <= 2:
+        return np.arange(n)
+    if n_out < 3:
+        return np.array([0, n - 1])[: max(n_out, 0)]
+    n_buckets = (int(n_out) - 2) // 2
+    if n_buckets == 0:
+        return np.array([0, n - 1])
+    inner = _minmax_kernel(y[1 : n - 1], n_buckets) + 1
+    return np.concatenate(([0], inner, [n - 1]))
+
+
+def downsample(x, y, max_points: int, method: str = "lttb") -> Tuple[np.ndarray, np.ndarray]:
+    """Return (x, y) reduced to at most `max_points` points with `method` ("lttb" or "minmax")."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if method == "lttb":
+        idx = lttb_indices(x, y, max_points)
+    elif method == "minmax":
+        idx = minmax_indices(y, max_points)
+    else:
+        raise ValueError(f"unknown downsampling method: {method}")
+    return x[idx], y[idx]
+
+
+def downsample_history(history: Sequence, max_points: int, method: str = "lttb") -> List[Tuple[float, float]]:
+    """Downsample a list of (timestamp, value) pairs, returning the kept pairs."""
+    if max_points is None or len(history) <= max_points:
+        return list(history)
+    pairs = np.asarray(history, dtype=float).reshape(-1, 2)
+    ts, vals = downsample(pairs[:, 0], pairs[:, 1], max_points, method=method)
+    return list(zip(ts.tolist(), vals.tolist()))
@@ -73,40 +73,91 @@ def compute_drawdown(equity_curve):
     }
 
 
-def rolling_sharpe(equity_curve, window: int = 20, annualization: float = TRADING_DAYS_PER_YEAR):
+def _as_windows(window):
+    multi = np.ndim(window) > 0
+    windows = [int(w) for w in np.atleast_1d(window)]
+    if not windows or min(windows) < 1:
+        raise ValueError("window must be a positive integer or a sequence of them")
+    return windows, multi
+
+
+def _rolling_mean_std(x, window: int):
+    """Rolling mean and sample std (ddof=1) over axis 0 from cumulative sums.
+
+    Returns arrays for window end positions ``window - 1 .. n - 1``. Data is
+    centred on its overall mean before accumulating so the running sums stay
+    small and ``S2 - S1^2 / w`` does not lose precision; negative variances
+    from round-off are clamped to zero. Windows containing NaN/inf yield NaN,
+    as the per-window computation would.
+    """
+    bad = ~np.isfinite(x)
+    has_bad = bool(bad.any())
+    if has_bad:
+        x = np.where(bad, 0.0, x)
+    xc = x - x.mean(axis=0)
+    zeros = np.zeros((1,) + x.shape[1:])
+    c1 = np.concatenate([zeros, np.cumsum(xc, axis=0)])
+    c2 = np.concatenate([zeros, np.cumsum(xc * xc, axis=0)])
+    s1 = c1[window:] - c1[:-window]
+    s2 = c2[window:] - c2[:-window]
+    mean_c = s1 / window
+    mean = mean_c + x.mean(axis=0)
+    if window < 2:
+        std = np.full(mean.shape, np.nan)
+    else:
+        std = np.sqrt(np.maximum((s2 - s1 * mean_c) / (window - 1), 0.0))
+    if has_bad:
+        cb = np.concatenate([zeros, np.cumsum(bad, axis=0)])
+        tainted = (cb[window:] - cb[:-window]) > 0
+        mean[tainted] = np.nan
+        std[tainted] = np.nan
+    return mean, std
+
+
+def rolling_sharpe(equity_curve, window=20, annualization: float = TRADING_DAYS_PER_YEAR):
     """Return a rolling Sharpe series aligned to the input equity_curve.
 
     This returns a numpy array with the same length as `equity_curve`.
     Values before the first full window are padded with np.nan so plotting
     or alignment with timestamps is straightforward.
+
+    Runs in O(n) using cumulative sums. `equity_curve` may be 2D (one equity
+    curve per column), and `window` may be a sequence, in which case the
+    result gets a leading axis with one entry per window.
     """
     eq = np.array(equity_curve, dtype=float)
-    if eq.size < 2:
-        return np.full(eq.shape, np.nan)
-    rets = compute_returns(eq)
-    n = len(rets)
-    if n < window:
-        # not enough returns to compute a single window
-        return np.full(eq.shape, np.nan)
-    shs = np.full(n, np.nan)
-    for i in range(window - 1, n):
-        w = rets[i - window + 1 : i + 1]
-        shs[i] = compute_sharpe(w, annualization=annualization)
-    # pad to match equity_curve length (equity length = returns+1)
-    padded = np.full(eq.shape, np.nan)
-    padded[1:] = shs
-    return padded
-
-
-def rolling_volatility(returns, window: int = 20, annualization: float = TRADING_DAYS_PER_YEAR):
+    windows, multi = _as_windows(window)
+    out = np.full((len(windows),) + eq.shape, np.nan)
+    if eq.shape and eq.shape[0] >= 2:
+        rets = compute_returns(eq)
+        n = rets.shape[0]
+        for k, w in enumerate(windows):
+            if n < w:
+                # not enough returns to compute a single window
+                continue
+            mean, std = _rolling_mean_std(rets, w)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                shs = np.where(std < EPSILON, 0.0, mean / std * np.sqrt(annualization))
+            # pad to match equity_curve length (equity length = returns+1)
+            out[k, w:] = shs
+    return out if multi else out[0]
+
+
+def rolling_volatility(returns, window=20, annualization: float = TRADING_DAYS_PER_YEAR):
+    """Rolling annualised volatility aligned to `returns` (NaN before the first full window).
+
+    Same O(n) cumulative-sum scheme, 2D and multi-window support as `rolling_sharpe`.
+    """
     rets = np.asarray(returns, dtype=float)
-    if rets.size < window:
-        return np.full(rets.shape, np.nan)
-    vols = np.full(rets.shape, np.nan)
-    for i in range(window - 1, len(rets)):
-        w = rets[i - window + 1 : i + 1]
-        vols[i] = np.std(w, ddof=1) * np.sqrt(annualization)
-    return vols
+    windows, multi = _as_windows(window)
+    out = np.full((len(windows),) + rets.shape, np.nan)
+    n = rets.shape[0] if rets.shape else 0
+    for k, w in enumerate(windows):
+        if n < w:
+            continue
+        _, std = _rolling_mean_std(rets, w)
+        out[k, w - 1 :] = std * np.sqrt(annualization)
+    return out if multi else out[0]
 
 
 def compute_return_stats(returns):
@@ -155,26 +206,78 @@ def compute_calmar(equity_curve, annualization: float = TRADING_DAYS_PER_YEAR) -
     return float(cagr / max_dd)
 
 
+def _underwater_runs(eq):
+    """Run-length encode the underwater mask ``eq < running max``.
+
+    Returns (hwm, underwater, starts, ends) where each run covers
+    ``eq[starts[k]:ends[k]]``.
+    """
+    hwm = np.maximum.accumulate(eq)
+    underwater = eq < hwm
+    edges = np.diff(np.concatenate(([0], underwater.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return hwm, underwater, starts, ends
+
+
 def compute_drawdown_duration(equity_curve):
     eq = np.asarray(equity_curve, dtype=float)
     if eq.size == 0:
         return {"max_duration": 0, "avg_duration": 0.0}
-    hwm = np.maximum.accumulate(eq)
-    underwater = eq < hwm
-    durations = []
-    current = 0
-    for flag in underwater:
-        if flag:
-            current += 1
-        else:
-            if current > 0:
-                durations.append(current)
-            current = 0
-    if current > 0:
-        durations.append(current)
-    if not durations:
+    _, _, starts, ends = _underwater_runs(eq)
+    if starts.size == 0:
         return {"max_duration": 0, "avg_duration": 0.0}
-    return {"max_duration": int(max(durations)), "avg_duration": float(np.mean(durations))}
+    durations = ends - starts
+    return {"max_duration": int(durations.max()), "avg_duration": float(durations.mean())}
+
+
+def drawdown_episodes(equity_curve):
+    """Table of drawdown episodes (one per underwater run), as column arrays.
+
+    Columns:
+        peak: index of the high-water mark the episode is measured from
+        start: first underwater index
+        trough: index of the deepest point
+        recovery: first index back at the high-water mark (-1 if not recovered)
+        depth: drawdown at the trough (negative fraction, as in `compute_drawdown`)
+        duration: number of underwater observations (as in `compute_drawdown_duration`)
+    """
+    eq = np.asarray(equity_curve, dtype=float)
+    empty = np.array([], dtype=np.int64)
+    if eq.size == 0:
+        return {
+            "peak": empty,
+            "start": empty,
+            "trough": empty,
+            "recovery": empty,
+            "depth": np.array([], dtype=float),
+            "duration": empty,
+        }
+    hwm, underwater, starts, ends = _underwater_runs(eq)
+    h = np.maximum(hwm, EPSILON)
+    dd = (eq - h) / h
+    if starts.size == 0:
+        depth = np.array([], dtype=float)
+        trough = empty
+    else:
+        # segments [starts[k], starts[k+1]) only add non-negative gap values,
+        # so the segment minimum is the run's minimum
+        depth = np.minimum.reduceat(dd, starts)
+        run_start = np.zeros(eq.size, dtype=np.int64)
+        run_start[starts] = 1
+        run_id = np.cumsum(run_start) - 1
+        cand = np.flatnonzero(underwater & (dd == depth[np.maximum(run_id, 0)]))
+        rid = run_id[cand]
+        first = np.concatenate(([True], rid[1:] != rid[:-1]))
+        trough = cand[first]
+    return {
+        "peak": starts - 1,
+        "start": starts,
+        "trough": trough.astype(np.int64),
+        "recovery": np.where(ends < eq.size, ends, -1),
+        "depth": depth,
+        "duration": ends - starts,
+    }
 
 
 def _safe_mpl_backend():
@@ -1,57 +1,126 @@
 from __future__ import annotations
 
+import html
 from pathlib import Path
-from typing import Dict, Any, List
+from string import Template
+from typing import Dict, Any, Iterable, List, Optional
 
+from ..utils.parallel import parallel_map
+from .downsample import downsample_history
 
-def _render_html(summary: Dict[str, Any], equity_history: List, trade_log: List) -> str:
-    rows = "\n".join(
-        f"<tr><td>{k}</td><td>{v}</td></tr>"
-        for k, v in summary.items()
-    )
-    equity_rows = "\n".join(
-        f"<tr><td>{float(ts):.2f}</td><td>{float(eq):.2f}</td></tr>" for ts, eq in equity_history[-50:]
-    )
-    trade_rows = "\n".join(
-        f"<tr><td>{t.get('timestamp')}</td><td>{t.get('symbol')}</td><td>{t.get('side')}</td><td>{t.get('price')}</td><td>{t.get('quantity')}</td></tr>"
-        for t in trade_log[-50:]
+
+def _equity_svg(equity_history: List, max_points: int = 1000, width: int = 900, height: int = 220) -> str:
+    """Inline SVG line chart of the full equity curve, LTTB-downsampled to `max_points`."""
+    points = downsample_history(equity_history, max_points) if equity_history else []
+    if len(points) < 2:
+        return '<div class="muted">Not enough equity points to chart.</div>'
+    xs = [float(t) for t, _ in points]
+    ys = [float(v) for _, v in points]
+    x0, x1 = min(xs), max(xs)
+    y0, y1 = min(ys), max(ys)
+    sx = (width - 2) / (x1 - x0) if x1 > x0 else 0.0
+    sy = (height - 2) / (y1 - y0) if y1 > y0 else 0.0
+    coords = " ".join(f"{1 + (x - x0) * sx:.1f},{height - 1 - (y - y0) * sy:.1f}" for x, y in zip(xs, ys))
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">'
+        f'<polyline fill="none" stroke="#2563eb" stroke-width="1.2" points="{coords}"/></svg>'
+        f'<div class="muted">{len(equity_history)} points, {len(points)} plotted; range {y0:.2f} - {y1:.2f}</div>'
     )
-    return f"""
+
+
+_STYLE = """
+    body { font-family: Arial, sans-serif; margin: 24px; color: #0f172a; }
+    h1 { margin-bottom: 4px; }
+    table { border-collapse: collapse; width: 100%; margin-bottom: 18px; }
+    th, td { border: 1px solid #e2e8f0; padding: 8px; font-size: 12px; }
+    th { background: #f1f5f9; text-align: left; }
+    .muted { color: #64748b; font-size: 12px; }
+"""
+
+# parsed once per process and shared by every report rendered in it
+_REPORT_TEMPLATE = Template("""
 <!doctype html>
 <html>
 <head>
   <meta charset="utf-8"/>
-  <title>Quant Trading Report</title>
-  <style>
-    body {{ font-family: Arial, sans-serif; margin: 24px; color: #0f172a; }}
-    h1 {{ margin-bottom: 4px; }}
-    table {{ border-collapse: collapse; width: 100%; margin-bottom: 18px; }}
-    th, td {{ border: 1px solid #e2e8f0; padding: 8px; font-size: 12px; }}
-    th {{ background: #f1f5f9; text-align: left; }}
-    .muted {{ color: #64748b; font-size: 12px; }}
-  </style>
+  <title>$title</title>
+  <style>$style</style>
 </head>
 <body>
-  <h1>Quant Trading Report</h1>
+  <h1>$title</h1>
   <div class="muted">Summary metrics and recent activity snapshot.</div>
   <h2>Summary</h2>
   <table>
     <tr><th>Metric</th><th>Value</th></tr>
-    {rows}
+    $rows
   </table>
+  <h2>Equity Curve</h2>
+  $chart
   <h2>Recent Equity Points</h2>
   <table>
     <tr><th>Timestamp</th><th>Equity</th></tr>
-    {equity_rows}
+    $equity_rows
   </table>
   <h2>Recent Trades</h2>
   <table>
     <tr><th>Timestamp</th><th>Symbol</th><th>Side</th><th>Price</th><th>Quantity</th></tr>
-    {trade_rows}
+    $trade_rows
   </table>
 </body>
 </html>
-"""
+""")
+
+_INDEX_TEMPLATE = Template("""
+<!doctype html>
+<html>
+<head>
+  <meta charset="utf-8"/>
+  <title>$title</title>
+  <style>$style</style>
+</head>
+<body>
+  <h1>$title</h1>
+  <div class="muted">$n_runs runs ranked by $metric. $stats</div>
+  <table>
+    <tr>$header</tr>
+    $rows
+  </table>
+</body>
+</html>
+""")
+
+
+def _render_html(
+    summary: Dict[str, Any],
+    equity_history: List,
+    trade_log: List,
+    chart_points: int = 1000,
+    title: str = "Quant Trading Report",
+) -> str:
+    rows = "\n".join(f"<tr><td>{k}</td><td>{v}</td></tr>" for k, v in summary.items())
+    equity_rows = "\n".join(f"<tr><td>{float(ts):.2f}</td><td>{float(eq):.2f}</td></tr>" for ts, eq in equity_history[-50:])
+    trade_rows = "\n".join(
+        f"<tr><td>{t.get('timestamp')}</td><td>{t.get('symbol')}</td><td>{t.get('side')}</td><td>{t.get('price')}</td><td>{t.get('quantity')}</td></tr>"
+        for t in trade_log[-50:]
+    )
+    return _REPORT_TEMPLATE.substitute(
+        title=html.escape(title),
+        style=_STYLE,
+        rows=rows,
+        chart=_equity_svg(equity_history, max_points=chart_points),
+        equity_rows=equity_rows,
+        trade_rows=trade_rows,
+    )
+
+
+def _write_pdf(html_path: Path, pdf_path: Path) -> bool:
+    try:
+        from weasyprint import HTML
+
+        HTML(string=html_path.read_text(encoding="utf-8")).write_pdf(str(pdf_path))
+        return True
+    except Exception:
+        return False
 
 
 def generate_run_report(
@@ -60,20 +129,139 @@ def generate_run_report(
     equity_history: List,
     trade_log: List,
     out_dir: str = "reports",
+    chart_points: int = 1000,
+    pdf: bool = True,
 ) -> Dict[str, str]:
     out_path = Path(out_dir)
     out_path.mkdir(parents=True, exist_ok=True)
     html_path = out_path / f"{run_name}.html"
-    html_path.write_text(_render_html(summary, equity_history, trade_log), encoding="utf-8")
+    html_path.write_text(_render_html(summary, equity_history, trade_log, chart_points=chart_points), encoding="utf-8")
 
     pdf_path = out_path / f"{run_name}.pdf"
-    pdf_written = False
-    try:
-        from weasyprint import HTML
+    pdf_written = pdf and _write_pdf(html_path, pdf_path)
+    return {"html": str(html_path), "pdf": str(pdf_path) if pdf_written else ""}
+
+
+def _load_catalog_run(run_id: str, catalog_path: str):
+    from ..utils.run_artifacts import read_run_dataset
+    from ..utils.run_catalog import RunCatalog
+
+    run = RunCatalog(catalog_path).get_run(run_id)
+    root = run.get("artifact_root") or str(Path(catalog_path).parent / "dataset")
+    eq = read_run_dataset(root, "equity", run_ids=[run_id], columns=["timestamp", "equity"])
+    trades = read_run_dataset(root, "trades", run_ids=[run_id])
+    history = list(zip(eq["timestamp"].tolist(), eq["equity"].tolist()))
+    return run["metrics"], history, trades.drop(columns=["run_id"]).to_dict(orient="records")
 
-        HTML(string=html_path.read_text(encoding="utf-8")).write_pdf(str(pdf_path))
-        pdf_written = True
-    except Exception:
-        pdf_path = None
 
-    return {"html": str(html_path), "pdf": str(pdf_path) if pdf_written and pdf_path else ""}
+def _render_one(run: Any, out_dir: str, pdf: bool, chart_points: int, catalog_path: Optional[str]) -> Dict[str, str]:
+    if isinstance(run, str):
+        # run id from the catalog: artifacts are loaded inside the worker
+        if catalog_path is None:
+            raise ValueError("catalog_path is required to render runs given by id")
+        summary, history, trades = _load_catalog_run(run, catalog_path)
+        name = run
+    else:
+        name = run["run_name"]
+        summary = run.get("summary", {})
+        history = run.get("equity_history", [])
+        trades = run.get("trade_log", [])
+    paths = generate_run_report(name, summary, history, trades, out_dir=out_dir, chart_points=chart_points, pdf=pdf)
+    paths["run"] = name
+    return paths
+
+
+def generate_batch_reports(
+    runs: Iterable[Any],
+    out_dir: str = "reports",
+    n_jobs: int = -1,
+    pdf: bool = False,
+    chart_points: int = 1000,
+    catalog_path: Optional[str] = None,
+    index_metric: str = "sharpe",
+) -> Dict[str, Dict[str, str]]:
+    """Render reports for many runs in a process pool, plus an index page.
+
+    Args:
+        runs: Run ids from the catalog at `catalog_path`, or dicts with
+            run_name, summary, equity_history and trade_log
+        out_dir: Output directory
+        n_jobs: Worker processes (1 renders serially)
+        pdf: Also render PDFs (slow; off by default in batch mode)
+        chart_points: Points in each downsampled equity chart
+        catalog_path: SQLite run catalog; when given, `index.html` comparing
+            the rendered runs (matched by run id / run_name) is built from it
+        index_metric: Metric used to rank runs on the index page
+
+    Returns:
+        Mapping run name -> written paths (plus "index" when built).
+    """
+    runs = list(runs)
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    results = parallel_map(_render_one, runs, args=(out_dir, pdf, chart_points, catalog_path), n_jobs=n_jobs)
+    out = {r["run"]: r for r in results}
+    if catalog_path is not None:
+        # rank only the runs rendered here, not everything else in the catalog
+        index = generate_comparison_report(catalog_path, out_dir=out_dir, metric=index_metric, run_ids=list(out), links=out)
+        out["index"] = {"html": index}
+    return out
+
+
+def _fmt(v: Any) -> str:
+    if isinstance(v, float):
+        return f"{v:.6g}"
+    return html.escape("" if v is None else str(v))
+
+
+def generate_comparison_report(
+    catalog_path: str,
+    out_dir: str = "reports",
+    metric: str = "sharpe",
+    run_ids: Optional[List[str]] = None,
+    n: Optional[int] = None,
+    links: Optional[Dict[str, Dict[str, str]]] = None,
+    filename: str = "index.html",
+) -> str:
+    """Write a comparison page ranking catalog runs by `metric`.
+
+    Reads only the catalog's params/metrics tables; no equity curves are loaded.
+    """
+    from ..utils.run_catalog import RunCatalog
+
+    table = RunCatalog(catalog_path).runs_table(run_ids=run_ids)
+    if metric in table.columns:
+        table = table.sort_values(metric, ascending=False, na_position="last")
+    if n is not None:
+        table = table.head(n)
+    links = links or {}
+    columns = [c for c in table.columns if c not in ("created", "artifact_root")]
+    header = "".join(f"<th>{html.escape(c)}</th>" for c in columns)
+    rows = []
+    for rec in table.to_dict(orient="records"):
+        cells = []
+        for c in columns:
+            v = rec.get(c)
+            if c == "run_id" and v in links:
+                target = Path(links[v]["html"]).name
+                cells.append(f'<td><a href="{html.escape(target)}">{html.escape(v)}</a></td>')
+            else:
+                cells.append(f"<td>{_fmt(v)}</td>")
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    stats = ""
+    if metric in table.columns and len(table):
+        vals = table[metric].astype(float)
+        stats = f"Best {vals.max():.4g}, median {vals.median():.4g}, worst {vals.min():.4g}."
+    page = _INDEX_TEMPLATE.substitute(
+        title="Run Comparison",
+        style=_STYLE,
+        n_runs=len(table),
+        metric=html.escape(metric),
+        stats=stats,
+        header=header,
+        rows="\n".join(rows),
+    )
+    out_path = Path(out_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    path = out_path / filename
+    path.write_text(page, encoding="utf-8")
+    return str(path)
@@ -1,24 +1,12 @@
 import csv
+import json
 from collections import defaultdict
 from datetime import datetime
-from .metrics import compute_returns, compute_sharpe, compute_drawdown, compute_hit_rate
 
+import numpy as np
+import pandas as pd
 
-def _to_daily_buckets(equity_history):
-    """Group equity_history (list of (timestamp, equity)) by date (YYYY-MM-DD).
-
-    Returns dict date_str -> list of (timestamp, equity)
-    """
-    days = defaultdict(list)
-    for ts, eq in equity_history:
-        # assume ts is numeric epoch or convertible
-        try:
-            dt = datetime.fromtimestamp(float(ts))
-            key = dt.date().isoformat()
-        except Exception:
-            key = str(ts)
-        days[key].append((ts, eq))
-    return days
+from .metrics import EPSILON, TRADING_DAYS_PER_YEAR, compute_returns, compute_sharpe, compute_drawdown, compute_hit_rate
 
 
 def _period_metrics(equity_pairs):
@@ -32,6 +20,127 @@ def _period_metrics(equity_pairs):
     return {"final_equity": equities[-1], "returns": rets.tolist(), "sharpe": sharpe, "max_drawdown": dd.get("max_drawdown")}
 
 
+def _local_days(ts):
+    """Local calendar day (days since 1970-01-01) of each epoch timestamp.
+
+    Matches `datetime.fromtimestamp`: the local UTC offset is looked up once
+    per distinct quarter hour rather than once per row.
+    """
+    quarter = np.floor(ts / 900.0).astype(np.int64)
+    uq, inv = np.unique(quarter, return_inverse=True)
+    epoch = datetime(1970, 1, 1)
+    offsets = np.array([(datetime.fromtimestamp(q * 900) - epoch).total_seconds() - q * 900 for q in uq.tolist()])
+    return np.floor((ts + offsets[inv]) / 86400.0).astype(np.int64)
+
+
+def _day_codes(days):
+    labels = {int(d): str(np.datetime64(int(d), "D")) for d in np.unique(days)}
+    return days, labels
+
+
+def _iso_week_codes(days):
+    weekday = (days + 3) % 7  # 1970-01-01 was a Thursday; Monday == 0
+    thursday = days - weekday + 3
+    year = thursday.astype("datetime64[D]").astype("datetime64[Y]").astype(np.int64) + 1970
+    jan1 = (year - 1970).astype("datetime64[Y]").astype("datetime64[D]").astype(np.int64)
+    week = (thursday - jan1) // 7 + 1
+    codes = year * 100 + week
+    labels = {int(c): f"{int(c) // 100}-{int(c) % 100:02d}" for c in np.unique(codes)}
+    return codes, labels
+
+
+def _bucketed_metrics(equity_history, codes_fn):
+    """Per-bucket `_period_metrics` via segmented reductions.
+
+    Returns a list of (label, metrics, n_points) sorted by label, or None when
+    the timestamps are not plain epoch numbers (callers then use the
+    per-row path).
+    """
+    try:
+        pairs = np.asarray(equity_history, dtype=float)
+        if pairs.ndim != 2 or pairs.shape[0] == 0 or pairs.shape[1] != 2:
+            return None
+        ts = pairs[:, 0]
+        eq_in = pairs[:, 1]
+        if not np.all(np.isfinite(ts)):
+            return None
+        codes, labels = codes_fn(_local_days(ts))
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+    # stable sort keeps input order inside each bucket, like list appends
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    eq = eq_in[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+    ends = np.append(starts[1:], codes.size)
+    counts = ends - starts
+
+    # returns within buckets: drop the pairs that straddle a boundary
+    rets_all = eq[1:] / np.maximum(eq[:-1], EPSILON) - 1.0
+    keep = np.ones(rets_all.size, dtype=bool)
+    keep[starts[1:] - 1] = False
+    rets = rets_all[keep]
+    n_ret = counts - 1
+    r_starts = np.concatenate(([0], np.cumsum(n_ret)[:-1]))
+    has_ret = n_ret > 0
+
+    # trailing zero pad keeps reduceat indices valid for buckets without returns
+    sums = np.add.reduceat(np.append(rets, 0.0), r_starts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(has_ret, sums / np.maximum(n_ret, 1), np.nan)
+        centred = rets - np.repeat(means, n_ret)
+        ss = np.add.reduceat(np.append(centred * centred, 0.0), r_starts)
+        std = np.where(n_ret > 1, np.sqrt(ss / (n_ret - 1)), np.nan)
+        sharpe = np.where(std < EPSILON, 0.0, means / std * np.sqrt(TRADING_DAYS_PER_YEAR))
+
+    hwm = pd.Series(eq).groupby(codes, sort=False).cummax().to_numpy()
+    hwm = np.maximum(hwm, EPSILON)
+    max_dd = np.minimum.reduceat((eq - hwm) / hwm, starts)
+
+    rets_split = np.split(rets, np.cumsum(n_ret)[:-1])
+    out = []
+    for k in range(starts.size):
+        label = labels[int(codes[starts[k]])]
+        final = float(eq[ends[k] - 1])
+        if counts[k] < 2:
+            metrics = {"final_equity": final, "returns": [], "sharpe": None, "max_drawdown": None}
+        else:
+            metrics = {
+                "final_equity": final,
+                "returns": rets_split[k].tolist(),
+                "sharpe": float(sharpe[k]),
+                "max_drawdown": float(max_dd[k]),
+            }
+        out.append((label, metrics, int(counts[k])))
+    return out
+
+
+def _write_bucket_csv(out_csv_path, key_name, buckets):
+    rows = [(key_name, "final_equity", "sharpe", "max_drawdown", "n_points")]
+    for key, metrics, n in buckets:
+        rows.append((key, metrics.get("final_equity"), metrics.get("sharpe"), metrics.get("max_drawdown"), n))
+    with open(out_csv_path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerows(rows)
+
+
+def _week_key(ts):
+    dt = datetime.fromtimestamp(float(ts))
+    return f"{dt.isocalendar()[0]}-{dt.isocalendar()[1]:02d}"
+
+
+def _legacy_buckets(equity_history, key_fn):
+    groups = defaultdict(list)
+    for ts, eq in equity_history:
+        try:
+            key = key_fn(ts)
+        except Exception:
+            key = str(ts)
+        groups[key].append((ts, eq))
+    return [(k, _period_metrics(groups[k]), len(groups[k])) for k in sorted(groups.keys())]
+
+
 def daily_summary(equity_history, out_csv_path=None):
     """Produce daily summaries for the provided equity_history.
 
@@ -39,18 +148,12 @@ def daily_summary(equity_history, out_csv_path=None):
     Returns dict date -> metrics
     If out_csv_path provided, writes CSV with daily stats.
     """
-    days = _to_daily_buckets(equity_history)
-    result = {}
-    rows = [("date", "final_equity", "sharpe", "max_drawdown", "n_points")]
-    for d in sorted(days.keys()):
-        metrics = _period_metrics(days[d])
-        result[d] = metrics
-        rows.append((d, metrics.get("final_equity"), metrics.get("sharpe"), metrics.get("max_drawdown"), len(days[d])))
+    buckets = _bucketed_metrics(equity_history, _day_codes)
+    if buckets is None:
+        buckets = _legacy_buckets(equity_history, lambda ts: datetime.fromtimestamp(float(ts)).date().isoformat())
     if out_csv_path:
-        with open(out_csv_path, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerows(rows)
-    return result
+        _write_bucket_csv(out_csv_path, "date", buckets)
+    return {k: m for k, m, _ in buckets}
 
 
 def weekly_summary(equity_history, out_csv_path=None):
@@ -58,38 +161,145 @@ def weekly_summary(equity_history, out_csv_path=None):
 
     Returns dict week_key -> metrics where week_key is 'YYYY-WW'.
     """
-    weeks = defaultdict(list)
-    for ts, eq in equity_history:
-        try:
-            dt = datetime.fromtimestamp(float(ts))
-            key = f"{dt.isocalendar()[0]}-{dt.isocalendar()[1]:02d}"
-        except Exception:
-            key = str(ts)
-        weeks[key].append((ts, eq))
-    result = {}
-    rows = [("week", "final_equity", "sharpe", "max_drawdown", "n_points")]
-    for wk in sorted(weeks.keys()):
-        metrics = _period_metrics(weeks[wk])
-        result[wk] = metrics
-        rows.append((wk, metrics.get("final_equity"), metrics.get("sharpe"), metrics.get("max_drawdown"), len(weeks[wk])))
+    buckets = _bucketed_metrics(equity_history, _iso_week_codes)
+    if buckets is None:
+        buckets = _legacy_buckets(equity_history, _week_key)
     if out_csv_path:
-        with open(out_csv_path, "w", newline="") as f:
-            w = csv.writer(f)
-            w.writerows(rows)
-    return result
+        _write_bucket_csv(out_csv_path, "week", buckets)
+    return {k: m for k, m, _ in buckets}
 
 
-def full_report(
-    equity_history,
-    trade_log=None,
-    exposure_history=None,
-    out_csv_path="summary_metrics.csv",
-):
-    """Generate a full report: overall metrics plus optional daily/weekly CSVs.
+class RunReport:
+    """In-memory result of `build_report`.
+
+    Holds the overall `summary` dict; daily/weekly bucket tables are computed
+    from the equity history on first access. Nothing touches the disk until
+    the report is handed to one or more sinks via `write`.
+    """
+
+    def __init__(self, summary, metric_rows, equity_history=None):
+        self.summary = summary
+        # (metric, value) rows of the main CSV, in output order
+        self.metric_rows = metric_rows
+        self._equity_history = equity_history
+        self._daily = None
+        self._weekly = None
+
+    @property
+    def has_periods(self) -> bool:
+        return self._equity_history is not None
+
+    def daily_buckets(self):
+        """List of (date, metrics, n_points), sorted by date."""
+        if self._daily is None:
+            history = self._equity_history or []
+            buckets = _bucketed_metrics(history, _day_codes)
+            if buckets is None:
+                buckets = _legacy_buckets(history, lambda ts: datetime.fromtimestamp(float(ts)).date().isoformat())
+            self._daily = buckets
+        return self._daily
+
+    def weekly_buckets(self):
+        """List of (ISO week, metrics, n_points), sorted by week."""
+        if self._weekly is None:
+            history = self._equity_history or []
+            buckets = _bucketed_metrics(history, _iso_week_codes)
+            if buckets is None:
+                buckets = _legacy_buckets(history, _week_key)
+            self._weekly = buckets
+        return self._weekly
+
+    @property
+    def daily(self):
+        return {k: m for k, m, _ in self.daily_buckets()}
+
+    @property
+    def weekly(self):
+        return {k: m for k, m, _ in self.weekly_buckets()}
+
+    def period_table(self, kind: str) -> pd.DataFrame:
+        """Daily ("daily") or weekly ("weekly") bucket metrics as a DataFrame."""
+        buckets = self.daily_buckets() if kind == "daily" else self.weekly_buckets()
+        key = "date" if kind == "daily" else "week"
+        return pd.DataFrame(
+            [(k, m.get("final_equity"), m.get("sharpe"), m.get("max_drawdown"), n) for k, m, n in buckets],
+            columns=[key, "final_equity", "sharpe", "max_drawdown", "n_points"],
+        )
+
+    def to_dict(self, periods: bool = True):
+        """JSON-friendly representation (bucket return lists are omitted)."""
+        out = {"summary": dict(self.summary)}
+        if periods and self.has_periods:
+            for kind in ("daily", "weekly"):
+                out[kind] = self.period_table(kind).to_dict(orient="records")
+        return out
+
+    def write(self, *sinks):
+        """Write the report with each sink; returns the list of paths written."""
+        paths = []
+        for sink in sinks:
+            paths.extend(sink.write(self))
+        return paths
+
+
+class CsvSink:
+    """Write the classic `summary_metrics.csv` plus `_daily` / `_weekly` CSVs."""
+
+    def __init__(self, out_csv_path="summary_metrics.csv"):
+        self.out_csv_path = str(out_csv_path)
+
+    def write(self, report: RunReport):
+        with open(self.out_csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerows([("metric", "value")] + list(report.metric_rows))
+        paths = [self.out_csv_path]
+        if report.has_periods:
+            # daily and weekly CSVs beside the main file
+            base = self.out_csv_path.rsplit(".", 1)[0]
+            _write_bucket_csv(f"{base}_daily.csv", "date", report.daily_buckets())
+            _write_bucket_csv(f"{base}_weekly.csv", "week", report.weekly_buckets())
+            paths += [f"{base}_daily.csv", f"{base}_weekly.csv"]
+        return paths
+
+
+class JsonSink:
+    """Write `RunReport.to_dict()` as a single JSON document."""
+
+    def __init__(self, path):
+        self.path = str(path)
+
+    def write(self, report: RunReport):
+        with open(self.path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2, default=str)
+        return [self.path]
+
+
+class ParquetSink:
+    """Write summary and period tables as `<base>_summary/_daily/_weekly.parquet` (needs pyarrow)."""
+
+    def __init__(self, base_path):
+        self.base = str(base_path).rsplit(".parquet", 1)[0]
+
+    def write(self, report: RunReport):
+        rows = [(k, str(v) if v is not None else None) for k, v in report.metric_rows]
+        summary = pd.DataFrame(rows, columns=["metric", "value"])
+        tables = {"summary": summary}
+        if report.has_periods:
+            tables["daily"] = report.period_table("daily")
+            tables["weekly"] = report.period_table("weekly")
+        paths = []
+        for name, df in tables.items():
+            path = f"{self.base}_{name}.parquet"
+            df.to_parquet(path, index=False)
+            paths.append(path)
+        return paths
+
+
+def build_report(equity_history, trade_log=None, exposure_history=None) -> RunReport:
+    """Compute the `full_report` metrics in memory and return a `RunReport`.
 
     equity_history: list of (timestamp, equity) or a plain list of equity values.
     trade_log: optional list of trade dicts (timestamp, order_id, symbol, side, price, quantity, fee)
-    Returns summary dict.
     """
     # support legacy input: plain equity list
     if equity_history and not isinstance(equity_history[0], (list, tuple)):
@@ -98,21 +308,12 @@ def full_report(
         sharpe = compute_sharpe(rets)
         hit_rate = compute_hit_rate(rets)
         dd = compute_drawdown(equities)
-        rows = [
-            ("metric", "value"),
-            ("sharpe", sharpe),
-            ("hit_rate", hit_rate),
-            ("max_drawdown", dd["max_drawdown"]),
-            ("final_equity", equities[-1] if equities else None),
-        ]
-        with open(out_csv_path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerows(rows)
-        return {"sharpe": sharpe, "hit_rate": hit_rate, "max_drawdown": dd["max_drawdown"]}
+        summary = {"sharpe": sharpe, "hit_rate": hit_rate, "max_drawdown": dd["max_drawdown"]}
+        rows = list(summary.items()) + [("final_equity", equities[-1] if equities else None)]
+        return RunReport(summary, rows)
 
     # otherwise assume list of (ts, equity)
-    # overall
-    equities = [eq for (_ts, eq) in equity_history]
+    equities = np.array([eq for (_ts, eq) in equity_history], dtype=float)
     rets = compute_returns(equities)
     sharpe = compute_sharpe(rets)
     hit_rate = compute_hit_rate(rets)
@@ -121,50 +322,47 @@ def full_report(
         "sharpe": sharpe,
         "hit_rate": hit_rate,
         "max_drawdown": dd.get("max_drawdown"),
-        "final_equity": equities[-1] if equities else None,
+        "final_equity": equity_history[-1][1] if equity_history else None,
         "n_points": len(equities),
     }
     if exposure_history:
-        gross_vals = [v[1] for v in exposure_history if len(v) >= 3]
-        net_vals = [v[2] for v in exposure_history if len(v) >= 3]
-        if equities and gross_vals and net_vals:
-            avg_gross = sum(gross_vals) / len(gross_vals)
-            avg_net = sum(net_vals) / len(net_vals)
-            avg_eq = sum(equities) / len(equities)
+        exposure = np.array([v[1:3] for v in exposure_history if len(v) >= 3], dtype=float).reshape(-1, 2)
+        if equities.size and exposure.size:
+            avg_gross, avg_net = exposure.mean(axis=0)
+            avg_eq = equities.mean()
             summary.update(
                 {
-                    "avg_gross_exposure": avg_gross / avg_eq if avg_eq else 0.0,
-                    "avg_net_exposure": avg_net / avg_eq if avg_eq else 0.0,
+                    "avg_gross_exposure": float(avg_gross / avg_eq) if avg_eq else 0.0,
+                    "avg_net_exposure": float(avg_net / avg_eq) if avg_eq else 0.0,
                 }
             )
 
-    # write top-level CSV
-    rows = [("metric", "value")]
-    for k, v in summary.items():
-        rows.append((k, v))
-    with open(out_csv_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
-
-    # optionally write daily and weekly CSVs beside the main file
-    base = out_csv_path.rsplit(".", 1)[0]
-    daily_csv = f"{base}_daily.csv"
-    weekly_csv = f"{base}_weekly.csv"
-    daily_summary(equity_history, out_csv_path=daily_csv)
-    weekly_summary(equity_history, out_csv_path=weekly_csv)
-
-    # optionally include trade-level aggregates if trade_log provided
+    # trade-level aggregates if trade_log provided
     if trade_log:
         total_trades = len(trade_log)
         turnover = sum(abs(float(t.get("price", 0)) * float(t.get("quantity", 0))) for t in trade_log)
         summary.update({"total_trades": total_trades, "turnover": turnover})
-        # augment main CSV
-        with open(out_csv_path, "a", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(("total_trades", total_trades))
-            writer.writerow(("turnover", turnover))
 
-    return summary
+    return RunReport(summary, list(summary.items()), equity_history=equity_history)
+
+
+def full_report(
+    equity_history,
+    trade_log=None,
+    exposure_history=None,
+    out_csv_path="summary_metrics.csv",
+):
+    """Generate a full report: overall metrics plus optional daily/weekly CSVs.
+
+    equity_history: list of (timestamp, equity) or a plain list of equity values.
+    trade_log: optional list of trade dicts (timestamp, order_id, symbol, side, price, quantity, fee)
+    Returns summary dict. Pass `out_csv_path=None` to skip writing CSVs
+    (see `build_report` for the in-memory report object).
+    """
+    report = build_report(equity_history, trade_log=trade_log, exposure_history=exposure_history)
+    if out_csv_path:
+        report.write(CsvSink(out_csv_path))
+    return report.summary
 
 
 def summary_report(equity_curve, out_csv_path="summary_metrics.csv"):
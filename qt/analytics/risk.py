@@ -9,8 +9,19 @@ from typing import Any, Dict
 import numpy as np
 from typing import List
 
-
-def compute_var(returns, alpha: float = 0.05, method: str = "historical", simulations: int = 10000) -> float:
+from ..utils.rng import RNGLike
+from .sampling import standard_normal_samples
+
+
+def compute_var(
+    returns,
+    alpha: float = 0.05,
+    method: str = "historical",
+    simulations: int = 10000,
+    rng: RNGLike = None,
+    sampler: str = "pseudo",
+    moment_match: bool = False,
+) -> float:
     """Compute Value-at-Risk (VaR) for a returns series.
 
     Parameters
@@ -18,6 +29,11 @@ def compute_var(returns, alpha: float = 0.05, method: str = "historical", simula
     - alpha: tail probability (e.g. 0.05 for 95% VaR)
     - method: "historical" | "parametric" | "mc"
     - simulations: number of MC sims when method == "mc"
+    - rng: Generator or seed for method == "mc" (None derives one from np.random's global state)
+    - sampler: "pseudo" | "antithetic" | "sobol" normal draws for method == "mc"
+      (see `qt.analytics.sampling`; scrambled Sobol reaches a given tail-quantile
+      accuracy with far fewer simulations)
+    - moment_match: rescale draws to exact zero mean / unit variance (control variate)
 
     Returns the positive VaR number (loss expressed as positive value).
     """
@@ -45,17 +61,26 @@ def compute_var(returns, alpha: float = 0.05, method: str = "historical", simula
     if method == "mc":
         mu = np.mean(rets)
         sigma = np.std(rets, ddof=1)
-        sims = np.random.normal(loc=mu, scale=sigma, size=simulations)
+        sims = mu + sigma * standard_normal_samples(simulations, 1, sampler, moment_match, rng)[:, 0]
         var = -np.quantile(sims, alpha)
         return float(var)
 
     raise ValueError(f"Unknown method for VaR: {method}")
 
 
-def compute_cvar(returns, alpha: float = 0.05, method: str = "historical", simulations: int = 10000) -> float:
+def compute_cvar(
+    returns,
+    alpha: float = 0.05,
+    method: str = "historical",
+    simulations: int = 10000,
+    rng: RNGLike = None,
+    sampler: str = "pseudo",
+    moment_match: bool = False,
+) -> float:
     """Compute Conditional VaR (Expected Shortfall) at level alpha.
 
-    Returns positive expected loss in the tail.
+    Returns positive expected loss in the tail. `rng`, `sampler` and
+    `moment_match` apply to method == "mc" as in `compute_var`.
     """
     rets = np.asarray(returns, dtype=float)
     if rets.size == 0:
@@ -84,7 +109,7 @@ def compute_cvar(returns, alpha: float = 0.05, method: str = "historical", simul
     if method == "mc":
         mu = np.mean(rets)
         sigma = np.std(rets, ddof=1)
-        sims = np.random.normal(loc=mu, scale=sigma, size=simulations)
+        sims = mu + sigma * standard_normal_samples(simulations, 1, sampler, moment_match, rng)[:, 0]
         thresh = np.quantile(sims, alpha)
         tail = sims[sims <= thresh]
         if tail.size == 0:
@@ -94,13 +119,24 @@ def compute_cvar(returns, alpha: float = 0.05, method: str = "historical", simul
     raise ValueError(f"Unknown method for CVaR: {method}")
 
 
-def monte_carlo_horizon_var(returns, alpha: float = 0.05, horizon: int = 1, simulations: int = 10000) -> float:
+def monte_carlo_horizon_var(
+    returns,
+    alpha: float = 0.05,
+    horizon: int = 1,
+    simulations: int = 10000,
+    rng: RNGLike = None,
+    sampler: str = "pseudo",
+    moment_match: bool = False,
+) -> float:
     """Estimate multi-period VaR by Monte Carlo assuming iid returns (normal approx).
 
     - returns: historical returns series
     - horizon: number of periods to aggregate (e.g., days)
     - simulations: number of MC paths
+    - rng: Generator or seed
+    - sampler / moment_match: normal draw scheme, as in `compute_var`
     Returns positive VaR (loss) over the horizon.
+    For multi-core runs see `qt.analytics.risk_engine.MonteCarloRiskEngine`.
     """
     rets = np.asarray(returns, dtype=float)
     if rets.size == 0 or horizon < 1:
@@ -108,12 +144,9 @@ def monte_carlo_horizon_var(returns, alpha: float = 0.05, horizon: int = 1, simu
 
     mu = np.mean(rets)
     sigma = np.std(rets, ddof=1)
-    # simulate horizon cumulative returns assuming iid normal
-    sims = np.random.normal(loc=mu, scale=sigma, size=(simulations, horizon))
-    # cumulative log-returns approximation: sum of returns
-    cumrets = np.sum(sims, axis=1)
-    # convert to simple returns over horizon roughly as (1+sum) for small returns
-    # compute quantile
+    # the sum of `horizon` iid N(mu, sigma^2) returns is N(h*mu, h*sigma^2): one draw per path
+    z = standard_normal_samples(simulations, 1, sampler, moment_match, rng)[:, 0]
+    cumrets = horizon * mu + sigma * np.sqrt(horizon) * z
     var = -np.quantile(cumrets, alpha)
     return float(var)
 
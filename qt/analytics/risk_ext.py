@@ -1,15 +1,29 @@
 """Extended risk utilities for Week 5: multi-asset MC, bootstrap, scenario replay,
-and a lightweight GARCH-like simulator.
+and GARCH(1,1) simulation (see `qt.analytics.garch`).
 """
 
-from typing import Any, Dict, Sequence
+from typing import Any, Dict, Optional, Sequence
 
 import numpy as np
 from typing import List
 
+from ..utils.rng import RNGLike, as_generator
+from .bootstrap import bootstrap_statistic
+from .monte_carlo import DEFAULT_CHUNK_SIZE, cached_factor, simulate_portfolio_pnl
+from .garch import GarchFit, fit_garch, garch_from_params, simulate_garch_paths
+
 
 def multi_asset_monte_carlo_var(
-    returns_matrix, weights, portfolio_value: float = 1.0, alpha: float = 0.05, horizon: int = 1, simulations: int = 10000
+    returns_matrix,
+    weights,
+    portfolio_value: float = 1.0,
+    alpha: float = 0.05,
+    horizon: int = 1,
+    simulations: int = 10000,
+    method: str = "cholesky",
+    rank: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rng: RNGLike = None,
 ) -> float:
     """Multi-asset Monte Carlo VaR for a portfolio defined by asset weights.
 
@@ -20,8 +34,13 @@ def multi_asset_monte_carlo_var(
     - alpha: tail probability
     - horizon: number of periods to aggregate
     - simulations: number of Monte Carlo paths
+    - method: covariance factor, "cholesky" (eigen-clipped if not PD), "eigen" or "lowrank"
+    - rank: number of factors for "lowrank"
+    - chunk_size: paths generated per chunk (bounds memory at chunk_size x N)
+    - rng: Generator or seed
 
     Returns the positive VaR value expressed in the same units as `portfolio_value`.
+    Use `qt.analytics.monte_carlo.var_surface` for several alphas/horizons in one run.
     """
     rets = np.asarray(returns_matrix, dtype=float)
     weights = np.asarray(weights, dtype=float)
@@ -34,40 +53,48 @@ def multi_asset_monte_carlo_var(
     if T < 2:
         return 0.0
 
-    mu = np.mean(rets, axis=0)
-    cov = np.cov(rets, rowvar=False)
-
-    # Validate covariance matrix is positive semi-definite
-    if not np.all(np.linalg.eigvals(cov) >= -1e-10):
-        # If not PSD, make it PSD by adding small regularization
-        cov = cov + np.eye(N) * 1e-10
-
-    # draw sims x horizon x N multivariate normals
-    sims = np.random.multivariate_normal(mean=mu, cov=cov, size=(simulations, horizon))
-    # cumulative returns per sim per asset (sum across horizon)
-    cumrets = np.sum(sims, axis=1)  # shape (simulations, N)
-    # portfolio returns per simulation
-    port_rets = cumrets.dot(weights)
+    mu, factor = cached_factor(rets, method=method, rank=rank)
+    port_rets = simulate_portfolio_pnl(
+        mu, factor, weights, horizons=(horizon,), simulations=simulations, chunk_size=chunk_size, rng=rng
+    )[:, 0]
     var = -np.quantile(port_rets, alpha)
     return float(var * portfolio_value)
 
 
-def bootstrap_var(returns, alpha: float = 0.05, horizon: int = 1, simulations: int = 10000) -> float:
+def bootstrap_var(
+    returns,
+    alpha: float = 0.05,
+    horizon: int = 1,
+    simulations: int = 10000,
+    portfolio_value: float = 1.0,
+    method: str = "iid",
+    block_size: Optional[int] = None,
+    antithetic: bool = False,
+    rng: RNGLike = None,
+) -> float:
     """Estimate multi-period VaR by bootstrap resampling historical returns (with replacement).
 
     This avoids parametric assumptions and is useful for heavy-tailed data.
+    `method` is "iid", "circular" or "stationary" (see `qt.analytics.bootstrap`);
+    the block schemes keep the autocorrelation of intraday returns. Resamples
+    are drawn as one index matrix in memory-bounded chunks.
     """
     rets = np.asarray(returns, dtype=float)
     if rets.size == 0 or horizon < 1:
         return 0.0
 
-    sims = np.zeros(simulations)
-    n = rets.shape[0]
-    for i in range(simulations):
-        idx = np.random.randint(0, n, size=horizon)
-        sims[i] = np.sum(rets[idx])
+    sims = bootstrap_statistic(
+        rets,
+        lambda paths: paths.sum(axis=1),
+        n_resamples=simulations,
+        length=horizon,
+        method=method,
+        block_size=block_size,
+        antithetic=antithetic,
+        rng=rng,
+    )
     var = -np.quantile(sims, alpha)
-    return float(var)
+    return float(var * portfolio_value)
 
 
 def apply_historical_scenario_to_portfolio(
@@ -105,31 +132,40 @@ def apply_historical_scenario_to_portfolio(
     return {"stressed_equity": equity.tolist(), "max_drawdown": max_dd, "final_equity": float(equity[-1])}
 
 
+def _garch_model(returns, omega: Optional[float], alpha_g: Optional[float], beta: Optional[float]) -> GarchFit:
+    if omega is None or alpha_g is None or beta is None:
+        return fit_garch(returns)
+    return garch_from_params(returns, omega, alpha_g, beta)
+
+
 def simulate_garch_returns(
-    returns, horizon: int = 1, simulations: int = 10000, omega: float = 1e-6, alpha_g: float = 0.05, beta: float = 0.9
+    returns,
+    horizon: int = 1,
+    simulations: int = 10000,
+    omega: Optional[float] = None,
+    alpha_g: Optional[float] = None,
+    beta: Optional[float] = None,
+    rng: RNGLike = None,
 ) -> np.ndarray:
-    """Simulate horizon returns using a simple GARCH(1,1)-like recursion for variance.
+    """Simulate cumulative horizon returns from a GARCH(1,1) model.
 
-    This is a lightweight, approximate simulator that uses user-provided GARCH
-    parameters or sensible defaults. It returns an array of simulated cumulative
-    returns (length `simulations`) for the horizon.
+    Parameters default to maximum-likelihood estimates on `returns`; pass all
+    of `omega`, `alpha_g` and `beta` to use fixed values instead. Each path
+    runs its own conditional-variance recursion starting from the variance
+    filtered at the end of the sample. Returns an array of simulated
+    cumulative returns (length `simulations`).
     """
     rets = np.asarray(returns, dtype=float)
+    rets = rets[np.isfinite(rets)]
     if rets.size == 0 or horizon < 1:
         return np.zeros(simulations)
+    if rets.size < 10:
+        # too short to fit: fall back to the sample variance as a constant
+        sigma = float(np.std(rets, ddof=1)) if rets.size > 1 else 0.0
+        return as_generator(rng).normal(0.0, sigma, size=(simulations, horizon)).sum(axis=1)
 
-    # initialize variance from sample variance
-    sigma2 = float(np.var(rets, ddof=1))
-
-    sims = np.zeros((simulations, horizon), dtype=float)
-    for t in range(horizon):
-        eps = np.random.normal(loc=0.0, scale=np.sqrt(sigma2), size=simulations)
-        sims[:, t] = eps
-        # update sigma2 using average of eps^2 as a proxy for realized variance
-        sigma2 = omega + alpha_g * float(np.mean(eps**2)) + beta * sigma2
-
-    cumrets = np.sum(sims, axis=1)
-    return cumrets
+    model = _garch_model(rets, omega, alpha_g, beta)
+    return simulate_garch_paths(model, horizon=horizon, simulations=simulations, rng=rng).sum(axis=1)
 
 
 def garch_var(
@@ -137,11 +173,15 @@ def garch_var(
     alpha: float = 0.05,
     horizon: int = 1,
     simulations: int = 10000,
-    omega: float = 1e-6,
-    alpha_g: float = 0.05,
-    beta: float = 0.9,
+    omega: Optional[float] = None,
+    alpha_g: Optional[float] = None,
+    beta: Optional[float] = None,
+    portfolio_value: float = 1.0,
+    rng: RNGLike = None,
 ) -> float:
-    """Estimate VaR using the GARCH-like simulator above."""
-    sims = simulate_garch_returns(returns, horizon=horizon, simulations=simulations, omega=omega, alpha_g=alpha_g, beta=beta)
+    """Estimate VaR by simulating the (fitted by default) GARCH(1,1) model above."""
+    sims = simulate_garch_returns(
+        returns, horizon=horizon, simulations=simulations, omega=omega, alpha_g=alpha_g, beta=beta, rng=rng
+    )
     var = -np.quantile(sims, alpha)
-    return float(var)
+    return float(var * portfolio_value)
@@ -0,0 +1,49 @@
+"""Standard-normal samplers for Monte Carlo risk estimates.
+
+- "pseudo": plain pseudo-random normals
+- "antithetic": half the draws plus their negations (symmetric sample)
+- "sobol": scrambled Sobol points mapped through the normal inverse CDF;
+  the count is rounded up to a power of two, which keeps the sequence's balance
+  properties
+
+`moment_match=True` rescales each column to exactly zero mean and unit
+variance. This acts as a control variate on the first two sample moments,
+which are known exactly under the normal model.
+"""
+
+import numpy as np
+
+from ..utils.rng import RNGLike, as_generator
+
+SAMPLERS = ("pseudo", "antithetic", "sobol")
+
+
+def sobol_size(n: int) -> int:
+    """Smallest power of two >= n."""
+    return 1 << max(0, int(np.ceil(np.log2(max(int(n), 1)))))
+
+
+def standard_normal_samples(
+    n: int, dim: int = 1, sampler: str = "pseudo", moment_match: bool = False, rng: RNGLike = None
+) -> np.ndarray:
+    """Return an (m, dim) array of N(0, 1) draws (m = n, or the next power of two for "sobol")."""
+    rng = as_generator(rng)
+    if sampler == "pseudo":
+        z = rng.standard_normal((n, dim))
+    elif sampler == "antithetic":
+        half = rng.standard_normal((-(-n // 2), dim))
+        z = np.concatenate([half, -half])[:n]
+    elif sampler == "sobol":
+        try:
+            from scipy.stats import norm, qmc
+        except Exception:
+            raise ImportError("scipy required for Sobol sampling")
+
+        m = sobol_size(n)
+        u = qmc.Sobol(d=dim, scramble=True, seed=rng).random_base2(int(np.log2(m)))
+        z = norm.ppf(np.clip(u, 1e-12, 1.0 - 1e-12))
+    else:
+        raise ValueError(f"unknown sampler: {sampler}")
+    if moment_match and z.shape[0] > 1:
+        z = (z - z.mean(axis=0)) / z.std(axis=0, ddof=0)
+    return z
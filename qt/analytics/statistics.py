@@ -1,6 +1,9 @@
 import numpy as np
 from statsmodels.tsa.stattools import adfuller
-from typing import Tuple
+from typing import Optional, Tuple
+
+from ..utils.rng import RNGLike
+from .bootstrap import bootstrap_statistic
 
 
 def adf_test(series):
@@ -8,17 +11,18 @@ def adf_test(series):
     return {"adf_stat": float(res[0]), "pvalue": float(res[1]), "usedlag": int(res[2])}
 
 
-def bootstrap_sharpe_ci(returns, n_boot=1000, alpha=0.05) -> Tuple[float, float]:
-    # simple bootstrap on returns to get CI for Sharpe
-    returns = np.array(returns)
+def _sharpe_rows(samples: np.ndarray) -> np.ndarray:
+    return np.mean(samples, axis=1) / (np.std(samples, axis=1, ddof=1) + 1e-9) * np.sqrt(252.0)
+
+
+def bootstrap_sharpe_ci(
+    returns, n_boot=1000, alpha=0.05, method: str = "iid", block_size: Optional[int] = None, rng: RNGLike = None
+) -> Tuple[float, float]:
+    # bootstrap on returns to get CI for Sharpe; "circular"/"stationary" resample blocks
+    returns = np.array(returns, dtype=float)
     if len(returns) == 0:
         return (0.0, 0.0)
-    n = len(returns)
-    shs = []
-    for _ in range(n_boot):
-        sample = np.random.choice(returns, size=n, replace=True)
-        sr = np.mean(sample) / (np.std(sample, ddof=1) + 1e-9) * np.sqrt(252.0)
-        shs.append(sr)
+    shs = bootstrap_statistic(returns, _sharpe_rows, n_resamples=n_boot, method=method, block_size=block_size, rng=rng)
     lower = float(np.percentile(shs, 100 * alpha / 2))
     upper = float(np.percentile(shs, 100 * (1 - alpha / 2)))
     return lower, upper
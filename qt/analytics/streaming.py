@@ -0,0 +1,405 @@
+"""Online (O(1) per update) performance and tail-risk metrics.
+
+`StreamingMetrics` is fed one mark-to-market point at a time (see
+`Account.mark_to_market`) and keeps running moments of returns, the
+high-water mark, drawdown state and exposure sums, so a live summary can
+be read at any point without materialising the equity history. Its
+definitions follow the batch functions in `qt.analytics.metrics`.
+
+`StreamingTailRisk` tracks historical VaR/CVaR of per-tick returns with a
+bounded-size `TDigest` quantile sketch, plus an EWMA (RiskMetrics)
+parametric VaR/CVaR. Both digests and tail-risk trackers can be merged,
+e.g. across strategies or worker processes.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .metrics import EPSILON, TRADING_DAYS_PER_YEAR
+
+
+class StreamingMetrics:
+    """Running return, drawdown and exposure statistics for one equity stream."""
+
+    __slots__ = (
+        "n_points",
+        "first_equity",
+        "last_equity",
+        "_n_ret",
+        "_mean",
+        "_m2",
+        "_n_pos",
+        "_n_down",
+        "_down_mean",
+        "_down_m2",
+        "hwm",
+        "drawdown",
+        "max_drawdown",
+        "_dd_run",
+        "_dd_runs",
+        "_dd_total",
+        "_dd_max",
+        "_gross_sum",
+        "_net_sum",
+        "_equity_sum",
+        "_n_exposure",
+    )
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.n_points = 0
+        self.first_equity = 0.0
+        self.last_equity = 0.0
+        # Welford moments of all returns and of negative returns
+        self._n_ret = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._n_pos = 0
+        self._n_down = 0
+        self._down_mean = 0.0
+        self._down_m2 = 0.0
+        # drawdown state
+        self.hwm = -math.inf
+        self.drawdown = 0.0
+        self.max_drawdown = 0.0
+        self._dd_run = 0
+        self._dd_runs = 0
+        self._dd_total = 0
+        self._dd_max = 0
+        # exposure sums
+        self._gross_sum = 0.0
+        self._net_sum = 0.0
+        self._equity_sum = 0.0
+        self._n_exposure = 0
+
+    def update(self, equity: float, gross: Optional[float] = None, net: Optional[float] = None) -> None:
+        """Add one equity observation (and optionally its gross/net exposure)."""
+        equity = float(equity)
+        if self.n_points == 0:
+            self.first_equity = equity
+        else:
+            r = equity / max(self.last_equity, EPSILON) - 1.0
+            self._n_ret += 1
+            delta = r - self._mean
+            self._mean += delta / self._n_ret
+            self._m2 += delta * (r - self._mean)
+            if r > 0:
+                self._n_pos += 1
+            elif r < 0:
+                self._n_down += 1
+                d = r - self._down_mean
+                self._down_mean += d / self._n_down
+                self._down_m2 += d * (r - self._down_mean)
+        self.n_points += 1
+        self.last_equity = equity
+        self._equity_sum += equity
+
+        if equity > self.hwm:
+            self.hwm = equity
+        hwm = max(self.hwm, EPSILON)
+        self.drawdown = (equity - hwm) / hwm
+        if self.drawdown < self.max_drawdown:
+            self.max_drawdown = self.drawdown
+        if equity < self.hwm:
+            self._dd_run += 1
+            if self._dd_run > self._dd_max:
+                self._dd_max = self._dd_run
+        elif self._dd_run > 0:
+            self._dd_runs += 1
+            self._dd_total += self._dd_run
+            self._dd_run = 0
+
+        if gross is not None and net is not None:
+            self._gross_sum += float(gross)
+            self._net_sum += float(net)
+            self._n_exposure += 1
+
+    @property
+    def n_returns(self) -> int:
+        return self._n_ret
+
+    @property
+    def mean_return(self) -> float:
+        return self._mean
+
+    def volatility(self) -> float:
+        """Sample std (ddof=1) of per-period returns."""
+        return math.sqrt(self._m2 / (self._n_ret - 1)) if self._n_ret > 1 else 0.0
+
+    def sharpe(self, annualization: float = TRADING_DAYS_PER_YEAR) -> float:
+        std = self.volatility()
+        if self._n_ret < 2 or std < EPSILON:
+            return 0.0
+        return self._mean / std * math.sqrt(annualization)
+
+    def sortino(self, annualization: float = TRADING_DAYS_PER_YEAR) -> float:
+        if self._n_down == 0:
+            return 0.0
+        if self._n_down == 1:
+            # sample std of a single downside return is undefined, as in `compute_sortino`
+            return math.nan
+        downside_std = math.sqrt(self._down_m2 / (self._n_down - 1))
+        if downside_std < EPSILON:
+            return 0.0
+        return self._mean / downside_std * math.sqrt(annualization)
+
+    def hit_rate(self) -> float:
+        return self._n_pos / self._n_ret if self._n_ret else 0.0
+
+    def drawdown_duration(self) -> Dict[str, float]:
+        """Longest and average underwater run (in observations), including an open run."""
+        runs = self._dd_runs + (1 if self._dd_run > 0 else 0)
+        total = self._dd_total + self._dd_run
+        return {"max_duration": int(self._dd_max), "avg_duration": float(total / runs) if runs else 0.0}
+
+    def cagr(self, annualization: float = TRADING_DAYS_PER_YEAR) -> float:
+        if self.n_points < 2:
+            return 0.0
+        total_return = self.last_equity / max(self.first_equity, EPSILON)
+        if total_return < 0:
+            # no real root of a negative growth factor; `compute_cagr` gives nan too
+            return math.nan
+        years = (self.n_points - 1) / annualization
+        return float(total_return ** (1.0 / years) - 1.0)
+
+    def summary(self, annualization: float = TRADING_DAYS_PER_YEAR) -> Dict[str, Any]:
+        duration = self.drawdown_duration()
+        cagr = self.cagr(annualization)
+        max_dd = abs(self.max_drawdown)
+        out: Dict[str, Any] = {
+            "sharpe": self.sharpe(annualization),
+            "sortino": self.sortino(annualization),
+            "hit_rate": self.hit_rate(),
+            "cagr": cagr,
+            "calmar": cagr / max_dd if max_dd >= EPSILON else 0.0,
+            "max_drawdown": self.max_drawdown,
+            "current_drawdown": self.drawdown,
+            "max_drawdown_duration": duration["max_duration"],
+            "avg_drawdown_duration": duration["avg_duration"],
+            "mean_return": self._mean,
+            "volatility": self.volatility(),
+            "final_equity": self.last_equity if self.n_points else None,
+            "n_points": self.n_points,
+        }
+        if self._n_exposure and self.n_points:
+            avg_eq = self._equity_sum / self.n_points
+            out["avg_gross_exposure"] = (self._gross_sum / self._n_exposure) / avg_eq if avg_eq else 0.0
+            out["avg_net_exposure"] = (self._net_sum / self._n_exposure) / avg_eq if avg_eq else 0.0
+        return out
+
+
+class TDigest:
+    """Merging t-digest quantile sketch (Dunning & Ertl).
+
+    Values are buffered and periodically merged into ~`compression`
+    centroids using the log-odds (k2) scale function. Centroid weights then
+    grow geometrically away from both tails: the extreme values stay
+    singletons, and quantiles and tail means stay accurate where VaR lives.
+    Memory is O(compression) regardless of how many values are added.
+    """
+
+    def __init__(self, compression: float = 100.0):
+        self.compression = float(compression)
+        self._means = np.empty(0)
+        self._weights = np.empty(0)
+        self._buffer: List[float] = []
+        self._buffer_weights: List[float] = []
+        self._buffer_limit = int(5 * compression)
+        self.count = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: float, weight: float = 1.0) -> None:
+        value = float(value)
+        self._buffer.append(value)
+        self._buffer_weights.append(float(weight))
+        self.count += weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= self._buffer_limit:
+            self._compress()
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """Fold `other`'s centroids into this digest (in place) and return self."""
+        other._compress()
+        self._buffer.extend(other._means.tolist())
+        self._buffer_weights.extend(other._weights.tolist())
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def _k(self, q: float, norm: float) -> float:
+        if q <= 0.0:
+            return -math.inf
+        if q >= 1.0:
+            return math.inf
+        return norm * math.log(q / (1.0 - q))
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+        means = np.concatenate([self._means, self._buffer])
+        weights = np.concatenate([self._weights, self._buffer_weights])
+        self._buffer = []
+        self._buffer_weights = []
+        order = np.argsort(means, kind="mergesort")
+        means = means[order].tolist()
+        weights = weights[order].tolist()
+        total = sum(weights)
+        norm = self.compression / (4.0 * math.log(max(total / self.compression, 1.0)) + 24.0)
+        out_m: List[float] = []
+        out_w: List[float] = []
+        cur_m = means[0]
+        cur_w = weights[0]
+        w_left = 0.0
+        k_left = self._k(0.0, norm)
+        for m, w in zip(means[1:], weights[1:]):
+            proposed = cur_w + w
+            if self._k((w_left + proposed) / total, norm) - k_left <= 1.0:
+                cur_m += (m - cur_m) * w / proposed
+                cur_w = proposed
+            else:
+                out_m.append(cur_m)
+                out_w.append(cur_w)
+                w_left += cur_w
+                k_left = self._k(w_left / total, norm)
+                cur_m = m
+                cur_w = w
+        out_m.append(cur_m)
+        out_w.append(cur_w)
+        self._means = np.asarray(out_m)
+        self._weights = np.asarray(out_w)
+
+    @property
+    def n_centroids(self) -> int:
+        self._compress()
+        return int(self._means.size)
+
+    def quantile(self, q: float) -> float:
+        self._compress()
+        if self.count == 0:
+            return math.nan
+        centers = np.cumsum(self._weights) - 0.5 * self._weights
+        x = np.concatenate([[0.0], centers, [self.count]])
+        y = np.concatenate([[self.min], self._means, [self.max]])
+        return float(np.interp(q * self.count, x, y))
+
+    def lower_tail_mean(self, q: float) -> float:
+        """Mean of the lowest fraction `q` of values."""
+        self._compress()
+        if self.count == 0:
+            return math.nan
+        target = q * self.count
+        if target <= 1.0:
+            return self.min
+        taken = 0.0
+        total = 0.0
+        for m, w in zip(self._means, self._weights):
+            use = min(w, target - taken)
+            total += m * use
+            taken += use
+            if taken >= target:
+                break
+        return float(total / taken)
+
+
+class StreamingTailRisk:
+    """Streaming historical and EWMA-parametric VaR/CVaR of per-tick returns.
+
+    Args:
+        alpha: Tail probability (0.05 = 95% VaR)
+        compression: t-digest compression (centroid budget)
+        ewma_lambda: RiskMetrics decay for the EWMA mean/variance
+    """
+
+    def __init__(self, alpha: float = 0.05, compression: float = 100.0, ewma_lambda: float = 0.94):
+        self.alpha = float(alpha)
+        self.ewma_lambda = float(ewma_lambda)
+        self.digest = TDigest(compression)
+        self.last_equity: Optional[float] = None
+        self.n_returns = 0
+        self.ewma_mean = 0.0
+        self.ewma_var = 0.0
+
+    def update(self, equity: float) -> None:
+        """Add one equity observation; the tick return feeds the estimators."""
+        equity = float(equity)
+        if self.last_equity is not None:
+            self.update_return(equity / max(self.last_equity, EPSILON) - 1.0)
+        self.last_equity = equity
+
+    def update_return(self, r: float) -> None:
+        r = float(r)
+        self.digest.update(r)
+        if self.n_returns == 0:
+            self.ewma_mean = r
+            self.ewma_var = r * r
+        else:
+            lam = self.ewma_lambda
+            self.ewma_mean = lam * self.ewma_mean + (1.0 - lam) * r
+            self.ewma_var = lam * self.ewma_var + (1.0 - lam) * r * r
+        self.n_returns += 1
+
+    def merge(self, other: "StreamingTailRisk") -> "StreamingTailRisk":
+        """Pool `other`'s returns into this tracker (in place).
+
+        The digest merge is exact up to sketch error. The EWMA states are
+        combined as a count-weighted average, i.e. treated as one pooled stream.
+        """
+        self.digest.merge(other.digest)
+        n = self.n_returns + other.n_returns
+        if n:
+            a = self.n_returns / n
+            self.ewma_mean = a * self.ewma_mean + (1.0 - a) * other.ewma_mean
+            self.ewma_var = a * self.ewma_var + (1.0 - a) * other.ewma_var
+        self.n_returns = n
+        return self
+
+    def var(self, alpha: Optional[float] = None) -> float:
+        """Historical VaR (positive loss) from the sketch."""
+        if self.n_returns == 0:
+            return 0.0
+        return -self.digest.quantile(self.alpha if alpha is None else alpha)
+
+    def cvar(self, alpha: Optional[float] = None) -> float:
+        """Historical CVaR: mean of returns in the lower `alpha` tail."""
+        if self.n_returns == 0:
+            return 0.0
+        return -self.digest.lower_tail_mean(self.alpha if alpha is None else alpha)
+
+    def ewma_volatility(self) -> float:
+        return math.sqrt(max(self.ewma_var - self.ewma_mean**2, 0.0))
+
+    def parametric_var(self, alpha: Optional[float] = None) -> float:
+        """Normal VaR from the EWMA mean/volatility."""
+        if self.n_returns < 2:
+            return 0.0
+        z = NormalDist().inv_cdf(self.alpha if alpha is None else alpha)
+        return -(self.ewma_mean + self.ewma_volatility() * z)
+
+    def parametric_cvar(self, alpha: Optional[float] = None) -> float:
+        if self.n_returns < 2:
+            return 0.0
+        a = self.alpha if alpha is None else alpha
+        z = NormalDist().inv_cdf(a)
+        return -(self.ewma_mean - self.ewma_volatility() * NormalDist().pdf(z) / a)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "alpha": self.alpha,
+            "n_returns": self.n_returns,
+            "var": self.var(),
+            "cvar": self.cvar(),
+            "ewma_var": self.parametric_var(),
+            "ewma_cvar": self.parametric_cvar(),
+            "ewma_volatility": self.ewma_volatility() if self.n_returns else 0.0,
+        }
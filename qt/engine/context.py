@@ -0,0 +1,92 @@
+from typing import Any, Dict, Optional
+
+from .order_book import OrderBook
+
+
+class StrategyContext:
+    """Per-symbol view of engine state for use inside strategy hot paths.
+
+    The context holds direct references to the engine's `order_books`,
+    `last_prices` and account positions, and caches the symbol's order book,
+    so accessors are a couple of attribute reads and at most one dict lookup.
+    `SimulationEngine.context` hands out one shared instance per symbol and
+    rebinds it whenever the engine replaces that symbol's order book.
+
+    Any engine-like object exposing `order_books` and `last_prices` works,
+    which keeps lightweight test doubles usable.
+    """
+
+    __slots__ = ("symbol", "default_price", "_books", "_last_prices", "_positions", "_book", "_fast_book")
+
+    def __init__(self, engine: Any, symbol: str, default_price: float = 100.0):
+        self.symbol = symbol
+        self.default_price = float(default_price)
+        self._books: Dict[str, Any] = engine.order_books
+        self._last_prices: Dict[str, float] = engine.last_prices
+        account = getattr(engine, "account", None)
+        self._positions: Dict[str, float] = account.positions if account is not None else {}
+        self._book: Optional[Any] = None
+        self._fast_book = False
+
+    def bind_book(self, book: Optional[Any]) -> None:
+        """Point the context at `book` (called by the engine on book replacement)."""
+        self._book = book
+        # plain OrderBook instances expose sorted level lists we can read directly;
+        # anything else is treated as an opaque object with `mid_price()`
+        self._fast_book = isinstance(book, OrderBook)
+
+    def _resolve_book(self) -> Optional[Any]:
+        book = self._book
+        if book is None:
+            book = self._books.get(self.symbol)
+            if book is not None:
+                self.bind_book(book)
+        return book
+
+    @property
+    def book(self) -> Optional[Any]:
+        return self._resolve_book()
+
+    def best_bid(self) -> float:
+        """Best resting bid price, or 0.0 if the book has no bids."""
+        book = self._resolve_book()
+        if book is None or not self._fast_book:
+            return 0.0
+        levels = book.bid_levels
+        return levels[0] if levels else 0.0
+
+    def best_ask(self) -> float:
+        """Best resting ask price, or 0.0 if the book has no asks."""
+        book = self._resolve_book()
+        if book is None or not self._fast_book:
+            return 0.0
+        levels = book.ask_levels
+        return levels[0] if levels else 0.0
+
+    def mid(self) -> float:
+        """Mid price with the same fallbacks as `OrderBook.mid_price`.
+
+        Without an order book the last traded price (or `default_price`) is used.
+        """
+        book = self._resolve_book()
+        if book is None:
+            return self._last_prices.get(self.symbol, self.default_price)
+        if not self._fast_book:
+            return book.mid_price()
+        bids = book.bid_levels
+        asks = book.ask_levels
+        if bids and asks:
+            b = bids[0]
+            a = asks[0]
+            if b > 0 and a > 0:
+                return (b + a) / 2.0
+        last = book.last_price
+        return last if last > 0 else 0.0
+
+    def last(self, default: float = 0.0) -> float:
+        """Last traded price seen by the engine for this symbol."""
+        return self._last_prices.get(self.symbol, default)
+
+    def position(self) -> float:
+        """Current account position in this symbol."""
+        return self._positions.get(self.symbol, 0.0)
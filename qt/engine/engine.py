@@ -1,7 +1,9 @@
 from typing import List, Dict, Any, Optional
+import numpy as np
 from ..engine.event import MarketEvent, FillEvent
 from .order_book import OrderBook
 from .execution import ExecutionModel
+from .context import StrategyContext
 from ..risk.accounting import Account
 from ..utils.logger import get_logger
 
@@ -18,6 +20,7 @@ class SimulationEngine:
         slippage_coeff: float = 0.0,
         half_spread_bps: float = 0.0,
         impact_coeff: float = 0.0,
+        streaming_stats: bool = False,
     ):
         self.order_books: Dict[str, OrderBook] = {}  # symbol -> OrderBook
         # configure execution model and account fees
@@ -30,16 +33,34 @@ class SimulationEngine:
         self.strategies: List[Any] = []
         self.time = 0.0
         self.last_prices: Dict[str, float] = {}
-        self.account = Account(fee=execution_fee)
+        self.account = Account(fee=execution_fee, streaming_stats=streaming_stats)
         # runtime trade log and turnover
         self.trade_log: List[Dict[str, Any]] = []
         self.turnover = 0.0
+        # symbol -> shared StrategyContext handed to strategies
+        self._contexts: Dict[str, StrategyContext] = {}
 
     def register_strategy(self, strat: Any) -> None:
         """Register a trading strategy with the engine."""
         self.strategies.append(strat)
         strat.on_init(self)
 
+    def context(self, symbol: str) -> StrategyContext:
+        """Return the (shared) strategy context for `symbol`."""
+        ctx = self._contexts.get(symbol)
+        if ctx is None:
+            ctx = StrategyContext(self, symbol)
+            self._contexts[symbol] = ctx
+        return ctx
+
+    def _set_order_book(self, symbol: str, book: OrderBook) -> OrderBook:
+        """Install `book` for `symbol` and rebind any context caching the old one."""
+        self.order_books[symbol] = book
+        ctx = self._contexts.get(symbol)
+        if ctx is not None:
+            ctx.bind_book(book)
+        return book
+
     def run_demo(
         self,
         data_source: Optional[Any] = "yahoo",
@@ -47,8 +68,16 @@ class SimulationEngine:
         end_date: Optional[str] = None,
         interval: str = "1d",
         fallback_to_synthetic: bool = True,
+        batch_by_timestamp: bool = False,
     ):
-        """Run a demo simulation using a data source or synthetic fallback."""
+        """Run a demo simulation using a data source or synthetic fallback.
+
+        By default each symbol's history is replayed in turn, one event at a
+        time. With `batch_by_timestamp=True` all symbols are merged on
+        timestamp and each timestamp is dispatched with
+        `_process_market_events`, so model strategies share one batched
+        `predict` call per timestamp.
+        """
         from ..data import get_data_source, SyntheticDataSource
 
         # Determine symbols used by strategies
@@ -67,6 +96,7 @@ class SimulationEngine:
         if ds is None:
             ds = get_data_source("yahoo")
 
+        batched: List[MarketEvent] = []
         for symbol in symbols:
             df = ds.get_prices(symbol, start_date, end_date, interval=interval)
             if (df is None or df.empty) and fallback_to_synthetic:
@@ -76,7 +106,7 @@ class SimulationEngine:
                 logger.warning(f"No data available for {symbol}, skipping.")
                 continue
 
-            self.order_books[symbol] = OrderBook()
+            self._set_order_book(symbol, OrderBook())
             last_price = df["price"].iloc[-1]
             spread = last_price * DEFAULT_SPREAD_PCT
             bid = last_price - spread / 2
@@ -92,14 +122,89 @@ class SimulationEngine:
                     size=1.0,
                     side=None,
                 )
-                self._process_market_event(ev)
+                if batch_by_timestamp:
+                    batched.append(ev)
+                else:
+                    self._process_market_event(ev)
+
+        if batch_by_timestamp:
+            # stable sort keeps per-symbol order within a timestamp; a group is
+            # also cut when a symbol repeats (coarse or missing timestamps)
+            batched.sort(key=lambda e: e.timestamp)
+            group: List[MarketEvent] = []
+            seen: set = set()
+            for ev in batched:
+                if group and (ev.timestamp != group[0].timestamp or ev.symbol in seen):
+                    self._process_market_events(group)
+                    group = []
+                    seen = set()
+                group.append(ev)
+                seen.add(ev.symbol)
+            if group:
+                self._process_market_events(group)
 
     def _process_market_event(self, ev: MarketEvent):
+        self._process_market_events([ev])
+
+    def _process_market_events(self, events: List[MarketEvent]):
+        """Process a group of market events sharing one timestamp.
+
+        Book updates and strategy dispatch happen per event, but feature rows
+        from model strategies (see `ModelStrategyBase`) are collected across
+        the whole group and scored with a single `predict` call per model.
+        Orders are then executed in (event, strategy) order and the account
+        is marked to market once.
+        """
+        if not events:
+            return
+        for ev in events:
+            self._apply_market_event(ev)
+
+        # slot per (event, strategy) so orders keep their unbatched ordering
+        slots: List[List[Any]] = []
+        pending: Dict[Any, List[Any]] = {}
+        for ev in events:
+            for s in self.strategies:
+                features_for = getattr(s, "features_for", None)
+                if features_for is None:
+                    slots.append(s.on_market_event(ev))
+                    continue
+                x = features_for(ev)
+                slots.append([])
+                if x is None:
+                    continue
+                model = getattr(s, "model", None)
+                # strategies sharing a model object are scored together
+                key = (id(model), len(x)) if model is not None else (id(s), len(x))
+                pending.setdefault(key, []).append((len(slots) - 1, ev, s, x))
+
+        for group in pending.values():
+            X = np.vstack([x for _, _, _, x in group])
+            owner = group[0][2]
+            preds = np.asarray(owner.model.predict(X) if owner.model is not None else owner.predict(X)).reshape(-1)
+            for (slot, ev, s, _), pred in zip(group, preds):
+                slots[slot] = s.on_prediction(ev, float(pred))
+
+        orders = [o for slot in slots for o in slot]
+        self._execute_orders(orders)
+
+        # after processing orders and fills, record MTM equity using last_prices
+        ts = events[-1].timestamp
+        try:
+            self.account.mark_to_market(ts, self.last_prices)
+        except Exception as e:
+            # be tolerant in demo mode but log for debugging
+            logger.debug(f"Mark-to-market failed at timestamp {ts}: {e}", exc_info=True)
+
+    def _apply_market_event(self, ev: MarketEvent):
         # record last price per symbol
         self.last_prices[ev.symbol] = ev.price
         # apply trade to order book (so market trades can hit resting orders)
         if ev.type == "TRADE":
-            self.order_books.setdefault(ev.symbol, OrderBook()).apply_trade(ev.price, ev.size)
+            book = self.order_books.get(ev.symbol)
+            if book is None:
+                book = self._set_order_book(ev.symbol, OrderBook())
+            book.apply_trade(ev.price, ev.size)
             # process market trade against resting limit orders
             fills_from_book = self.order_books[ev.symbol].process_trade(ev.price, ev.size)
             for fdict in fills_from_book:
@@ -114,73 +219,39 @@ class SimulationEngine:
                 )
                 # set symbol from trade if available
                 fill_from_book.symbol = ev.symbol
-                # account and notify
-                try:
-                    self.account.on_fill(fill_from_book)
-                except Exception as e:
-                    logger.warning(f"Failed to process fill {fill_from_book.order_id} for account: {e}", exc_info=True)
-                for s in self.strategies:
-                    try:
-                        s.on_order_filled(fill_from_book)
-                    except Exception as e:
-                        logger.warning(
-                            f"Strategy {type(s).__name__} failed to process fill {fill_from_book.order_id}: {e}", exc_info=True
-                        )
-                # record trade log and turnover
-                self.trade_log.append(
-                    {
-                        "timestamp": fill_from_book.timestamp,
-                        "order_id": fill_from_book.order_id,
-                        "symbol": fill_from_book.symbol,
-                        "side": fill_from_book.side,
-                        "price": fill_from_book.price,
-                        "quantity": fill_from_book.quantity,
-                        "fee": fill_from_book.fee,
-                    }
-                )
-                self.turnover += abs(fill_from_book.price * fill_from_book.quantity)
-
-        # give event to strategies
-        orders = []
-        for s in self.strategies:
-            orders.extend(s.on_market_event(ev))
+                self._record_fill(fill_from_book)
 
+    def _execute_orders(self, orders: List[Any]):
         # process orders (limit orders will be added to the book; market orders may fill immediately)
         for o in orders:
             # Ensure order book exists for the symbol
             if o.symbol not in self.order_books:
-                self.order_books[o.symbol] = OrderBook()
+                self._set_order_book(o.symbol, OrderBook())
             fill_order: Optional[FillEvent] = self.execution.simulate_fill(o, order_book=self.order_books.get(o.symbol))
             if fill_order:
-                # update account and inform strategies
-                try:
-                    self.account.on_fill(fill_order)
-                except Exception as e:
-                    logger.warning(f"Failed to process fill {fill_order.order_id} for account: {e}", exc_info=True)
-                for s in self.strategies:
-                    try:
-                        s.on_order_filled(fill_order)
-                    except Exception as e:
-                        logger.warning(
-                            f"Strategy {type(s).__name__} failed to process fill {fill_order.order_id}: {e}", exc_info=True
-                        )
-                # record trade log and turnover
-                self.trade_log.append(
-                    {
-                        "timestamp": fill_order.timestamp,
-                        "order_id": fill_order.order_id,
-                        "symbol": fill_order.symbol,
-                        "side": fill_order.side,
-                        "price": fill_order.price,
-                        "quantity": fill_order.quantity,
-                        "fee": fill_order.fee,
-                    }
-                )
-                self.turnover += abs(fill_order.price * float(fill_order.quantity))
+                self._record_fill(fill_order)
 
-        # after processing orders and fills, record MTM equity using last_prices
+    def _record_fill(self, fill: FillEvent):
+        # update account and inform strategies
         try:
-            self.account.mark_to_market(ev.timestamp, self.last_prices)
+            self.account.on_fill(fill)
         except Exception as e:
-            # be tolerant in demo mode but log for debugging
-            logger.debug(f"Mark-to-market failed at timestamp {ev.timestamp}: {e}", exc_info=True)
+            logger.warning(f"Failed to process fill {fill.order_id} for account: {e}", exc_info=True)
+        for s in self.strategies:
+            try:
+                s.on_order_filled(fill)
+            except Exception as e:
+                logger.warning(f"Strategy {type(s).__name__} failed to process fill {fill.order_id}: {e}", exc_info=True)
+        # record trade log and turnover
+        self.trade_log.append(
+            {
+                "timestamp": fill.timestamp,
+                "order_id": fill.order_id,
+                "symbol": fill.symbol,
+                "side": fill.side,
+                "price": fill.price,
+                "quantity": fill.quantity,
+                "fee": fill.fee,
+            }
+        )
+        self.turnover += abs(fill.price * float(fill.quantity))
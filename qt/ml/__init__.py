@@ -6,6 +6,19 @@ least-squares predictor otherwise so tests and examples work without
 installing heavy ML dependencies.
 """
 
-from .pipeline import FeatureBuilder, SimpleModelWrapper
+from .pipeline import FeatureBuilder, OnlineFeatureBuilder, SimpleModelWrapper, ridge_path
+from .feature_store import FeatureStore, feature_key
+from .registry import ModelRegistry
+from .validation import cross_validate_model, purged_splits
 
-__all__ = ["FeatureBuilder", "SimpleModelWrapper"]
+__all__ = [
+    "FeatureBuilder",
+    "OnlineFeatureBuilder",
+    "SimpleModelWrapper",
+    "ridge_path",
+    "FeatureStore",
+    "feature_key",
+    "ModelRegistry",
+    "cross_validate_model",
+    "purged_splits",
+]
@@ -0,0 +1,150 @@
+"""Content-addressed on-disk cache for FeatureBuilder outputs.
+
+Feature matrices are keyed by a hash of the input prices, the builder
+parameters and the feature code version, and stored as `.npy` files that
+are opened memory-mapped on read. Entries are written to a temporary
+directory and renamed into place, so concurrent sweep / walk-forward
+workers can share one store safely. Total size is bounded with LRU
+eviction based on each entry's last-access time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from .. import __version__
+from .pipeline import FEATURES_VERSION, FeatureBuilder
+
+
+def _default_store_dir() -> Path:
+    repo_root = Path(__file__).resolve().parents[2]
+    return repo_root / ".cache" / "qt_features"
+
+
+def price_fingerprint(prices: Iterable[float]) -> str:
+    """Hash of the raw price values (float64), independent of container type."""
+    p = np.ascontiguousarray(np.asarray(prices, dtype=np.float64))
+    h = hashlib.sha1()
+    h.update(str(p.shape).encode("utf-8"))
+    h.update(p.tobytes())
+    return h.hexdigest()
+
+
+def feature_key(prices: Iterable[float], builder: FeatureBuilder, dtype=np.float64) -> str:
+    """Cache key for `builder.build(prices, dtype=dtype)`."""
+    payload = {
+        "prices": price_fingerprint(prices),
+        "params": builder.get_params(),
+        "dtype": np.dtype(dtype).str,
+        "features_version": FEATURES_VERSION,
+        "qt_version": __version__,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class FeatureStore:
+    """LRU, size-bounded store of (X, y) feature matrices.
+
+    Args:
+        cache_dir: Root directory (defaults to `<repo>/.cache/qt_features`)
+        max_bytes: Upper bound on the total size of stored entries
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = 2 * 1024**3):
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_store_dir()
+        self.max_bytes = int(max_bytes)
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key
+
+    def __contains__(self, key: str) -> bool:
+        return (self._entry(key) / "X.npy").exists()
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return memory-mapped (X, y) for `key`, or None on a miss.
+
+        Pages are only read from disk when the arrays are accessed.
+        """
+        entry = self._entry(key)
+        try:
+            X = np.load(entry / "X.npy", mmap_mode="r")
+            y = np.load(entry / "y.npy", mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        try:
+            # mark as recently used for LRU eviction (shared across processes)
+            os.utime(entry)
+        except OSError:
+            pass
+        return X, y
+
+    def put(self, key: str, X: np.ndarray, y: np.ndarray) -> None:
+        """Store (X, y) under `key` atomically, then enforce the size bound."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_dir / f".tmp-{key}-{uuid.uuid4().hex}"
+        tmp.mkdir()
+        try:
+            np.save(tmp / "X.npy", np.asarray(X))
+            np.save(tmp / "y.npy", np.asarray(y))
+            try:
+                os.replace(tmp, self._entry(key))
+            except OSError:
+                # another process already stored the same content
+                shutil.rmtree(tmp, ignore_errors=True)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        self.evict()
+
+    def build(self, builder: FeatureBuilder, prices: Iterable[float], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """Return `builder.build(prices, dtype)`, computing and storing it on a miss."""
+        p = np.asarray(prices, dtype=float)
+        key = feature_key(p, builder, dtype=dtype)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        X, y = builder.build(p, dtype=dtype)
+        self.put(key, X, y)
+        return X, y
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        out = []
+        for entry in self.cache_dir.iterdir():
+            if entry.name.startswith(".tmp-") or not entry.is_dir():
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry.iterdir())
+                out.append((entry.stat().st_mtime, size, entry))
+            except OSError:
+                continue
+        return out
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Remove least-recently-used entries until under `max_bytes`; returns count removed."""
+        limit = self.max_bytes if max_bytes is None else int(max_bytes)
+        entries = sorted(self._entries(), key=lambda e: e[0])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= limit:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        self.evict(max_bytes=0)
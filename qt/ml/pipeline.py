@@ -6,8 +6,13 @@ scikit-learn when available (via import) or a numpy linear-regression
 fallback for predict/fit.
 """
 
-from typing import Iterable, Tuple, Optional
+from typing import Deque, Dict, Iterable, Tuple, Optional
+import collections
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..utils.numba_helpers import ewma_filter
+from ..utils.rolling import RollingStats
 
 try:
     from sklearn.base import BaseEstimator
@@ -19,6 +24,9 @@ except Exception:
     Ridge = None
     SKLEARN_AVAILABLE = False
 
+# bump whenever FeatureBuilder output changes so cached feature matrices are invalidated
+FEATURES_VERSION = 1
+
 
 class FeatureBuilder:
     """Build windowed features from price series."""
@@ -47,19 +55,44 @@ class FeatureBuilder:
         self.macd_signal = macd_signal
         self.momentum_window = momentum_window
 
+    def get_params(self) -> Dict[str, int]:
+        """Constructor parameters, e.g. for cache keys or persisted configs."""
+        return {
+            "window": self.window,
+            "ma_window": self.ma_window,
+            "vol_window": self.vol_window,
+            "rsi_window": self.rsi_window,
+            "boll_window": self.boll_window,
+            "macd_fast": self.macd_fast,
+            "macd_slow": self.macd_slow,
+            "macd_signal": self.macd_signal,
+            "momentum_window": self.momentum_window,
+        }
+
     @staticmethod
     def _ema(series: np.ndarray, span: int) -> np.ndarray:
         alpha = 2.0 / (span + 1.0)
-        out = np.zeros_like(series)
-        out[0] = series[0]
-        for i in range(1, len(series)):
-            out[i] = alpha * series[i] + (1 - alpha) * out[i - 1]
-        return out
+        return ewma_filter(np.asarray(series, dtype=np.float64), alpha)
+
+    def build(self, prices: Iterable[float], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """Build the feature matrix X and next-period return targets y.
 
-    def build(self, prices: Iterable[float]) -> Tuple[np.ndarray, np.ndarray]:
+        Row k uses prices up to index ``e = min_lookback + k`` (volatility and
+        RSI windows reach one return further) and targets ``rets[e + 1]``.
+        Rolling moments are reduced over `sliding_window_view` windows, which
+        keeps results bit-identical to reducing each window slice separately.
+
+        Args:
+            prices: 1D price series
+            dtype: Output dtype for X and y (e.g. np.float32 to halve memory);
+                computation is always carried out in float64
+
+        Returns:
+            Tuple (X, y)
+        """
         p = np.asarray(prices, dtype=float)
         if p.size < max(self.window + 2, self.macd_slow + 2, self.boll_window + 2):
-            return np.empty((0, 0)), np.empty((0,))
+            return np.empty((0, 0), dtype=dtype), np.empty((0,), dtype=dtype)
 
         rets = p[1:] / p[:-1] - 1.0
         n = len(rets)
@@ -72,80 +105,350 @@ class FeatureBuilder:
             self.macd_slow,
             self.momentum_window,
         )
+        # rows are the price indices e in [min_lookback, n - 2]
+        first = min_lookback
+        m = n - 1 - first
+        if m <= 0:
+            return np.asarray([], dtype=dtype), np.asarray([], dtype=dtype)
+        rows = slice(first, first + m)
+
+        def windows(arr: np.ndarray, width: int, end_offset: int) -> np.ndarray:
+            # windows ending at arr[e + end_offset] for each row e
+            start = first + end_offset + 1 - width
+            return sliding_window_view(arr, width)[start : start + m]
 
         ema_fast = self._ema(p, self.macd_fast)
         ema_slow = self._ema(p, self.macd_slow)
         macd = ema_fast - ema_slow
         macd_signal = self._ema(macd, self.macd_signal)
 
-        X_rows = []
-        y_vals = []
-        for i in range(min_lookback - 1, n - 2):
-            end_idx = i + 1  # aligns with price index
-            ret_window = rets[end_idx - self.window : end_idx]
-            if ret_window.shape[0] != self.window:
-                continue
-
-            ma_slice = p[end_idx + 1 - self.ma_window : end_idx + 1]
-            vol_slice = rets[end_idx + 1 - self.vol_window : end_idx + 1]
-            boll_slice = p[end_idx + 1 - self.boll_window : end_idx + 1]
-
-            ma = ma_slice.mean()
-            vol = np.std(vol_slice, ddof=1)
-            momentum = p[end_idx] / p[end_idx - self.momentum_window] - 1.0
-
-            gains = np.clip(rets[end_idx + 1 - self.rsi_window : end_idx + 1], 0, None)
-            losses = -np.clip(rets[end_idx + 1 - self.rsi_window : end_idx + 1], None, 0)
-            avg_gain = gains.mean()
-            avg_loss = losses.mean()
-            rs = avg_gain / max(avg_loss, 1e-12)
-            rsi = 100.0 - 100.0 / (1.0 + rs)
-
-            boll_mean = boll_slice.mean()
-            boll_std = np.std(boll_slice, ddof=1)
-            boll_z = (p[end_idx] - boll_mean) / max(boll_std, 1e-12)
-
-            feature_row = np.hstack(
-                [
-                    ret_window,
-                    np.array(
-                        [
-                            ma,
-                            vol,
-                            momentum,
-                            rsi,
-                            macd[end_idx],
-                            macd_signal[end_idx],
-                            boll_z,
-                        ],
-                        dtype=float,
-                    ),
-                ]
-            )
-            X_rows.append(feature_row)
-            y_vals.append(rets[end_idx + 1])
-
-        X = np.asarray(X_rows, dtype=float)
-        y = np.asarray(y_vals, dtype=float)
+        ma = windows(p, self.ma_window, 0).mean(axis=1)
+        vol = np.std(windows(rets, self.vol_window, 0), axis=1, ddof=1)
+        momentum = p[rows] / p[first - self.momentum_window : first - self.momentum_window + m] - 1.0
+
+        gains = np.clip(rets, 0, None)
+        losses = -np.clip(rets, None, 0)
+        avg_gain = windows(gains, self.rsi_window, 0).mean(axis=1)
+        avg_loss = windows(losses, self.rsi_window, 0).mean(axis=1)
+        rs = avg_gain / np.maximum(avg_loss, 1e-12)
+        rsi = 100.0 - 100.0 / (1.0 + rs)
+
+        boll = windows(p, self.boll_window, 0)
+        boll_mean = boll.mean(axis=1)
+        boll_std = np.std(boll, axis=1, ddof=1)
+        boll_z = (p[rows] - boll_mean) / np.maximum(boll_std, 1e-12)
+
+        w = self.window
+        X = np.empty((m, w + 7), dtype=dtype)
+        # returns block ends at rets[e - 1]
+        X[:, :w] = windows(rets, w, -1)
+        X[:, w] = ma
+        X[:, w + 1] = vol
+        X[:, w + 2] = momentum
+        X[:, w + 3] = rsi
+        X[:, w + 4] = macd[rows]
+        X[:, w + 5] = macd_signal[rows]
+        X[:, w + 6] = boll_z
+        y = rets[first + 1 : first + 1 + m].astype(dtype, copy=False)
         return X, y
 
 
+class OnlineFeatureBuilder:
+    """Streaming counterpart of `FeatureBuilder.build`.
+
+    Each `update(price)` costs O(1) (plus an O(window) memmove for the returns
+    block) and yields the same feature vector that `build()` over the full
+    price history would produce for its last row. Like `build()`, that row is
+    aligned so its target is the latest return: the returns block ends two
+    prices back while volatility/RSI windows end one price back.
+
+    The returned array is reused between calls; copy it if it must be kept.
+    """
+
+    def __init__(self, builder: Optional[FeatureBuilder] = None, **params):
+        fb = builder if builder is not None else FeatureBuilder(**params)
+        self.builder = fb
+        self.window = fb.window
+        self.n_features = fb.window + 7
+        self._min_prices = (
+            max(fb.window, fb.ma_window, fb.vol_window, fb.rsi_window, fb.boll_window, fb.macd_slow, fb.momentum_window) + 3
+        )
+        self._a_fast = 2.0 / (fb.macd_fast + 1.0)
+        self._a_slow = 2.0 / (fb.macd_slow + 1.0)
+        self._a_signal = 2.0 / (fb.macd_signal + 1.0)
+        self._ma = RollingStats(fb.ma_window)
+        self._boll = RollingStats(fb.boll_window)
+        self._vol = RollingStats(fb.vol_window)
+        self._gains = RollingStats(fb.rsi_window)
+        self._losses = RollingStats(fb.rsi_window)
+        self._momentum: Deque[float] = collections.deque(maxlen=fb.momentum_window + 1)
+        self._row = np.zeros(self.n_features, dtype=float)
+        self.reset()
+
+    def reset(self) -> None:
+        for stats in (self._ma, self._boll, self._vol, self._gains, self._losses):
+            stats.reset()
+        self._momentum.clear()
+        self._row[:] = 0.0
+        self._n_prices = 0
+        # the two most recent prices; the feature row index e lags them by one
+        self._lag1 = 0.0
+        self._lag2 = 0.0
+        # p[e - 1] and p[e]
+        self._p_prev = 0.0
+        self._p_cur = 0.0
+        self._ema_fast = 0.0
+        self._ema_slow = 0.0
+        self._signal = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self._n_prices >= self._min_prices
+
+    def update(self, price: float) -> Optional[np.ndarray]:
+        """Consume one price; return the current feature row once warmed up."""
+        price = float(price)
+        self._n_prices += 1
+        if self._n_prices >= 3:
+            # row index e = n_prices - 3: p[e] = lag2, p[e + 1] = lag1
+            self._advance(self._lag2, self._lag1)
+        self._lag2 = self._lag1
+        self._lag1 = price
+        return self._finish_row() if self.ready else None
+
+    def _advance(self, p_e: float, p_next: float) -> None:
+        first = self._n_prices == 3
+        self._p_prev = self._p_cur
+        self._p_cur = p_e
+        window = self.window
+
+        if not first:
+            # returns block ends at p[e]: rets[e - 1]
+            row = self._row
+            row[: window - 1] = row[1:window]
+            row[window - 1] = p_e / self._p_prev - 1.0
+        # volatility / RSI windows end at rets[e] = p[e + 1] / p[e] - 1
+        r = p_next / p_e - 1.0
+        self._vol.push(r)
+        self._gains.push(r if r > 0.0 else 0.0)
+        self._losses.push(-r if r < 0.0 else 0.0)
+
+        self._ma.push(p_e)
+        self._boll.push(p_e)
+        self._momentum.append(p_e)
+
+        if first:
+            self._ema_fast = p_e
+            self._ema_slow = p_e
+            self._signal = 0.0
+        else:
+            self._ema_fast = self._a_fast * p_e + (1 - self._a_fast) * self._ema_fast
+            self._ema_slow = self._a_slow * p_e + (1 - self._a_slow) * self._ema_slow
+            macd = self._ema_fast - self._ema_slow
+            self._signal = self._a_signal * macd + (1 - self._a_signal) * self._signal
+
+    def _finish_row(self) -> np.ndarray:
+        row = self._row
+        w = self.window
+        p_e = self._p_cur
+        rs = self._gains.mean / max(self._losses.mean, 1e-12)
+        row[w] = self._ma.mean
+        row[w + 1] = self._vol.std(ddof=1)
+        row[w + 2] = p_e / self._momentum[0] - 1.0
+        row[w + 3] = 100.0 - 100.0 / (1.0 + rs)
+        row[w + 4] = self._ema_fast - self._ema_slow
+        row[w + 5] = self._signal
+        row[w + 6] = (p_e - self._boll.mean) / max(self._boll.std(ddof=1), 1e-12)
+        return row
+
+
+def ridge_path(
+    X: np.ndarray,
+    y: np.ndarray,
+    alphas: Optional[Iterable[float]] = None,
+    fit_intercept: bool = False,
+    criterion: str = "loo",
+) -> Dict[str, np.ndarray]:
+    """Ridge solutions and leave-one-out / GCV error for a grid of alphas.
+
+    Uses a single thin SVD ``X = U S V'`` and evaluates every alpha in closed
+    form: coefficients are ``V diag(s / (s^2 + alpha)) U'y`` and the hat
+    matrix diagonal is ``sum_j U_ij^2 s_j^2 / (s_j^2 + alpha)``, so the exact
+    LOO residuals ``e_i / (1 - h_ii)`` and the GCV score come from broadcasting
+    over the alpha grid instead of refitting per alpha. With `fit_intercept`
+    the columns are centred and the (unpenalised) intercept is recovered
+    afterwards, matching sklearn's Ridge.
+
+    Returns a dict with `alphas`, `coefs` (n_alphas x n_features),
+    `intercepts`, `loo` and `gcv` (mean squared error per alpha), and
+    `best_alpha` / `best_index` / `best_coef` / `best_intercept` selected by
+    `criterion` ("loo" or "gcv").
+    """
+    if criterion not in ("loo", "gcv"):
+        raise ValueError("criterion must be 'loo' or 'gcv'")
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float).ravel()
+    if X.ndim != 2 or X.shape[0] != y.shape[0] or X.shape[0] < 2:
+        raise ValueError("X must be 2D with at least two rows matching y")
+    grid = np.logspace(-4, 4, 50) if alphas is None else np.asarray(list(alphas), dtype=float).ravel()
+    if grid.size == 0 or np.any(grid < 0):
+        raise ValueError("alphas must be a non-empty sequence of non-negative values")
+
+    n = X.shape[0]
+    if fit_intercept:
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean()
+        Xc = X - x_mean
+        yc = y - y_mean
+    else:
+        x_mean = np.zeros(X.shape[1])
+        y_mean = 0.0
+        Xc = X
+        yc = y
+
+    U, s, Vt = np.linalg.svd(Xc, full_matrices=False)
+    # drop numerically-zero singular values (rank-deficient designs)
+    keep = s > s[0] * max(Xc.shape) * np.finfo(float).eps if s.size else s > 0
+    U, s, Vt = U[:, keep], s[keep], Vt[keep]
+    Uty = U.T @ yc
+
+    s2 = s * s
+    denom = s2[None, :] + grid[:, None]  # (n_alphas, k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        shrink = np.where(denom > 0, s2[None, :] / denom, 0.0)
+        filt = np.where(denom > 0, s[None, :] / denom, 0.0)
+    coefs = (filt * Uty[None, :]) @ Vt
+    intercepts = y_mean - coefs @ x_mean
+
+    fitted = (shrink * Uty[None, :]) @ U.T  # (n_alphas, n), centred scale
+    resid = yc[None, :] - fitted
+    h = shrink @ (U * U).T  # hat-matrix diagonal per alpha, (n_alphas, n)
+    if fit_intercept:
+        h = h + 1.0 / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        loo = np.mean((resid / (1.0 - h)) ** 2, axis=1)
+        gcv = np.mean(resid**2, axis=1) / (1.0 - h.sum(axis=1) / n) ** 2
+    loo = np.where(np.isfinite(loo), loo, np.inf)
+    gcv = np.where(np.isfinite(gcv), gcv, np.inf)
+
+    score = loo if criterion == "loo" else gcv
+    best = int(np.argmin(score))
+    return {
+        "alphas": grid,
+        "coefs": coefs,
+        "intercepts": intercepts,
+        "loo": loo,
+        "gcv": gcv,
+        "best_index": best,
+        "best_alpha": float(grid[best]),
+        "best_coef": coefs[best],
+        "best_intercept": float(intercepts[best]),
+    }
+
+
 class SimpleModelWrapper:
     """Wrapper that provides fit/predict around sklearn Ridge or numpy fallback.
 
     fit(X, y) stores model, predict(X) returns predictions.
+
+    partial_fit(X, y) switches to an online recursive-least-squares mode that
+    updates the ridge solution in O(d^2) per observation (Sherman-Morrison on
+    the inverse of X'X + alpha*I). After fit(X, y) the online state is seeded
+    from the batch, so partial_fit continues the fitted model: with the default
+    settings it matches a refit on all rows seen so far, including the
+    unpenalised intercept when the sklearn backend fits one. Started cold,
+    online mode fits no intercept and reproduces the closed-form fallback.
+    With `window`, only the last `window` batch rows are seeded. Optional knobs:
+
+    - forgetting: exponential weight (< 1.0 discounts older rows, and the prior)
+    - window: keep only the last `window` rows by downdating the oldest one
+    - refit_every: re-solve from the running X'X / X'y every N updates to
+      remove round-off drift in the recursive inverse
     """
 
-    def __init__(self, alpha: float = 1.0):
+    def __init__(
+        self,
+        alpha: float = 1.0,
+        forgetting: float = 1.0,
+        window: Optional[int] = None,
+        refit_every: Optional[int] = None,
+    ):
+        if not 0.0 < forgetting <= 1.0:
+            raise ValueError("forgetting must be in (0, 1]")
+        if window is not None and window < 1:
+            raise ValueError("window must be >= 1")
         self.alpha = alpha
+        self.forgetting = forgetting
+        self.window = window
+        self.refit_every = refit_every
         self.model: Optional[BaseEstimator] = None
         self.coef_: Optional[np.ndarray] = None
+        self.intercept_ = 0.0
         if SKLEARN_AVAILABLE and Ridge is not None:
             self.model = Ridge(alpha=self.alpha)
+        self._reset_online()
+
+    def _reset_online(self) -> None:
+        self._online = False
+        self._A: Optional[np.ndarray] = None  # (weighted) X'X + alpha*I
+        self._b: Optional[np.ndarray] = None  # (weighted) X'y
+        self._P: Optional[np.ndarray] = None  # inverse of _A
+        self._theta: Optional[np.ndarray] = None  # online solution (coef, then intercept if fitted)
+        self._with_intercept = False
+        # buffered (row, target, update index when added); seeded rows use -1
+        self._rows: Deque[Tuple[np.ndarray, float, int]] = collections.deque()
+        self.n_updates_ = 0
+
+    def _augment(self, X: np.ndarray) -> np.ndarray:
+        # online rows carry a trailing 1.0 when the intercept is part of the solution
+        if not self._with_intercept:
+            return X
+        return np.concatenate([X, np.ones(X.shape[:-1] + (1,))], axis=-1)
+
+    def _penalty(self, d: int) -> np.ndarray:
+        pen = np.full(d, float(self.alpha))
+        if self._with_intercept:
+            pen[-1] = 0.0  # the intercept is not shrunk, as in sklearn Ridge
+        return np.diag(pen)
+
+    def _sync_coef(self) -> None:
+        if self._with_intercept:
+            self.coef_ = self._theta[:-1].copy()
+            self.intercept_ = float(self._theta[-1])
+        else:
+            self.coef_ = self._theta.copy()
+            self.intercept_ = 0.0
+
+    def _seed_online(self, X: np.ndarray, y: np.ndarray, with_intercept: bool) -> None:
+        """Initialise the online state from a batch so partial_fit continues it."""
+        self._reset_online()
+        if self.alpha <= 0 or X.ndim != 2 or X.shape[0] == 0:
+            return
+        if self.window is not None:
+            X, y = X[-self.window :], y[-self.window :]
+        self._with_intercept = with_intercept
+        Xa = self._augment(X)
+        A = Xa.T @ Xa + self._penalty(Xa.shape[1])
+        try:
+            P = np.linalg.inv(A)
+        except np.linalg.LinAlgError:
+            self._reset_online()
+            return
+        self._A = A
+        self._b = Xa.T @ y
+        self._P = 0.5 * (P + P.T)
+        self._theta = np.linalg.solve(A, self._b)
+        if self.window is not None:
+            self._rows.extend((x.copy(), float(t), -1) for x, t in zip(Xa, y))
 
     def fit(self, X: np.ndarray, y: np.ndarray):
         X = np.asarray(X, dtype=float)
         y = np.asarray(y, dtype=float)
+        self._reset_online()
+        self.intercept_ = 0.0
+        if self.model is None and SKLEARN_AVAILABLE and Ridge is not None:
+            # detached by from_coefficients; refitting goes back to sklearn
+            self.model = Ridge(alpha=self.alpha)
         if X.size == 0:
             self.coef_ = np.zeros((X.shape[1],)) if X.ndim == 2 else np.array([])
             return self
@@ -153,6 +456,7 @@ class SimpleModelWrapper:
             self.model.fit(X, y)
             try:
                 self.coef_ = np.asarray(self.model.coef_)
+                self.intercept_ = float(self.model.intercept_)
             except Exception:
                 self.coef_ = None
         else:
@@ -162,14 +466,113 @@ class SimpleModelWrapper:
             A = X.T @ X + self.alpha * I
             b = X.T @ y
             self.coef_ = np.linalg.solve(A, b)
+        self._seed_online(X, y, with_intercept=self.model is not None)
+        return self
+
+    def tune_alpha(self, X: np.ndarray, y: np.ndarray, alphas: Optional[Iterable[float]] = None, criterion: str = "loo"):
+        """Pick `alpha` from a grid with `ridge_path`, then refit with it.
+
+        The intercept handling follows the active backend (sklearn Ridge fits
+        one, the numpy fallback does not). Returns the path dict.
+        """
+        path = ridge_path(X, y, alphas=alphas, fit_intercept=self.model is not None, criterion=criterion)
+        self.alpha = path["best_alpha"]
+        if self.model is not None:
+            self.model.set_params(alpha=self.alpha)
+        self.fit(X, y)
+        return path
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray):
+        """Update the online ridge solution with one row or a batch of rows."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        if X.shape[0] != y.shape[0]:
+            raise ValueError("X and y must have the same number of rows")
+        if self._A is None or self._A.shape[0] != X.shape[1] + int(self._with_intercept):
+            # cold start (no batch fit to continue): ridge prior only, no intercept
+            if self.alpha <= 0:
+                raise ValueError("online mode requires alpha > 0")
+            d = X.shape[1]
+            self._reset_online()
+            self._A = self.alpha * np.eye(d)
+            self._b = np.zeros(d)
+            self._P = np.eye(d) / self.alpha
+            self._theta = np.zeros(d)
+        self._online = True
+        for x, t in zip(self._augment(X), y):
+            self._rls_update(x, float(t))
+        self._sync_coef()
+        return self
+
+    def _rls_update(self, x: np.ndarray, t: float) -> None:
+        lam = self.forgetting
+        if self.window is not None:
+            if len(self._rows) == self.window:
+                x_old, t_old, added = self._rows.popleft()
+                # the row has been discounted once by every update since it was added
+                self._downdate(x_old, t_old, lam ** (self.n_updates_ - added - 1))
+            self._rows.append((x.copy(), t, self.n_updates_))
+        if lam != 1.0:
+            self._A *= lam
+            self._b *= lam
+            self._P /= lam
+        P = self._P
+        Px = P @ x
+        denom = 1.0 + x @ Px
+        P -= np.outer(Px, Px) / denom
+        self._A += np.outer(x, x)
+        self._b += x * t
+        self._theta += (Px / denom) * (t - x @ self._theta)
+        self.n_updates_ += 1
+        if self.refit_every and self.n_updates_ % self.refit_every == 0:
+            self.refit()
+
+    def _downdate(self, x: np.ndarray, t: float, weight: float) -> None:
+        # remove a row currently carrying `weight` from the solution
+        self._A -= weight * np.outer(x, x)
+        self._b -= weight * x * t
+        Px = self._P @ x
+        denom = 1.0 - weight * (x @ Px)
+        if denom <= 1e-12:
+            self.refit()
+            return
+        self._P += weight * np.outer(Px, Px) / denom
+        self._theta += (weight * Px / denom) * (x @ self._theta - t)
+
+    def refit(self):
+        """Re-solve the online model exactly from its running X'X and X'y."""
+        if self._A is None:
+            raise RuntimeError("Model has no online state; call partial_fit first")
+        P = np.linalg.inv(self._A)
+        self._P = 0.5 * (P + P.T)
+        self._theta = np.linalg.solve(self._A, self._b)
+        self._sync_coef()
         return self
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         X = np.asarray(X, dtype=float)
         if X.size == 0:
             return np.empty((0,))
-        if self.model is not None:
+        if self.model is not None and not self._online:
             return self.model.predict(X)
         if self.coef_ is None:
             raise RuntimeError("Model is not fitted")
-        return X @ self.coef_
+        return X @ self.coef_ + self.intercept_
+
+    @classmethod
+    def from_coefficients(cls, coef: np.ndarray, intercept: float = 0.0, alpha: float = 1.0) -> "SimpleModelWrapper":
+        """Build a predict-ready linear model from stored coefficients.
+
+        No estimator object is created, so this is cheap enough to call per
+        request (used by `ModelRegistry`); `coef` may be a read-only memmap.
+        """
+        m = cls.__new__(cls)
+        m.alpha = alpha
+        m.forgetting = 1.0
+        m.window = None
+        m.refit_every = None
+        m.model = None
+        m.coef_ = coef
+        m.intercept_ = float(intercept)
+        m._reset_online()
+        return m
@@ -0,0 +1,191 @@
+"""Versioned on-disk registry for linear models and their feature configs.
+
+Each model version is a directory ``<root>/<name>/v000001`` holding the
+coefficient vector as ``coef.npy`` and a ``meta.json`` with the intercept,
+alpha and the `FeatureBuilder` parameters used to train it. Version numbers
+are allocated with an atomic ``mkdir`` and ``meta.json`` is written last
+(via rename), so concurrent writers never collide and readers never see a
+half-written version. Loads open ``coef.npy`` memory-mapped and cache it in a
+per-process LRU; every `load` returns a fresh model wrapper around the shared
+read-only coefficients, so refitting one copy never changes another.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .. import __version__
+from .pipeline import FEATURES_VERSION, FeatureBuilder, SimpleModelWrapper
+
+_VERSION_RE = re.compile(r"^v(\d+)$")
+
+# cached load: (memory-mapped coefficients, meta.json contents)
+_CacheEntry = Tuple[np.ndarray, Dict[str, Any]]
+
+
+def _default_registry_dir() -> Path:
+    repo_root = Path(__file__).resolve().parents[2]
+    return repo_root / ".cache" / "qt_models"
+
+
+class ModelRegistry:
+    """Store and load `SimpleModelWrapper` coefficients by name and version.
+
+    Args:
+        root: Registry directory (defaults to `<repo>/.cache/qt_models`)
+        cache_size: Number of loaded models kept in the in-process LRU
+    """
+
+    def __init__(self, root: Optional[str] = None, cache_size: int = 16):
+        self.root = Path(root) if root else _default_registry_dir()
+        self.cache_size = int(cache_size)
+        self._cache: "collections.OrderedDict[Tuple[str, int], _CacheEntry]" = collections.OrderedDict()
+        # name -> (model directory mtime, latest complete version) for unversioned loads
+        self._latest: Dict[str, Tuple[int, Optional[int]]] = {}
+
+    def _model_dir(self, name: str) -> Path:
+        if not name or "/" in name or name.startswith("."):
+            raise ValueError(f"invalid model name: {name!r}")
+        return self.root / name
+
+    def versions(self, name: str) -> List[int]:
+        """Sorted list of complete versions stored under `name`."""
+        d = self._model_dir(name)
+        if not d.exists():
+            return []
+        out = []
+        for entry in d.iterdir():
+            m = _VERSION_RE.match(entry.name)
+            if m and (entry / "meta.json").exists():
+                out.append(int(m.group(1)))
+        return sorted(out)
+
+    def latest(self, name: str) -> Optional[int]:
+        vs = self.versions(name)
+        return vs[-1] if vs else None
+
+    def _cached_latest(self, name: str) -> Optional[int]:
+        # rescan only when the model directory changed (a version was allocated)
+        d = self._model_dir(name)
+        try:
+            mtime = d.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        hit = self._latest.get(name)
+        if hit is not None and hit[0] == mtime:
+            return hit[1]
+        allocated = sum(1 for e in d.iterdir() if _VERSION_RE.match(e.name))
+        vs = self.versions(name)
+        latest = vs[-1] if vs else None
+        if len(vs) == allocated:
+            # a version still being written would not bump the mtime when it completes
+            self._latest[name] = (mtime, latest)
+        return latest
+
+    def _resolve(self, name: str, version: Optional[int]) -> int:
+        if version is None:
+            version = self._cached_latest(name)
+            if version is None:
+                raise KeyError(f"no versions stored for model {name!r}")
+        return int(version)
+
+    def _allocate(self, name: str) -> Tuple[int, Path]:
+        d = self._model_dir(name)
+        d.mkdir(parents=True, exist_ok=True)
+        taken = [int(m.group(1)) for m in (_VERSION_RE.match(e.name) for e in d.iterdir()) if m]
+        version = max(taken, default=0) + 1
+        while True:
+            path = d / f"v{version:06d}"
+            try:
+                path.mkdir()
+                return version, path
+            except FileExistsError:
+                version += 1
+
+    def save(
+        self,
+        name: str,
+        model: SimpleModelWrapper,
+        builder: Optional[FeatureBuilder] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Persist a fitted model (and its feature config); returns the new version."""
+        if model.coef_ is None:
+            raise RuntimeError("Model is not fitted")
+        coef = np.ascontiguousarray(np.asarray(model.coef_, dtype=np.float64))
+        version, path = self._allocate(name)
+        np.save(path / "coef.npy", coef)
+        meta = {
+            "name": name,
+            "version": version,
+            "alpha": float(model.alpha),
+            "intercept": float(getattr(model, "intercept_", 0.0)),
+            "n_features": int(coef.shape[0]),
+            "feature_params": builder.get_params() if builder is not None else None,
+            "features_version": FEATURES_VERSION,
+            "qt_version": __version__,
+            "created": time.time(),
+            "metadata": metadata or {},
+        }
+        tmp = path / ".meta.json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2, default=str)
+        os.replace(tmp, path / "meta.json")
+        self._latest.pop(name, None)
+        return version
+
+    def load(self, name: str, version: Optional[int] = None) -> Tuple[SimpleModelWrapper, Optional[FeatureBuilder]]:
+        """Return (model, feature_builder) for `name` at `version` (default: latest).
+
+        The model is a new wrapper on each call (sharing the cached,
+        read-only coefficients), so callers may fit or partial_fit it freely.
+        """
+        version = self._resolve(name, version)
+        key = (name, version)
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            coef, meta = hit
+        else:
+            coef, meta = self._read(name, version)
+            self._cache[key] = (coef, meta)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        model = SimpleModelWrapper.from_coefficients(coef, intercept=meta["intercept"], alpha=meta["alpha"])
+        params = meta.get("feature_params")
+        builder = FeatureBuilder(**params) if params else None
+        return model, builder
+
+    def _read(self, name: str, version: int) -> _CacheEntry:
+        path = self._model_dir(name) / f"v{int(version):06d}"
+        try:
+            with open(path / "meta.json") as f:
+                meta = json.load(f)
+            coef = np.load(path / "coef.npy", mmap_mode="r")
+        except FileNotFoundError:
+            raise KeyError(f"model {name!r} has no version {version}") from None
+        if meta.get("features_version") != FEATURES_VERSION:
+            raise ValueError(
+                f"model {name!r} v{version} was trained with features_version "
+                f"{meta.get('features_version')}, current is {FEATURES_VERSION}"
+            )
+        return coef, meta
+
+    def metadata(self, name: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """Return the stored meta.json for a version (default: latest)."""
+        version = self._resolve(name, version)
+        path = self._model_dir(name) / f"v{version:06d}" / "meta.json"
+        with open(path) as f:
+            return json.load(f)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+        self._latest.clear()
@@ -0,0 +1,131 @@
+"""Purged, embargoed time-series cross-validation for the ML pipeline.
+
+Rows produced by `FeatureBuilder.build` overlap in time: the label of row i
+is the next-step return, and features look back over several rows. Plain
+k-fold CV therefore leaks information across the train/test boundary.
+`purged_splits` drops `purge` training rows immediately before each test
+block and `embargo` rows immediately after it; `cross_validate_model` fits
+one model per fold (optionally in a process pool) and collects metrics and
+out-of-sample predictions as flat arrays.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..utils.parallel import parallel_map
+from .pipeline import SimpleModelWrapper
+
+
+def purged_splits(
+    n_samples: int,
+    n_splits: int = 5,
+    purge: int = 1,
+    embargo: int = 0,
+    walk_forward: bool = True,
+    max_train: Optional[int] = None,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield (train_idx, test_idx) pairs over `n_samples` time-ordered rows.
+
+    Args:
+        n_samples: Number of rows
+        n_splits: Number of test folds
+        purge: Training rows removed just before each test block
+        embargo: Training rows removed just after each test block
+            (only relevant when `walk_forward` is False)
+        walk_forward: If True, fold k trains only on data before its test
+            block (blocks 1..n_splits of n_splits + 1 contiguous blocks);
+            otherwise blocked k-fold using data on both sides of the test block
+        max_train: Optional cap on training rows (rolling instead of expanding window)
+    """
+    if n_splits < 1:
+        raise ValueError("n_splits must be >= 1")
+    if purge < 0 or embargo < 0:
+        raise ValueError("purge and embargo must be >= 0")
+    n_blocks = n_splits + 1 if walk_forward else n_splits
+    if n_samples < n_blocks:
+        raise ValueError("not enough samples for the requested number of splits")
+    bounds = np.linspace(0, n_samples, n_blocks + 1).astype(int)
+    idx = np.arange(n_samples)
+    first = 1 if walk_forward else 0
+    for k in range(first, n_blocks):
+        start, stop = bounds[k], bounds[k + 1]
+        test = idx[start:stop]
+        before = idx[: max(start - purge, 0)]
+        if walk_forward:
+            train = before
+        else:
+            after = idx[min(stop + embargo, n_samples) :]
+            train = np.concatenate([before, after])
+        if max_train is not None and len(train) > max_train:
+            train = train[-max_train:] if walk_forward else train[:max_train]
+        if len(train) == 0:
+            continue
+        yield train, test
+
+
+def _fold_metrics(pred: np.ndarray, y: np.ndarray) -> Tuple[float, float, float]:
+    err = pred - y
+    mse = float(np.mean(err * err))
+    hit_rate = float(np.mean(np.sign(pred) == np.sign(y)))
+    if len(y) > 1 and np.std(pred) > 0 and np.std(y) > 0:
+        ic = float(np.corrcoef(pred, y)[0, 1])
+    else:
+        ic = float("nan")
+    return mse, hit_rate, ic
+
+
+def _run_fold(split, X, y, model_factory):
+    train, test = split
+    model = model_factory()
+    model.fit(X[train], y[train])
+    pred = np.asarray(model.predict(X[test]), dtype=float)
+    return pred, _fold_metrics(pred, np.asarray(y[test], dtype=float))
+
+
+def cross_validate_model(
+    X: np.ndarray,
+    y: np.ndarray,
+    model_factory: Optional[Callable[[], object]] = None,
+    n_splits: int = 5,
+    purge: int = 1,
+    embargo: int = 0,
+    walk_forward: bool = True,
+    max_train: Optional[int] = None,
+    n_jobs: int = 1,
+) -> Dict[str, np.ndarray]:
+    """Purged walk-forward CV of `model_factory()` models on (X, y).
+
+    Folds are fanned out with `parallel_map`; X and y are shared with the
+    workers as memmaps rather than pickled per fold.
+
+    Returns a dict of columnar arrays: per fold `fold`, `n_train`, `n_test`,
+    `mse`, `hit_rate`, `ic`; and per out-of-sample row `oos_index`,
+    `oos_fold`, `oos_pred`, `oos_true`.
+    """
+    X = np.asarray(X)
+    y = np.asarray(y)
+    if X.shape[0] != y.shape[0]:
+        raise ValueError("X and y must have the same number of rows")
+    if model_factory is None:
+        model_factory = SimpleModelWrapper
+    splits: List[Tuple[np.ndarray, np.ndarray]] = list(
+        purged_splits(len(y), n_splits=n_splits, purge=purge, embargo=embargo, walk_forward=walk_forward, max_train=max_train)
+    )
+    results = parallel_map(_run_fold, splits, args=(X, y, model_factory), n_jobs=n_jobs)
+
+    n_folds = len(splits)
+    metrics = np.array([m for _, m in results], dtype=float).reshape(n_folds, 3)
+    test_sizes = np.array([len(test) for _, test in splits], dtype=int)
+    return {
+        "fold": np.arange(n_folds),
+        "n_train": np.array([len(train) for train, _ in splits], dtype=int),
+        "n_test": test_sizes,
+        "mse": metrics[:, 0],
+        "hit_rate": metrics[:, 1],
+        "ic": metrics[:, 2],
+        "oos_index": np.concatenate([test for _, test in splits]) if n_folds else np.array([], dtype=int),
+        "oos_fold": np.repeat(np.arange(n_folds), test_sizes),
+        "oos_pred": np.concatenate([pred for pred, _ in results]) if n_folds else np.array([]),
+        "oos_true": y[np.concatenate([test for _, test in splits])] if n_folds else np.array([]),
+    }
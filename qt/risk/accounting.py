@@ -1,10 +1,17 @@
 from typing import Dict, List, Tuple, Optional, Any
 
+from ..analytics.streaming import StreamingMetrics, StreamingTailRisk
+
 
 class Account:
-    """Very small accounting module: track positions, cash, and mark-to-market equity history."""
+    """Very small accounting module: track positions, cash, and mark-to-market equity history.
+
+    With `streaming_stats`, running performance metrics and streaming tail
+    risk are also updated on every mark-to-market; they are off by default to
+    keep the per-event path cheap.
+    """
 
-    def __init__(self, initial_cash: float = 100000.0, fee: float = 0.0):
+    def __init__(self, initial_cash: float = 100000.0, fee: float = 0.0, streaming_stats: bool = False):
         self.cash = float(initial_cash)
         self.fee = float(fee)
         self.positions: Dict[str, float] = {}
@@ -12,6 +19,10 @@ class Account:
         self.equity_history: List[Tuple[float, float]] = []
         # exposure history as list of (timestamp, gross, net)
         self.exposure_history: List[Tuple[float, float, float]] = []
+        # running performance metrics, updated on every mark-to-market, opt-in
+        self.metrics: Optional[StreamingMetrics] = StreamingMetrics() if streaming_stats else None
+        # streaming VaR/CVaR of per-tick returns (t-digest + EWMA), opt-in
+        self.tail_risk: Optional[StreamingTailRisk] = StreamingTailRisk() if streaming_stats else None
 
     def on_fill(self, fill):
         """Process a fill event and update account positions and cash.
@@ -69,6 +80,10 @@ class Account:
                 net += notional
         self.equity_history.append((float(timestamp), equity))
         self.exposure_history.append((float(timestamp), gross, net))
+        if self.metrics is not None:
+            self.metrics.update(equity, gross, net)
+        if self.tail_risk is not None:
+            self.tail_risk.update(equity)
         return equity
 
     def get_equity_curve(self) -> List[float]:
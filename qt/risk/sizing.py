@@ -1,13 +1,24 @@
 import numpy as np
 
+from ..utils.rolling import RollingStats
+
 
 def size_by_volatility(target_vol, price_series, min_size=0.1, max_size=10.0):
-    """Scale position size to target a volatility level."""
-    prices = np.asarray(price_series, dtype=float)
-    if prices.size < 3:
-        return 1.0
-    rets = prices[1:] / np.maximum(prices[:-1], 1e-12) - 1.0
-    vol = np.std(rets, ddof=1)
+    """Scale position size to target a volatility level.
+
+    `price_series` is either a price history or a `RollingStats` fed with
+    per-period returns; the latter lets live callers size in O(1) per tick.
+    """
+    if isinstance(price_series, RollingStats):
+        if price_series.count < 2:
+            return 1.0
+        vol = price_series.std(ddof=1)
+    else:
+        prices = np.asarray(price_series, dtype=float)
+        if prices.size < 3:
+            return 1.0
+        rets = prices[1:] / np.maximum(prices[:-1], 1e-12) - 1.0
+        vol = np.std(rets, ddof=1)
     if vol <= 1e-12:
         return 1.0
     size = target_vol / vol
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import List, Any, Optional
+import numpy as np
 from ..engine.event import MarketEvent, FillEvent
+from ..engine.context import StrategyContext
 
 
 class StrategyBase(ABC):
@@ -18,14 +20,22 @@ class StrategyBase(ABC):
         """
         self.symbol = symbol
         self.engine: Optional[Any] = None
+        self.ctx: Optional[StrategyContext] = None
 
     def on_init(self, engine: Any) -> None:
         """Called when strategy is registered with the engine.
 
+        Binds `self.ctx`, a `StrategyContext` for `self.symbol` giving O(1)
+        access to mid/best bid/best ask/last price/position.
+
         Args:
             engine: SimulationEngine instance
         """
         self.engine = engine
+        if hasattr(engine, "context"):
+            self.ctx = engine.context(self.symbol)
+        else:
+            self.ctx = StrategyContext(engine, self.symbol)
 
     @abstractmethod
     def on_market_event(self, event: MarketEvent) -> List[Any]:
@@ -49,3 +59,47 @@ class StrategyBase(ABC):
         to track positions, update state, etc.
         """
         return None
+
+
+class ModelStrategyBase(StrategyBase):
+    """Base class for strategies driven by a model's `predict`.
+
+    Subclasses split their per-tick logic in two steps instead of
+    implementing `on_market_event` directly:
+
+    - `features_for(event)` updates internal state and returns the feature
+      row to score (or None to skip this event)
+    - `on_prediction(event, prediction)` turns the model output into orders
+
+    The engine collects rows from every model strategy at a timestamp and
+    scores all rows that share a model object with one `predict` call, so
+    batching is invisible to the strategy. Used on its own,
+    `on_market_event` runs the same two steps for a single row.
+    """
+
+    def __init__(self, symbol: str, model: Optional[Any] = None):
+        super().__init__(symbol)
+        self.model = model
+
+    @abstractmethod
+    def features_for(self, event: MarketEvent) -> Optional[np.ndarray]:
+        """Update state from `event` and return a 1D feature row, or None."""
+        return None
+
+    @abstractmethod
+    def on_prediction(self, event: MarketEvent, prediction: float) -> List[Any]:
+        """Return orders for `event` given the model's prediction."""
+        return []
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Score feature rows; used directly only when `self.model` is None."""
+        if self.model is None:
+            raise RuntimeError(f"{type(self).__name__} has no model")
+        return self.model.predict(X)
+
+    def on_market_event(self, event: MarketEvent) -> List[Any]:
+        x = self.features_for(event)
+        if x is None:
+            return []
+        pred = np.asarray(self.predict(np.asarray(x).reshape(1, -1))).reshape(-1)
+        return self.on_prediction(event, float(pred[0]))
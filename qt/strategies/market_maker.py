@@ -8,6 +8,7 @@ limits.
 """
 
 from ..engine.event import OrderEvent
+from ..utils.rolling import RollingStats, EWMAStats
 from .base import StrategyBase
 import collections
 import math
@@ -36,27 +37,30 @@ class SimpleMarketMaker(StrategyBase):
         self.vol_window = vol_window
         self._order_seq = 0
         self.prices: Deque[float] = collections.deque(maxlen=vol_window)
+        # returns between consecutive prices in `prices`, updated in O(1) per tick
+        self._ret_stats = RollingStats(max(vol_window - 1, 1))
         self.inventory = 0.0
 
     def _next_order_id(self):
         self._order_seq += 1
         return f"mm-{self._order_seq}"
 
+    def _record_price(self, price: float):
+        if self.prices:
+            self._ret_stats.push(price / self.prices[-1] - 1.0)
+        self.prices.append(price)
+
     def _estimate_vol(self):
-        if len(self.prices) < 2:
+        if self._ret_stats.count < 2:
             return 0.0
-        rets = [(self.prices[i + 1] / self.prices[i] - 1.0) for i in range(len(self.prices) - 1)]
-        vol = (sum((r - (sum(rets) / len(rets))) ** 2 for r in rets) / (len(rets) - 1)) ** 0.5 if len(rets) > 1 else 0.0
-        return vol * math.sqrt(TRADING_DAYS_PER_YEAR)
+        return self._ret_stats.std() * math.sqrt(TRADING_DAYS_PER_YEAR)
 
     def on_market_event(self, event):
         # update price history for vol estimate
         if getattr(event, "price", None) and event.price > 0:
-            self.prices.append(event.price)
+            self._record_price(event.price)
 
-        mid = self.engine.order_books.get(
-            self.symbol, type("Dummy", (), {"mid_price": lambda _: self.engine.last_prices.get(self.symbol, 100.0)})()
-        ).mid_price()
+        mid = self.ctx.mid()
         if not mid:
             return []
 
@@ -126,20 +130,20 @@ class AvellanedaMarketMaker(SimpleMarketMaker):
         self.risk_aversion = risk_aversion
         self.max_inventory = max_inventory
         self.ewma_alpha = ewma_alpha
-        self.ewma_vol = 0.0
+        self._ewma = EWMAStats(ewma_alpha, initial=0.0)
         self._last_quote_time: Optional[float] = None
         self.min_quote_interval = min_quote_interval
 
+    @property
+    def ewma_vol(self) -> float:
+        return self._ewma.mean
+
     def _update_ewma_vol(self, price: float):
-        # maintain EWMA of absolute log returns
-        if len(self.prices) >= 1:
+        # maintain EWMA of absolute log returns; must run before `price` is recorded
+        if self.prices:
             last = self.prices[-1]
             if last > 0:
-                lr = math.log(price / last)
-                r = abs(lr)
-                self.ewma_vol = (1 - self.ewma_alpha) * self.ewma_vol + self.ewma_alpha * r
-        else:
-            self.ewma_vol = 0.0
+                self._ewma.push(abs(math.log(price / last)))
 
     def _adaptive_interval(self):
         # increase quoting interval when vol is high to avoid churn
@@ -159,12 +163,10 @@ class AvellanedaMarketMaker(SimpleMarketMaker):
     def on_market_event(self, event):
         price = getattr(event, "price", None)
         if price and price > 0:
-            self.prices.append(price)
             self._update_ewma_vol(price)
+            self._record_price(price)
 
-        mid = self.engine.order_books.get(
-            self.symbol, type("Dummy", (), {"mid_price": lambda _: self.engine.last_prices.get(self.symbol, 100.0)})()
-        ).mid_price()
+        mid = self.ctx.mid()
         if not mid:
             return []
 
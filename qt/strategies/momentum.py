@@ -5,54 +5,63 @@ and uses a provided model wrapper with `predict` to create a signal.
 If no model is provided, it falls back to a pure momentum rule.
 """
 
-from typing import Optional, List, Literal
-from .base import StrategyBase
+from typing import Deque, Optional, List, Literal
+from .base import ModelStrategyBase
 from ..engine.event import OrderEvent
-from ..ml.pipeline import FeatureBuilder, SimpleModelWrapper
+from ..ml.pipeline import FeatureBuilder, OnlineFeatureBuilder, SimpleModelWrapper
+import collections
 import time
 import numpy as np
 
 
-class MomentumModelStrategy(StrategyBase):
+class MomentumModelStrategy(ModelStrategyBase):
     def __init__(self, symbol: str, window: int = 10, size: float = 1.0, model: Optional[SimpleModelWrapper] = None):
-        super().__init__(symbol)
+        super().__init__(symbol, model=model)
         self.window = window
         self.size = size
-        self.prices: List[float] = []
-        self.model = model
+        # bounded price history, kept for inspection; features are streamed
+        self.prices: Deque[float] = collections.deque(maxlen=max(1000, window * 10))
         self.fb = FeatureBuilder(window=window)
+        self.online_fb = OnlineFeatureBuilder(self.fb)
+        self._x_last: Optional[np.ndarray] = None
 
     def on_init(self, engine):
         super().on_init(engine)
 
-    def _signal_from_model(self) -> float:
-        X, _ = self.fb.build(self.prices)
-        if X.shape[0] == 0:
-            return 0.0
-        x_last = X[-1:].reshape(1, -1)
+    def predict(self, X: np.ndarray) -> np.ndarray:
         if self.model is None:
             # fallback: sum of recent returns
-            return float(np.sign(x_last[0, : self.window].sum()))
-        pred = self.model.predict(x_last)
-        return float(np.sign(pred[0]))
+            return np.sign(np.asarray(X)[:, : self.window].sum(axis=1))
+        return self.model.predict(X)
 
-    def on_market_event(self, event) -> List[OrderEvent]:
+    def features_for(self, event) -> Optional[np.ndarray]:
+        if getattr(event, "symbol", self.symbol) != self.symbol:
+            return None
         price = getattr(event, "price", None)
         if price is None or price <= 0:
-            return []
+            return None
         self.prices.append(price)
-        # keep memory bounded
-        if len(self.prices) > max(1000, self.window * 10):
-            self.prices.pop(0)
+        # same row FeatureBuilder.build(prices)[-1] would give, in O(1);
+        # copied because the online builder reuses its row buffer
+        row = self.online_fb.update(price)
+        self._x_last = None if row is None else row.copy()
+        return self._x_last
 
-        sig = self._signal_from_model()
+    def on_prediction(self, event, prediction: float) -> List[OrderEvent]:
+        sig = float(np.sign(prediction))
         if sig == 0.0:
             return []
 
         side: Literal["BUY", "SELL"] = "BUY" if sig > 0 else "SELL"
         t = getattr(event, "timestamp", time.time())
         order = OrderEvent(
-            order_id=f"mom-1", timestamp=t, symbol=self.symbol, side=side, price=price, quantity=self.size, order_type="MARKET"
+            order_id="mom-1",
+            timestamp=t,
+            symbol=self.symbol,
+            side=side,
+            price=event.price,
+            quantity=self.size,
+            order_type="MARKET",
         )
         return [order]
 
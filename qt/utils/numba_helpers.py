@@ -1,3 +1,5 @@
+import numpy as np
+
 try:
     from numba import njit
 
@@ -93,3 +95,28 @@ def calculate_slippage_impact(quantity, liquidity, price, slippage_coeff):
     if liquidity <= 0:
         liquidity = 1.0
     return slippage_coeff * (quantity / liquidity) * price
+
+
+@njit
+def ewma_filter(series, alpha):
+    """Exponential moving average seeded with the first observation.
+
+    Computes ``out[i] = alpha * x[i] + (1 - alpha) * out[i - 1]`` with
+    ``out[0] = x[0]`` in a single compiled pass.
+
+    Args:
+        series: 1D float numpy array
+        alpha: Smoothing factor in (0, 1]
+
+    Returns:
+        Array of the same length with the EMA values
+    """
+    n = len(series)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    out[0] = series[0]
+    beta = 1 - alpha
+    for i in range(1, n):
+        out[i] = alpha * series[i] + beta * out[i - 1]
+    return out
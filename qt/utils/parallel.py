@@ -0,0 +1,45 @@
+"""Process-pool fan-out with a serial fallback.
+
+`parallel_map` uses joblib when it is installed and `n_jobs != 1`, otherwise
+it runs the tasks in-process. With joblib, numpy arrays larger than
+`max_nbytes` in the task arguments are dumped once to a temporary file and
+handed to the workers as read-only memmaps instead of being pickled per task.
+"""
+
+from typing import Any, Callable, Iterable, List, Sequence
+
+try:
+    from joblib import Parallel, delayed
+
+    JOBLIB_AVAILABLE = True
+except Exception:
+    Parallel = None
+    delayed = None
+    JOBLIB_AVAILABLE = False
+
+
+def parallel_map(
+    func: Callable[..., Any],
+    items: Iterable[Any],
+    args: Sequence[Any] = (),
+    n_jobs: int = 1,
+    backend: str = "loky",
+    max_nbytes: str = "1M",
+    mmap_mode: str = "r",
+) -> List[Any]:
+    """Return ``[func(item, *args) for item in items]``, in order.
+
+    Args:
+        func: Picklable callable run once per item
+        items: Work items (one task each)
+        args: Extra arguments shared by every task (e.g. large feature matrices)
+        n_jobs: Worker count; 1 runs serially, -1 uses all cores
+        backend: joblib backend ("loky" processes, "threading" threads)
+        max_nbytes: Arrays above this size are shared via memmap
+        mmap_mode: Mode used by workers to open the shared arrays
+    """
+    items = list(items)
+    if n_jobs == 1 or len(items) <= 1 or not JOBLIB_AVAILABLE:
+        return [func(item, *args) for item in items]
+    runner = Parallel(n_jobs=n_jobs, backend=backend, max_nbytes=max_nbytes, mmap_mode=mmap_mode)
+    return list(runner(delayed(func)(item, *args) for item in items))
@@ -0,0 +1,23 @@
+"""Random generator plumbing for simulation code.
+
+Functions that draw random numbers take ``rng=None`` and pass it through
+`as_generator`. An explicit ``numpy.random.Generator`` (or integer seed)
+makes a call reproducible on its own. ``None`` derives a fresh Generator from the
+legacy global state, so ``np.random.seed(...)`` still makes old call sites
+deterministic.
+"""
+
+from typing import Union
+
+import numpy as np
+
+RNGLike = Union[None, int, np.random.Generator, np.random.SeedSequence]
+
+
+def as_generator(rng: RNGLike = None) -> np.random.Generator:
+    """Return a ``numpy.random.Generator`` for `rng` (Generator, seed, SeedSequence or None)."""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if rng is None:
+        return np.random.default_rng(np.random.randint(0, 2**63 - 1, dtype=np.int64))
+    return np.random.default_rng(rng)
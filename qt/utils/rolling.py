@@ -0,0 +1,162 @@
+"""Constant-time rolling statistics for per-tick estimators.
+
+`RollingStats` keeps a fixed-size ring buffer and updates the mean and
+sum of squared deviations with Welford's add/remove recurrences, so a push
+costs O(1) regardless of the window length and never allocates.
+`EWMAStats` is the exponentially weighted counterpart (no buffer at all).
+"""
+
+import math
+from typing import List, Optional
+
+# full-window recomputation interval (in pushes) that bounds round-off drift
+RESYNC_INTERVAL = 4096
+
+
+class RollingStats:
+    """Running mean/variance over the last `window` observations.
+
+    Args:
+        window: Number of most recent observations kept in the estimate
+    """
+
+    __slots__ = ("window", "_buf", "_pos", "_count", "_mean", "_m2", "_since_sync")
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = int(window)
+        self._buf: List[float] = [0.0] * self.window
+        self._pos = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_sync = 0
+
+    def push(self, x: float) -> None:
+        """Add an observation, evicting the oldest one once the window is full."""
+        x = float(x)
+        if self._count < self.window:
+            # Welford add
+            self._count += 1
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        else:
+            # replace oldest observation in a single add/remove step
+            old = self._buf[self._pos]
+            old_mean = self._mean
+            self._mean = old_mean + (x - old) / self._count
+            self._m2 += (x - old) * (x - self._mean + old - old_mean)
+            if self._m2 < 0.0:
+                # guard against tiny negative values from cancellation
+                self._m2 = 0.0
+        self._buf[self._pos] = x
+        self._pos += 1
+        if self._pos == self.window:
+            self._pos = 0
+        self._since_sync += 1
+        if self._since_sync >= RESYNC_INTERVAL and self._count == self.window:
+            self._resync()
+
+    def _resync(self) -> None:
+        # exact two-pass recomputation over the buffer; amortised O(1) per push
+        buf = self._buf
+        mean = 0.0
+        for v in buf:
+            mean += v
+        mean /= self.window
+        m2 = 0.0
+        for v in buf:
+            m2 += (v - mean) * (v - mean)
+        self._mean = mean
+        self._m2 = m2
+        self._since_sync = 0
+
+    def reset(self) -> None:
+        self._pos = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_sync = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._count == self.window
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    def variance(self, ddof: int = 1) -> float:
+        """Window variance; returns 0.0 when fewer than `ddof + 1` observations."""
+        n = self._count - ddof
+        if n <= 0:
+            return 0.0
+        return self._m2 / n
+
+    def std(self, ddof: int = 1) -> float:
+        return math.sqrt(self.variance(ddof))
+
+
+class EWMAStats:
+    """Exponentially weighted mean/variance with smoothing factor `alpha`.
+
+    Args:
+        alpha: Weight of the newest observation, in (0, 1]
+        initial: Optional starting mean. When omitted the first observation
+            seeds the mean; when given (e.g. 0.0) every observation is blended
+            in with weight `alpha`, matching the classic
+            ``v = (1 - alpha) * v + alpha * x`` recursion.
+    """
+
+    __slots__ = ("alpha", "_mean", "_var", "_count")
+
+    def __init__(self, alpha: float, initial: Optional[float] = None):
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = float(alpha)
+        self._mean = 0.0 if initial is None else float(initial)
+        self._var = 0.0
+        self._count = 0 if initial is None else 1
+
+    @classmethod
+    def from_span(cls, span: float, initial: Optional[float] = None) -> "EWMAStats":
+        """Build from a pandas-style span (alpha = 2 / (span + 1))."""
+        return cls(2.0 / (float(span) + 1.0), initial=initial)
+
+    def push(self, x: float) -> None:
+        x = float(x)
+        if self._count == 0:
+            self._mean = x
+            self._count = 1
+            return
+        a = self.alpha
+        diff = x - self._mean
+        incr = a * diff
+        self._mean += incr
+        self._var = (1.0 - a) * (self._var + diff * incr)
+        self._count += 1
+
+    def reset(self, initial: Optional[float] = None) -> None:
+        self._mean = 0.0 if initial is None else float(initial)
+        self._var = 0.0
+        self._count = 0 if initial is None else 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    def variance(self) -> float:
+        return self._var
+
+    def std(self) -> float:
+        return math.sqrt(self._var)
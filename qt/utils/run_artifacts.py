@@ -1,8 +1,96 @@
 from __future__ import annotations
 
 import json
+import uuid
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as pads
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except Exception:
+    pa = None
+    pads = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+TRADE_COLUMNS = ["timestamp", "order_id", "symbol", "side", "price", "quantity", "fee"]
+
+
+def new_run_id(prefix: str = "run") -> str:
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet run artifacts")
+
+
+def _equity_table(equity_history: List):
+    pairs = np.asarray(equity_history, dtype=float).reshape(-1, 2)
+    return pa.table({"timestamp": pairs[:, 0], "equity": pairs[:, 1]})
+
+
+def _trade_table(trade_log: List[Dict[str, Any]]):
+    cols: Dict[str, Any] = {c: [t.get(c) for t in trade_log] for c in TRADE_COLUMNS}
+    types = {
+        "timestamp": pa.float64(),
+        "order_id": pa.string(),
+        "symbol": pa.string(),
+        "side": pa.string(),
+        "price": pa.float64(),
+        "quantity": pa.float64(),
+        "fee": pa.float64(),
+    }
+    return pa.table({c: pa.array(cols[c], type=types[c]) for c in TRADE_COLUMNS})
+
+
+def write_run_dataset(run_id: str, equity_history: List, trade_log: List, root: str = "runs/dataset") -> Dict[str, str]:
+    """Write equity and trades for one run into Parquet datasets partitioned by run id.
+
+    Layout: ``<root>/equity/run_id=<id>/part-0.parquet`` and
+    ``<root>/trades/run_id=<id>/part-0.parquet``. Each run owns its own
+    partition directory, so concurrent writers never touch the same file.
+    """
+    _require_pyarrow()
+    out = {}
+    for kind, table in (("equity", _equity_table(equity_history)), ("trades", _trade_table(trade_log or []))):
+        part_dir = Path(root) / kind / f"run_id={run_id}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        path = part_dir / "part-0.parquet"
+        pq.write_table(table, path)
+        out[kind] = str(path)
+    return out
+
+
+def read_run_dataset(
+    root: str = "runs/dataset",
+    kind: str = "equity",
+    run_ids: Optional[Iterable[str]] = None,
+    columns: Optional[List[str]] = None,
+):
+    """Read equity or trades for some (or all) runs as a DataFrame.
+
+    Only the requested partitions and columns are read from disk; the
+    `run_id` column comes from the partition directory names.
+    """
+    _require_pyarrow()
+    base = Path(root) / kind
+    if not base.exists():
+        import pandas as pd
+
+        return pd.DataFrame(columns=(columns or []) + ["run_id"])
+    ds = pads.dataset(str(base), format="parquet", partitioning="hive")
+    flt = None
+    if run_ids is not None:
+        flt = pads.field("run_id").isin(list(run_ids))
+    cols = None if columns is None else list(dict.fromkeys(list(columns) + ["run_id"]))
+    return ds.to_table(columns=cols, filter=flt).to_pandas()
 
 
 def save_run_artifacts(
@@ -12,9 +100,29 @@ def save_run_artifacts(
     equity_history: List,
     trade_log: List,
     out_dir: str = "runs",
+    fmt: str = "json",
 ) -> str:
+    """Persist a run.
+
+    fmt="json" writes ``<out_dir>/<run_name>.json`` (the original format).
+    fmt="parquet" writes equity/trades into the partitioned dataset under
+    ``<out_dir>/dataset`` and records config and summary metrics in the
+    SQLite catalog ``<out_dir>/catalog.sqlite``; the run id is returned.
+    """
     out_path = Path(out_dir)
     out_path.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        from .run_catalog import RunCatalog
+
+        run_id = new_run_id(run_name)
+        root = out_path / "dataset"
+        write_run_dataset(run_id, equity_history, trade_log, root=str(root))
+        RunCatalog(str(out_path / "catalog.sqlite")).record_run(
+            run_id, name=run_name, params=config, metrics=summary, artifact_root=str(root)
+        )
+        return run_id
+    if fmt != "json":
+        raise ValueError(f"unknown artifact format: {fmt}")
     payload = {
         "run_name": run_name,
         "config": config,
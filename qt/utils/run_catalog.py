@@ -0,0 +1,236 @@
+"""SQLite catalog of backtest runs, their parameters and summary metrics.
+
+Parameters and metrics are stored in narrow (run_id, key, value) tables with
+indexes on (key, value), so queries such as "top 20 runs by Sharpe with
+execution_fee = 0.0005" are answered from the indexes without loading any
+run artifacts. Equity/trade data lives in the Parquet dataset written by
+`qt.utils.run_artifacts.write_run_dataset`.
+"""
+
+from __future__ import annotations
+
+import json
+import numbers
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    name TEXT,
+    strategy TEXT,
+    created REAL,
+    artifact_root TEXT
+);
+CREATE TABLE IF NOT EXISTS run_params (
+    run_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value_num REAL,
+    value_text TEXT,
+    PRIMARY KEY (run_id, key)
+);
+CREATE TABLE IF NOT EXISTS run_metrics (
+    run_id TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, metric)
+);
+CREATE INDEX IF NOT EXISTS idx_params_num ON run_params (key, value_num, run_id);
+CREATE INDEX IF NOT EXISTS idx_params_text ON run_params (key, value_text, run_id);
+CREATE INDEX IF NOT EXISTS idx_metrics_value ON run_metrics (metric, value, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_strategy ON runs (strategy);
+"""
+
+# ids bound per IN (...) query, well under SQLite's bound-variable limit
+_ID_CHUNK = 500
+
+
+def _split_value(value: Any):
+    if isinstance(value, bool):
+        return float(value), None
+    if isinstance(value, numbers.Real):
+        return float(value), None
+    if value is None:
+        return None, None
+    if isinstance(value, str):
+        return None, value
+    return None, json.dumps(value, default=str)
+
+
+class RunCatalog:
+    """Catalog of runs stored in a SQLite file."""
+
+    def __init__(self, db_path: str = "runs/catalog.sqlite"):
+        self.db_path = str(db_path)
+        db_file = Path(self.db_path)
+        if db_file.parent and not db_file.parent.exists():
+            db_file.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def record_run(
+        self,
+        run_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        strategy: Optional[str] = None,
+        artifact_root: Optional[str] = None,
+    ) -> str:
+        """Insert or replace a run with its params and numeric metrics."""
+        params = dict(params or {})
+        strategy = strategy or params.get("strategy")
+        param_rows = [(run_id, k) + _split_value(v) for k, v in params.items()]
+        metric_rows = [
+            (run_id, k, float(v))
+            for k, v in (metrics or {}).items()
+            if isinstance(v, numbers.Real) and not isinstance(v, bool)
+        ]
+        with closing(self._connect()) as conn:
+            with conn:
+                conn.execute("DELETE FROM run_params WHERE run_id = ?", (run_id,))
+                conn.execute("DELETE FROM run_metrics WHERE run_id = ?", (run_id,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO runs (run_id, name, strategy, created, artifact_root) VALUES (?, ?, ?, ?, ?)",
+                    (run_id, name, strategy, time.time(), artifact_root),
+                )
+                conn.executemany("INSERT INTO run_params (run_id, key, value_num, value_text) VALUES (?, ?, ?, ?)", param_rows)
+                conn.executemany("INSERT INTO run_metrics (run_id, metric, value) VALUES (?, ?, ?)", metric_rows)
+        return run_id
+
+    def top_runs(
+        self,
+        metric: str = "sharpe",
+        n: int = 20,
+        where: Optional[Dict[str, Any]] = None,
+        strategy: Optional[str] = None,
+        ascending: bool = False,
+        params: Optional[List[str]] = None,
+        metrics: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Best `n` runs by `metric`, filtered on exact parameter values.
+
+        Args:
+            metric: Metric to rank by
+            n: Number of rows
+            where: Parameter filters, e.g. {"execution_fee": 0.0005}
+            strategy: Optional strategy filter
+            ascending: Rank lowest first (e.g. for drawdown depth)
+            params: Parameter columns to include in the result
+            metrics: Extra metric columns to include in the result
+        """
+        sql = ["SELECT r.run_id, r.name, r.strategy, m.value AS score FROM run_metrics m JOIN runs r ON r.run_id = m.run_id"]
+        sql.append("WHERE m.metric = ?")
+        args: List[Any] = [metric]
+        if strategy is not None:
+            sql.append("AND r.strategy = ?")
+            args.append(strategy)
+        for key, value in (where or {}).items():
+            num, text = _split_value(value)
+            column = "value_num" if num is not None else "value_text"
+            sql.append(f"AND EXISTS (SELECT 1 FROM run_params p WHERE p.run_id = m.run_id AND p.key = ? AND p.{column} = ?)")
+            args.extend([key, num if num is not None else text])
+        sql.append(f"ORDER BY m.value {'ASC' if ascending else 'DESC'} LIMIT ?")
+        args.append(int(n))
+        with closing(self._connect()) as conn:
+            with conn:
+                df = pd.read_sql_query(" ".join(sql), conn, params=args)
+                df = df.rename(columns={"score": metric})
+                ids = df["run_id"].tolist()
+                if ids and (params or metrics):
+                    marks = ",".join("?" * len(ids))
+                    if params:
+                        rows = conn.execute(
+                            f"SELECT run_id, key, COALESCE(value_num, value_text) FROM run_params "
+                            f"WHERE run_id IN ({marks}) AND key IN ({','.join('?' * len(params))})",
+                            ids + list(params),
+                        ).fetchall()
+                        df = self._attach(df, rows, params)
+                    if metrics:
+                        rows = conn.execute(
+                            f"SELECT run_id, metric, value FROM run_metrics "
+                            f"WHERE run_id IN ({marks}) AND metric IN ({','.join('?' * len(metrics))})",
+                            ids + list(metrics),
+                        ).fetchall()
+                        df = self._attach(df, rows, metrics)
+        return df
+
+    @staticmethod
+    def _attach(df: pd.DataFrame, rows, columns: List[str]) -> pd.DataFrame:
+        wide = pd.DataFrame(rows, columns=["run_id", "key", "value"]).pivot(index="run_id", columns="key", values="value")
+        wide = wide.reindex(columns=[c for c in columns if c not in df.columns])
+        return df.merge(wide, left_on="run_id", right_index=True, how="left")
+
+    def get_run(self, run_id: str) -> Dict[str, Any]:
+        """Return the run row plus its params and metrics dicts."""
+        with closing(self._connect()) as conn:
+            with conn:
+                row = conn.execute(
+                    "SELECT run_id, name, strategy, created, artifact_root FROM runs WHERE run_id = ?", (run_id,)
+                ).fetchone()
+                if row is None:
+                    raise KeyError(run_id)
+                params = conn.execute(
+                    "SELECT key, value_num, value_text FROM run_params WHERE run_id = ?", (run_id,)
+                ).fetchall()
+                metrics = conn.execute("SELECT metric, value FROM run_metrics WHERE run_id = ?", (run_id,)).fetchall()
+        return {
+            "run_id": row[0],
+            "name": row[1],
+            "strategy": row[2],
+            "created": row[3],
+            "artifact_root": row[4],
+            "params": {k: (num if num is not None else text) for k, num, text in params},
+            "metrics": dict(metrics),
+        }
+
+    def runs_table(self, run_ids: Optional[List[str]] = None) -> pd.DataFrame:
+        """One row per run with every metric and parameter as a column (metrics first)."""
+        runs = self.list_runs()
+        if run_ids is not None:
+            runs = runs[runs["run_id"].isin(list(run_ids))]
+        ids = runs["run_id"].tolist()
+        if not ids:
+            return runs.reset_index(drop=True)
+        metric_sql = "SELECT run_id, metric, value FROM run_metrics"
+        param_sql = "SELECT run_id, key, COALESCE(value_num, value_text) FROM run_params"
+        metric_rows: List[Any] = []
+        param_rows: List[Any] = []
+        with closing(self._connect()) as conn:
+            with conn:
+                if run_ids is None:
+                    metric_rows = conn.execute(metric_sql).fetchall()
+                    param_rows = conn.execute(param_sql).fetchall()
+                else:
+                    for lo in range(0, len(ids), _ID_CHUNK):
+                        chunk = ids[lo : lo + _ID_CHUNK]
+                        where = f" WHERE run_id IN ({','.join('?' * len(chunk))})"
+                        metric_rows += conn.execute(metric_sql + where, chunk).fetchall()
+                        param_rows += conn.execute(param_sql + where, chunk).fetchall()
+        metric_names = sorted({r[1] for r in metric_rows})
+        param_names = sorted({r[1] for r in param_rows} - set(metric_names))
+        df = runs.reset_index(drop=True)
+        if metric_rows:
+            df = self._attach(df, metric_rows, metric_names)
+        if param_rows:
+            df = self._attach(df, param_rows, param_names)
+        return df
+
+    def list_runs(self, strategy: Optional[str] = None) -> pd.DataFrame:
+        sql = "SELECT run_id, name, strategy, created, artifact_root FROM runs"
+        args: List[Any] = []
+        if strategy is not None:
+            sql += " WHERE strategy = ?"
+            args.append(strategy)
+        with closing(self._connect()) as conn:
+            with conn:
+                return pd.read_sql_query(sql + " ORDER BY created", conn, params=args)
@@ -0,0 +1,38 @@
+import numpy as np
+
+from qt.analytics.batch import batch_metrics
+from qt.analytics.metrics import (
+    compute_cagr,
+    compute_calmar,
+    compute_drawdown,
+    compute_drawdown_duration,
+    compute_return_stats,
+    compute_returns,
+    compute_sharpe,
+    compute_sortino,
+)
+
+
+def test_batch_metrics_match_per_curve_functions():
+    rng = np.random.RandomState(7)
+    curves = [100 * np.cumprod(1 + rng.normal(0.0003, 0.01, size=n)) for n in (50, 120, 300)]
+    df = batch_metrics({"a": curves[0], "b": curves[1], "c": curves[2]})
+    assert list(df.index) == ["a", "b", "c"]
+    for name, eq in zip("abc", curves):
+        row = df.loc[name]
+        rets = compute_returns(eq)
+        stats = compute_return_stats(rets)
+        dur = compute_drawdown_duration(eq)
+        assert row["n_points"] == len(eq)
+        assert np.isclose(row["sharpe"], compute_sharpe(rets))
+        assert np.isclose(row["sortino"], compute_sortino(rets))
+        assert np.isclose(row["cagr"], compute_cagr(eq))
+        assert np.isclose(row["calmar"], compute_calmar(eq))
+        assert np.isclose(row["max_drawdown"], compute_drawdown(eq)["max_drawdown"])
+        assert row["max_drawdown_duration"] == dur["max_duration"]
+        assert np.isclose(row["avg_drawdown_duration"], dur["avg_duration"])
+        assert np.isclose(row["skew"], stats["skew"])
+        assert np.isclose(row["kurtosis"], stats["kurtosis"])
+
+    matrix = np.vstack([c[:50] for c in curves])
+    assert np.allclose(batch_metrics(matrix)["sharpe"].iloc[0], df.loc["a", "sharpe"])
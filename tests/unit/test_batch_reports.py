@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from qt.analytics.reporting import generate_batch_reports, generate_comparison_report
+from qt.utils.run_catalog import RunCatalog
+
+
+def _run(name, drift):
+    history = [(float(i), 100.0 + drift * i) for i in range(200)]
+    trades = [{"timestamp": 1.0, "symbol": "AAA", "side": "BUY", "price": 100.0, "quantity": 1.0}]
+    return {"run_name": name, "summary": {"sharpe": drift}, "equity_history": history, "trade_log": trades}
+
+
+def test_batch_reports_in_process_pool(tmp_path):
+    out = generate_batch_reports([_run("a", 0.1), _run("b", -0.1)], out_dir=str(tmp_path), n_jobs=2)
+    assert set(out) == {"a", "b"}
+    for paths in out.values():
+        assert Path(paths["html"]).exists()
+        assert paths["pdf"] == ""
+    assert "<svg" in Path(out["a"]["html"]).read_text(encoding="utf-8")
+
+
+def test_comparison_report_from_catalog(tmp_path):
+    catalog = RunCatalog(str(tmp_path / "catalog.sqlite"))
+    catalog.record_run("r1", params={"fee": 0.001}, metrics={"sharpe": 0.5, "max_drawdown": -0.1})
+    catalog.record_run("r2", params={"fee": 0.002}, metrics={"sharpe": 1.5, "max_drawdown": -0.2})
+
+    table = catalog.runs_table()
+    assert {"sharpe", "max_drawdown", "fee"} <= set(table.columns)
+
+    path = generate_comparison_report(catalog.db_path, out_dir=str(tmp_path / "reports"))
+    page = Path(path).read_text(encoding="utf-8")
+    assert page.index(">r2<") < page.index(">r1<")
+    assert "2 runs ranked by sharpe" in page
+
+
+def test_batch_reports_by_run_id(tmp_path):
+    pytest.importorskip("pyarrow")
+    from qt.utils.run_artifacts import save_run_artifacts
+
+    run = _run("x", 0.2)
+    run_id = save_run_artifacts(
+        "x", {"fee": 0.0}, {"sharpe": 0.2}, run["equity_history"], [], out_dir=str(tmp_path), fmt="parquet"
+    )
+    out = generate_batch_reports(
+        [run_id], out_dir=str(tmp_path / "reports"), n_jobs=1, catalog_path=str(tmp_path / "catalog.sqlite")
+    )
+    assert Path(out[run_id]["html"]).exists()
+    index = Path(out["index"]["html"]).read_text(encoding="utf-8")
+    assert f'href="{run_id}.html"' in index
+
+
+def test_batch_index_only_ranks_rendered_runs(tmp_path):
+    catalog = RunCatalog(str(tmp_path / "catalog.sqlite"))
+    catalog.record_run("a", metrics={"sharpe": 0.1})
+    catalog.record_run("other", metrics={"sharpe": 9.0})
+    out = generate_batch_reports([_run("a", 0.1)], out_dir=str(tmp_path / "reports"), n_jobs=1, catalog_path=catalog.db_path)
+    index = Path(out["index"]["html"]).read_text(encoding="utf-8")
+    assert ">a<" in index and ">other<" not in index
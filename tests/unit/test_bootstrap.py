@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from qt.analytics.bootstrap import bootstrap_indices, bootstrap_statistic
+from qt.analytics.risk_ext import bootstrap_var
+from qt.analytics.statistics import bootstrap_sharpe_ci
+
+
+def test_block_bootstrap_keeps_autocorrelation():
+    e = np.random.default_rng(1).normal(size=3000)
+    x = np.zeros_like(e)
+    for i in range(1, x.size):
+        x[i] = 0.6 * x[i - 1] + e[i]
+
+    def lag1(method):
+        s = x[bootstrap_indices(x.size, x.size, 1, method=method, block_size=30, rng=2)[0]]
+        return np.corrcoef(s[:-1], s[1:])[0, 1]
+
+    assert abs(lag1("iid")) < 0.1
+    assert lag1("circular") > 0.45
+    assert lag1("stationary") > 0.45
+
+
+def test_chunked_statistic_matches_single_pass():
+    x = np.random.default_rng(0).normal(size=50)
+
+    def run(method, n, rng, max_elements):
+        return bootstrap_statistic(
+            x, lambda s: s.sum(axis=1), n_resamples=n, length=7, method=method, rng=rng, max_elements=max_elements
+        )
+
+    # iid and circular indices are drawn row-major, so chunking replays the exact same resamples
+    for method in ("iid", "circular"):
+        np.testing.assert_array_equal(run(method, 1000, 3, 70), run(method, 1000, 3, 1 << 22))
+    # stationary draws starts and block breaks per chunk: same distribution, different order
+    one = run("stationary", 200_000, 3, 1 << 22)
+    chunked = run("stationary", 200_000, 3, 700)
+    assert chunked.shape == (200_000,)
+    q = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+    np.testing.assert_allclose(np.quantile(chunked, q), np.quantile(one, q), atol=0.03 * one.std())
+    with pytest.raises(ValueError):
+        bootstrap_statistic(x, np.mean, antithetic=True, method="circular")
+
+
+def test_bootstrap_var_reproducible_with_generator():
+    rets = np.random.default_rng(5).standard_t(4, size=1000) * 0.01
+    a = bootstrap_var(rets, horizon=5, simulations=100_000, method="stationary", rng=np.random.default_rng(7))
+    b = bootstrap_var(rets, horizon=5, simulations=100_000, method="stationary", rng=np.random.default_rng(7))
+    assert a == b > 0.0
+    assert bootstrap_var(rets, horizon=5, simulations=1000, portfolio_value=100.0, rng=1) == pytest.approx(
+        100.0 * bootstrap_var(rets, horizon=5, simulations=1000, rng=1)
+    )
+    anti = bootstrap_var(rets, horizon=5, simulations=10_000, antithetic=True, rng=1)
+    assert anti == pytest.approx(a, rel=0.15)
+
+
+def test_bootstrap_sharpe_ci_block():
+    rets = np.random.default_rng(2).normal(0.001, 0.01, size=500)
+    lo, hi = bootstrap_sharpe_ci(rets, n_boot=500, method="circular", rng=0)
+    assert lo < hi
+    assert bootstrap_sharpe_ci(rets, n_boot=200, rng=4) == bootstrap_sharpe_ci(rets, n_boot=200, rng=4)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from qt.analytics.downsample import downsample, downsample_history, lttb_indices, minmax_indices
+from qt.analytics.reporting import _render_html
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    x = np.arange(10000, dtype=float)
+    y = np.sin(x / 500.0)
+    y[4321] = 5.0
+    idx = lttb_indices(x, y, 200)
+    assert len(idx) == 200
+    assert idx[0] == 0 and idx[-1] == 9999
+    assert np.all(np.diff(idx) > 0)
+    assert 4321 in idx
+
+
+def test_minmax_keeps_bucket_extremes():
+    rng = np.random.RandomState(0)
+    y = rng.normal(size=5000)
+    idx = minmax_indices(y, 100)
+    assert len(idx) <= 100 and np.all(np.diff(idx) > 0)
+    assert np.argmin(y) in idx and np.argmax(y) in idx
+    assert idx[0] == 0 and idx[-1] == 4999
+    xs, ys = downsample(np.arange(5000), y, 100, method="minmax")
+    assert ys.max() == y.max()
+    for n_out in range(0, 8):
+        idx = minmax_indices(y, n_out)
+        assert len(idx) <= n_out and np.all(np.diff(idx) > 0)
+        if n_out >= 2:
+            assert idx[0] == 0 and idx[-1] == 4999
+    history = list(zip(range(5000), y))
+    assert downsample_history(history, 1, "minmax") == history[:1]
+
+
+def test_history_and_report_chart():
+    history = [(float(t), 100.0 + np.sin(t / 50.0)) for t in range(3000)]
+    small = downsample_history(history, 300)
+    assert len(small) == 300 and small[0] == history[0] and small[-1] == history[-1]
+    assert downsample_history(history[:10], 300) == history[:10]
+    html = _render_html({"sharpe": 1.0}, history, [], chart_points=300)
+    assert "<polyline" in html and "300 plotted" in html
@@ -0,0 +1,36 @@
+import numpy as np
+
+from qt.ml.feature_store import FeatureStore, feature_key
+from qt.ml.pipeline import FeatureBuilder
+
+
+def _prices(seed, n=200):
+    rng = np.random.RandomState(seed)
+    return 100.0 * np.cumprod(1.0 + rng.normal(scale=0.01, size=n))
+
+
+def test_feature_store_roundtrip_and_key(tmp_path):
+    store = FeatureStore(cache_dir=str(tmp_path))
+    fb = FeatureBuilder()
+    prices = _prices(0)
+    X, y = store.build(fb, prices)
+    key = feature_key(prices, fb)
+    assert key in store
+    X2, y2 = store.build(fb, list(prices))
+    assert isinstance(X2, np.memmap)
+    assert np.array_equal(X, X2) and np.array_equal(y, y2)
+    # different parameters or dtype give different keys
+    assert feature_key(prices, FeatureBuilder(window=5)) != key
+    assert feature_key(prices, fb, dtype=np.float32) != key
+
+
+def test_feature_store_lru_eviction(tmp_path):
+    fb = FeatureBuilder()
+    store = FeatureStore(cache_dir=str(tmp_path))
+    store.build(fb, _prices(1))
+    one_entry = store.size_bytes()
+    store.max_bytes = int(one_entry * 1.5)
+    store.build(fb, _prices(2))
+    assert store.size_bytes() <= store.max_bytes
+    assert feature_key(_prices(2), fb) in store
+    assert feature_key(_prices(1), fb) not in store
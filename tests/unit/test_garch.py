@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from qt.analytics.garch import (
+    GarchFit,
+    _garch_nll_grad,
+    fit_garch,
+    garch_from_params,
+    garch_loglik,
+    simulate_garch_paths,
+)
+from qt.analytics.risk_ext import garch_var
+
+
+def _simulate(n=3000, omega=2e-6, alpha=0.08, beta=0.9, seed=0):
+    rng = np.random.default_rng(seed)
+    s2 = omega / (1 - alpha - beta)
+    r = np.empty(n)
+    for t in range(n):
+        r[t] = np.sqrt(s2) * rng.standard_normal()
+        s2 = omega + alpha * r[t] ** 2 + beta * s2
+    return r
+
+
+def test_analytic_gradient_matches_finite_differences():
+    z = _simulate(500) / 0.01
+    p = np.array([0.05, 0.1, 0.85])
+    _, grad = _garch_nll_grad(p[0], p[1], p[2], z, 1.0)
+    h = 1e-6
+    num = [(_garch_nll_grad(*(p + h * e), z, 1.0)[0] - _garch_nll_grad(*(p - h * e), z, 1.0)[0]) / (2 * h) for e in np.eye(3)]
+    np.testing.assert_allclose(grad, num, rtol=1e-5)
+
+
+def test_fit_recovers_parameters():
+    r = _simulate()
+    fit = fit_garch(r)
+    assert fit.converged
+    assert fit.alpha == pytest.approx(0.08, abs=0.03)
+    assert fit.beta == pytest.approx(0.9, abs=0.04)
+    assert fit.loglik == pytest.approx(garch_loglik(r, fit.omega, fit.alpha, fit.beta))
+
+
+def test_paths_have_their_own_variance():
+    fit = GarchFit(omega=1e-6, alpha=0.2, beta=0.75, mu=0.0, last_variance=1e-4, last_residual=0.0)
+    paths = simulate_garch_paths(fit, horizon=20, simulations=20000, rng=1)
+    # a shock on one path raises only that path's later variance
+    big = np.abs(paths[:, 0]) > 2 * np.sqrt(fit.next_variance())
+    assert paths[big, 1].std() > 1.3 * paths[~big, 1].std()
+
+
+def test_garch_var_uses_fitted_params():
+    r = _simulate(seed=4)
+    fitted = garch_var(r, horizon=10, simulations=20000, rng=0)
+    fit = fit_garch(r)
+    fixed = garch_var(r, horizon=10, simulations=20000, omega=fit.omega, alpha_g=fit.alpha, beta=fit.beta, rng=0)
+    assert fitted == pytest.approx(fixed)
+    assert garch_var(r, horizon=10, simulations=20000, portfolio_value=1e6, rng=0) == pytest.approx(1e6 * fitted)
+
+
+def test_non_finite_returns_are_dropped_with_explicit_params():
+    r = _simulate(500, seed=5)
+    gappy = np.concatenate([r[:250], [np.nan, np.inf], r[250:]])
+    assert garch_from_params(gappy, 2e-6, 0.08, 0.9) == garch_from_params(r, 2e-6, 0.08, 0.9)
+    var = garch_var(gappy, horizon=5, simulations=5000, omega=2e-6, alpha_g=0.08, beta=0.9, rng=0)
+    assert np.isfinite(var) and var > 0
+    assert np.isfinite(garch_var(np.array([0.01, np.nan, -0.02, 0.005]), simulations=1000, rng=0))
@@ -1,6 +1,15 @@
 import numpy as np
 
-from qt.analytics.metrics import compute_cagr, compute_calmar, compute_drawdown_duration, compute_return_stats
+from qt.analytics.metrics import (
+    compute_cagr,
+    compute_calmar,
+    compute_drawdown_duration,
+    compute_return_stats,
+    compute_sharpe,
+    drawdown_episodes,
+    rolling_sharpe,
+    rolling_volatility,
+)
 
 
 def test_return_stats_and_cagr():
@@ -21,3 +30,45 @@ def test_calmar_ratio():
     eq = [100.0, 110.0, 90.0, 95.0, 120.0]
     calmar = compute_calmar(eq, annualization=4.0)
     assert isinstance(calmar, float)
+
+
+def _loop_rolling_sharpe(eq, window):
+    rets = np.diff(eq) / eq[:-1]
+    out = np.full(len(eq), np.nan)
+    for i in range(window - 1, len(rets)):
+        out[i + 1] = compute_sharpe(rets[i - window + 1 : i + 1])
+    return out
+
+
+def test_rolling_metrics_match_window_loop():
+    rng = np.random.RandomState(2)
+    eq = 1e6 * np.cumprod(1 + rng.normal(0.0005, 0.01, size=(300, 3)), axis=0)
+    eq[150:, 2] = eq[149, 2]  # flat stretch: zero volatility windows
+    multi = rolling_sharpe(eq, window=[5, 20])
+    assert multi.shape == (2, 300, 3)
+    for k, w in enumerate([5, 20]):
+        for c in range(3):
+            np.testing.assert_allclose(multi[k, :, c], _loop_rolling_sharpe(eq[:, c], w), rtol=1e-7, atol=1e-9)
+    assert np.all(multi[1, 200:, 2] == 0.0)
+
+    rets = rng.normal(size=50)
+    rets[30] = np.nan
+    vol = rolling_volatility(rets, window=10)
+    expected = np.full(50, np.nan)
+    for i in range(9, 50):
+        expected[i] = np.std(rets[i - 9 : i + 1], ddof=1) * np.sqrt(252)
+    np.testing.assert_allclose(vol, expected, rtol=1e-9)
+
+
+def test_drawdown_episodes_table():
+    eq = [100.0, 110.0, 90.0, 95.0, 120.0, 118.0, 119.0, 121.0, 100.0, 105.0]
+    ep = drawdown_episodes(eq)
+    assert ep["peak"].tolist() == [1, 4, 7]
+    assert ep["start"].tolist() == [2, 5, 8]
+    assert ep["trough"].tolist() == [2, 5, 8]
+    assert ep["recovery"].tolist() == [4, 7, -1]
+    assert ep["duration"].tolist() == [2, 2, 2]
+    assert np.allclose(ep["depth"], [90 / 110 - 1, 118 / 120 - 1, 100 / 121 - 1])
+    dur = compute_drawdown_duration(eq)
+    assert dur == {"max_duration": 2, "avg_duration": 2.0}
+    assert drawdown_episodes([1.0, 2.0, 3.0])["depth"].size == 0
@@ -1,5 +1,5 @@
 import numpy as np
-from qt.ml.pipeline import FeatureBuilder, SimpleModelWrapper
+from qt.ml.pipeline import FeatureBuilder, OnlineFeatureBuilder, SimpleModelWrapper, ridge_path
 
 
 def test_feature_builder_small():
@@ -30,3 +30,147 @@ def test_simple_model_fit_predict():
     m.fit(X, y)
     preds = m.predict(X[:5])
     assert preds.shape[0] == 5
+
+
+def test_online_feature_builder_matches_build_last_row():
+    rng = np.random.RandomState(1)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(scale=0.01, size=120))
+    fb = FeatureBuilder()
+    online = OnlineFeatureBuilder(fb)
+    for t, price in enumerate(prices):
+        row = online.update(price)
+        X, _ = fb.build(prices[: t + 1])
+        if X.shape[0] == 0:
+            assert row is None
+        else:
+            assert np.allclose(row, X[-1], rtol=1e-7, atol=1e-10)
+
+
+def _reference_row(fb, p, e):
+    rets = p[1:] / p[:-1] - 1.0
+    win = rets[e + 1 - fb.rsi_window : e + 1]
+    rs = np.clip(win, 0, None).mean() / max((-np.clip(win, None, 0)).mean(), 1e-12)
+    boll = p[e + 1 - fb.boll_window : e + 1]
+    return np.hstack(
+        [
+            rets[e - fb.window : e],
+            [
+                p[e + 1 - fb.ma_window : e + 1].mean(),
+                np.std(rets[e + 1 - fb.vol_window : e + 1], ddof=1),
+                p[e] / p[e - fb.momentum_window] - 1.0,
+                100.0 - 100.0 / (1.0 + rs),
+            ],
+        ]
+    ), (p[e] - boll.mean()) / max(np.std(boll, ddof=1), 1e-12)
+
+
+def test_feature_builder_vectorised_rows_are_exact():
+    rng = np.random.RandomState(2)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(scale=0.01, size=200))
+    fb = FeatureBuilder()
+    X, y = fb.build(prices)
+    first = 26  # max lookback for the default parameters
+    for k in (0, X.shape[0] // 2, X.shape[0] - 1):
+        head, boll_z = _reference_row(fb, prices, first + k)
+        assert np.array_equal(X[k, : fb.window + 4], head)
+        assert X[k, -1] == boll_z
+        assert y[k] == prices[first + k + 2] / prices[first + k + 1] - 1.0
+
+    X32, y32 = fb.build(prices, dtype=np.float32)
+    assert X32.dtype == np.float32 and y32.dtype == np.float32
+    assert np.allclose(X32, X, rtol=1e-5)
+
+
+def _ridge(X, y, alpha, w=None):
+    w = np.ones(len(y)) if w is None else w
+    return np.linalg.solve((X * w[:, None]).T @ X + alpha * np.eye(X.shape[1]), (X * w[:, None]).T @ y)
+
+
+def test_online_partial_fit_matches_closed_form():
+    rng = np.random.RandomState(3)
+    X = rng.normal(size=(80, 4))
+    y = X @ np.array([1.0, -0.5, 0.0, 2.0]) + rng.normal(scale=0.1, size=80)
+
+    m = SimpleModelWrapper(alpha=0.5)
+    for i in range(len(y)):
+        m.partial_fit(X[i], y[i])
+    assert np.allclose(m.coef_, _ridge(X, y, 0.5), atol=1e-8)
+    assert np.allclose(m.predict(X[:3]), X[:3] @ m.coef_)
+
+    win = SimpleModelWrapper(alpha=0.5, window=20, refit_every=25)
+    win.partial_fit(X, y)
+    assert np.allclose(win.coef_, _ridge(X[-20:], y[-20:], 0.5), atol=1e-8)
+
+    lam = 0.97
+    fg = SimpleModelWrapper(alpha=0.5, forgetting=lam)
+    fg.partial_fit(X, y)
+    weights = lam ** np.arange(len(y))[::-1]
+    expected = _ridge(X, y, 0.5 * lam ** len(y), weights)
+    assert np.allclose(fg.coef_, expected, atol=1e-8)
+
+
+def test_partial_fit_continues_batch_fit():
+    rng = np.random.RandomState(7)
+    X = rng.normal(size=(500, 4))
+    y = X @ np.array([1.0, -2.0, 0.5, 3.0]) + 5.0 + rng.normal(scale=0.1, size=500)
+
+    m = SimpleModelWrapper(alpha=0.5).fit(X[:499], y[:499])
+    m.partial_fit(X[499], y[499])
+    ref = SimpleModelWrapper(alpha=0.5).fit(X, y)
+    assert np.allclose(m.coef_, ref.coef_, atol=1e-8)
+    assert np.isclose(m.intercept_, ref.intercept_)
+    assert np.allclose(m.predict(X[:5]), ref.predict(X[:5]), atol=1e-8)
+
+    m.partial_fit(X[:50], y[:50])
+    X2, y2 = np.vstack([X, X[:50]]), np.concatenate([y, y[:50]])
+    assert np.allclose(m.coef_, SimpleModelWrapper(alpha=0.5).fit(X2, y2).coef_, atol=1e-8)
+
+
+def test_windowed_forgetting_after_batch_fit_matches_weighted_ridge():
+    rng = np.random.RandomState(11)
+    X = rng.normal(size=(300, 3))
+    y = X @ np.array([0.5, -1.0, 2.0]) + 1.0 + rng.normal(scale=0.1, size=300)
+    alpha, lam, window = 0.5, 0.97, 50
+
+    m = SimpleModelWrapper(alpha=alpha, forgetting=lam, window=window).fit(X[:200], y[:200])
+    aug = m.model is not None  # sklearn backend carries an unpenalised intercept
+    for n in (30, 100):
+        m.partial_fit(X[200 + m.n_updates_ : 200 + n], y[200 + m.n_updates_ : 200 + n])
+        # seeded rows weigh lam**n, the j-th streamed row lam**(n - 1 - j); keep the last `window`
+        rows = np.arange(200 - window, 200 + n)[-window:]
+        w = np.where(rows < 200, lam**n, lam ** (199 + n - rows))
+        Xa = np.column_stack([X[rows], np.ones(window)]) if aug else X[rows]
+        pen = np.full(Xa.shape[1], alpha * lam**n)
+        if aug:
+            pen[-1] = 0.0
+        theta = np.linalg.solve(Xa.T @ (w[:, None] * Xa) + np.diag(pen), Xa.T @ (w * y[rows]))
+        assert np.allclose(m.coef_, theta[:3], atol=1e-8)
+        if aug:
+            assert np.isclose(m.intercept_, theta[3], atol=1e-8)
+
+
+def test_ridge_path_matches_per_alpha_fits():
+    rng = np.random.RandomState(5)
+    X = rng.normal(size=(40, 3))
+    y = X @ np.array([0.5, -1.0, 0.25]) + 0.3 + rng.normal(scale=0.2, size=40)
+    alphas = [0.01, 1.0, 10.0]
+
+    for fit_intercept in (False, True):
+        path = ridge_path(X, y, alphas=alphas, fit_intercept=fit_intercept)
+        for k, a in enumerate(alphas):
+            loo_err = []
+            for i in range(len(y)):
+                mask = np.arange(len(y)) != i
+                Xi, yi = X[mask], y[mask]
+                xm, ym = (Xi.mean(axis=0), yi.mean()) if fit_intercept else (np.zeros(3), 0.0)
+                w = _ridge(Xi - xm, yi - ym, a)
+                loo_err.append(y[i] - (ym + (X[i] - xm) @ w))
+            assert np.isclose(path["loo"][k], np.mean(np.square(loo_err)))
+        xm, ym = (X.mean(axis=0), y.mean()) if fit_intercept else (np.zeros(3), 0.0)
+        assert np.allclose(path["coefs"][1], _ridge(X - xm, y - ym, 1.0))
+        assert path["best_alpha"] == alphas[int(np.argmin(path["loo"]))]
+
+    m = SimpleModelWrapper()
+    path = m.tune_alpha(X, y, alphas=alphas, criterion="gcv")
+    assert m.alpha == path["best_alpha"]
+    assert path["gcv"].shape == (3,)
@@ -0,0 +1,27 @@
+import numpy as np
+
+from qt.ml.validation import cross_validate_model, purged_splits
+
+
+def test_purged_splits_leave_gaps():
+    for train, test in purged_splits(100, n_splits=4, purge=3):
+        assert train.max() < test.min() - 3
+    for train, test in purged_splits(100, n_splits=4, purge=2, embargo=5, walk_forward=False):
+        before = train[train < test.min()]
+        after = train[train > test.max()]
+        assert len(before) == 0 or before.max() < test.min() - 2
+        assert len(after) == 0 or after.min() > test.max() + 5
+
+
+def test_cross_validate_parallel_matches_serial():
+    rng = np.random.RandomState(1)
+    X = rng.normal(size=(300, 5))
+    y = X @ rng.normal(size=5) + rng.normal(scale=0.5, size=300)
+
+    serial = cross_validate_model(X, y, n_splits=4, purge=2)
+    par = cross_validate_model(X, y, n_splits=4, purge=2, n_jobs=2)
+    assert serial["mse"].shape == (4,)
+    assert len(serial["oos_pred"]) == serial["n_test"].sum() == len(serial["oos_index"])
+    np.testing.assert_allclose(serial["oos_pred"], par["oos_pred"])
+    np.testing.assert_allclose(serial["oos_true"], y[serial["oos_index"]])
+    assert np.all(serial["ic"] > 0.5)
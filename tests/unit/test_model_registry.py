@@ -0,0 +1,52 @@
+import numpy as np
+
+from qt.ml.pipeline import FeatureBuilder, SimpleModelWrapper
+from qt.ml.registry import ModelRegistry
+
+
+def test_registry_roundtrip_and_versions(tmp_path):
+    rng = np.random.RandomState(0)
+    X = rng.normal(size=(50, 3))
+    y = X @ np.array([1.0, 2.0, -1.0]) + 0.5
+    fb = FeatureBuilder(window=5, ma_window=8)
+    model = SimpleModelWrapper(alpha=0.1).fit(X, y)
+
+    reg = ModelRegistry(root=str(tmp_path), cache_size=1)
+    v1 = reg.save("mom", model, builder=fb, metadata={"symbol": "X"})
+    v2 = reg.save("mom", model)
+    assert (v1, v2) == (1, 2)
+    assert reg.versions("mom") == [1, 2]
+
+    loaded, builder = reg.load("mom", version=1)
+    assert isinstance(loaded.coef_, np.memmap)
+    np.testing.assert_allclose(loaded.predict(X), model.predict(X))
+    assert builder.get_params() == fb.get_params()
+    again = reg.load("mom", version=1)[0]
+    # a fresh wrapper per load, on the cached memmap
+    assert again is not loaded and again.coef_ is loaded.coef_
+    assert reg.metadata("mom", 1)["metadata"] == {"symbol": "X"}
+
+    latest, builder = reg.load("mom")
+    assert builder is None
+    # cache_size=1 evicted version 1
+    assert reg.load("mom", version=1)[0].coef_ is not loaded.coef_
+
+
+def test_loaded_models_are_independent(tmp_path):
+    rng = np.random.RandomState(1)
+    X = rng.normal(size=(40, 2))
+    y = X @ np.array([1.0, -1.0])
+    reg = ModelRegistry(root=str(tmp_path))
+    reg.save("m", SimpleModelWrapper(alpha=0.1).fit(X, y))
+
+    a, _ = reg.load("m")
+    b, _ = reg.load("m")
+    before = b.predict(X[:3]).copy()
+    a.partial_fit(X[:5], -y[:5])
+    a.fit(X, -y)
+    np.testing.assert_allclose(b.predict(X[:3]), before)
+
+    # a version saved after the latest lookup was cached is still found
+    assert reg.save("m", a) == 2
+    assert reg.metadata("m")["version"] == 2
+    np.testing.assert_allclose(reg.load("m")[0].predict(X[:3]), a.predict(X[:3]))
@@ -0,0 +1,49 @@
+import numpy as np
+
+from qt.engine.engine import SimulationEngine
+from qt.engine.event import MarketEvent
+from qt.ml.pipeline import SimpleModelWrapper
+from qt.strategies.momentum import MomentumModelStrategy
+
+
+class CountingModel:
+    def __init__(self, coef):
+        self.inner = SimpleModelWrapper.from_coefficients(coef)
+        self.calls = []
+
+    def predict(self, X):
+        self.calls.append(len(X))
+        return self.inner.predict(X)
+
+
+def _run(batched: bool):
+    rng = np.random.RandomState(0)
+    symbols = ["A", "B", "C"]
+    model = CountingModel(rng.normal(size=12))
+    eng = SimulationEngine()
+    for sym in symbols:
+        eng.register_strategy(MomentumModelStrategy(sym, window=5, model=model))
+    prices = 100 + np.cumsum(rng.normal(size=(60, 3)), axis=0)
+    for t in range(60):
+        events = [
+            MarketEvent(timestamp=float(t), type="TRADE", symbol=s, price=float(prices[t, j]), size=1.0, side=None)
+            for j, s in enumerate(symbols)
+        ]
+        if batched:
+            eng._process_market_events(events)
+        else:
+            for ev in events:
+                eng._process_market_event(ev)
+    return eng, model
+
+
+def test_batched_predict_matches_per_event_dispatch():
+    eng_b, model_b = _run(batched=True)
+    eng_s, model_s = _run(batched=False)
+    # one predict per timestamp covering all three symbols once warmed up
+    assert set(model_b.calls) == {3}
+    assert set(model_s.calls) == {1}
+    assert sum(model_b.calls) == sum(model_s.calls)
+    assert [(t["symbol"], t["side"], t["price"]) for t in eng_b.trade_log] == [
+        (t["symbol"], t["side"], t["price"]) for t in eng_s.trade_log
+    ]
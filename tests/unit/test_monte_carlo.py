@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from qt.analytics import monte_carlo
+from qt.analytics.monte_carlo import cached_factor, covariance_factor, iter_asset_returns, var_surface
+from qt.analytics.risk_ext import multi_asset_monte_carlo_var
+
+
+def _returns(T=600, N=40, seed=0):
+    rng = np.random.default_rng(seed)
+    common = rng.normal(size=(T, 3)) @ rng.normal(size=(3, N)) * 0.004
+    return common + rng.normal(size=(T, N)) * 0.01
+
+
+def test_factor_fallback_for_singular_covariance():
+    rets = _returns(N=4)
+    cov = np.cov(np.column_stack([rets, rets[:, 0]]), rowvar=False)
+    F = covariance_factor(cov)
+    np.testing.assert_allclose(F @ F.T, cov, atol=1e-12)
+    low = covariance_factor(np.cov(rets, rowvar=False), method="lowrank", rank=2)
+    assert low.shape == (4, 2)
+
+
+def test_mc_var_matches_normal_quantile():
+    rets = _returns()
+    w = np.full(rets.shape[1], 1.0 / rets.shape[1])
+    mu, cov = rets.mean(axis=0), np.cov(rets, rowvar=False)
+    exact = -(10 * mu @ w + norm.ppf(0.05) * np.sqrt(10 * w @ cov @ w))
+    v = multi_asset_monte_carlo_var(rets, w, horizon=10, simulations=200_000, rng=1, chunk_size=5000)
+    assert v == pytest.approx(exact, rel=0.02)
+
+
+def test_factor_cache_and_surface():
+    monte_carlo.clear_factor_cache()
+    rets = _returns(seed=3)
+    w = np.full(rets.shape[1], 1.0 / rets.shape[1])
+    first = cached_factor(rets)
+    assert cached_factor(rets.copy()) is first
+
+    table = var_surface(rets, w, alphas=(0.01, 0.05), horizons=(1, 5), simulations=50_000, rng=0)
+    assert list(table.columns) == ["alpha", "horizon", "var", "cvar"]
+    assert len(table) == 4
+    assert (table["cvar"] >= table["var"]).all()
+    one = table[(table.alpha == 0.05) & (table.horizon == 5)]["var"].iloc[0]
+    assert one == pytest.approx(multi_asset_monte_carlo_var(rets, w, horizon=5, simulations=50_000, rng=5), rel=0.05)
+
+
+def test_asset_level_chunks_have_target_covariance():
+    rets = _returns(N=5)
+    mu, F = cached_factor(rets)
+    chunks = list(iter_asset_returns(mu, F, horizon=2, simulations=20_000, chunk_size=3000, rng=0))
+    assert [c.shape[0] for c in chunks][-1] == 20_000 - 6 * 3000
+    sims = np.concatenate(chunks)
+    np.testing.assert_allclose(np.cov(sims, rowvar=False), 2 * np.cov(rets, rowvar=False), atol=3e-5)
+
+
+def test_zero_horizon_has_zero_pnl_and_negative_raises():
+    from qt.analytics.risk_engine import MonteCarloRiskEngine
+
+    rets = _returns(N=5)
+    w = np.full(5, 0.2)
+    assert multi_asset_monte_carlo_var(rets, w, horizon=0, simulations=1000, rng=0) == 0.0
+    table = var_surface(rets, w, alphas=(0.05,), horizons=(0, 5), simulations=1000, rng=0)
+    assert table["var"].iloc[0] == 0.0 and table["cvar"].iloc[0] == 0.0
+    assert table["var"].iloc[1] > 0.0
+    with pytest.raises(ValueError):
+        var_surface(rets, w, horizons=(1, -1), simulations=100, rng=0)
+    with pytest.raises(ValueError):
+        MonteCarloRiskEngine(seed=0).horizon_var(rets[:, 0], horizons=(-2,), simulations=100)
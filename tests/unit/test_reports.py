@@ -0,0 +1,75 @@
+import csv
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from qt.analytics.reports import (
+    CsvSink,
+    JsonSink,
+    ParquetSink,
+    _legacy_buckets,
+    _week_key,
+    build_report,
+    daily_summary,
+    full_report,
+    weekly_summary,
+)
+
+
+def _day_key(ts):
+    return datetime.fromtimestamp(float(ts)).date().isoformat()
+
+
+def test_vectorised_buckets_match_per_row_grouping(tmp_path):
+    rng = np.random.RandomState(0)
+    ts = np.sort(1.67e9 + rng.uniform(0, 9e6, 800))
+    rng.shuffle(ts[:40])  # out-of-order points keep their input order within a bucket
+    history = [(float(t), float(100 + rng.normal())) for t in ts]
+
+    for fn, key_fn in ((daily_summary, _day_key), (weekly_summary, _week_key)):
+        new = fn(history, out_csv_path=str(tmp_path / "out.csv"))
+        old = {k: m for k, m, _ in _legacy_buckets(history, key_fn)}
+        assert list(new) == list(old)
+        for k, expected in old.items():
+            got = new[k]
+            assert got["final_equity"] == expected["final_equity"]
+            assert got["returns"] == expected["returns"]
+            for field in ("sharpe", "max_drawdown"):
+                if expected[field] is None:
+                    assert got[field] is None
+                else:
+                    assert np.isclose(got[field], expected[field], equal_nan=True)
+
+
+def test_non_numeric_timestamps_fall_back():
+    out = daily_summary([("a", 1.0), ("a", 2.0), ("b", 3.0)])
+    assert set(out) == {"a", "b"}
+    assert out["a"]["final_equity"] == 2.0
+
+
+def test_build_report_is_in_memory_and_sinks_write(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    history = [(1.7e9 + 3600.0 * i, 100.0 + i % 5) for i in range(60)]
+    trades = [{"price": 10.0, "quantity": 2.0}, {"price": 11.0, "quantity": -1.0}]
+    report = build_report(history, trade_log=trades, exposure_history=[(t, 50.0, 10.0) for t, _ in history])
+    assert report.summary["total_trades"] == 2 and report.summary["turnover"] == 31.0
+    assert full_report(history, trade_log=trades, out_csv_path=None)["n_points"] == 60
+    assert list(tmp_path.iterdir()) == []
+
+    paths = report.write(CsvSink(tmp_path / "run.csv"), JsonSink(tmp_path / "run.json"))
+    assert {p.name for p in tmp_path.iterdir()} == {Path(p).name for p in paths}
+    with open(tmp_path / "run.csv") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["metric", "value"] and rows[-1] == ["turnover", "31.0"]
+    assert set(json.loads((tmp_path / "run.json").read_text())) == {"summary", "daily", "weekly"}
+
+
+def test_parquet_sink(tmp_path):
+    pytest.importorskip("pyarrow")
+    report = build_report([(1.7e9 + 3600.0 * i, 100.0 + i) for i in range(30)])
+    report.write(ParquetSink(tmp_path / "run"))
+    assert len(pd.read_parquet(tmp_path / "run_daily.parquet")) == len(report.daily)
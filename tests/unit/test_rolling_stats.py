@@ -0,0 +1,36 @@
+import numpy as np
+
+from qt.risk.sizing import size_by_volatility
+from qt.utils.rolling import EWMAStats, RollingStats
+
+
+def test_rolling_stats_matches_numpy_window():
+    rng = np.random.default_rng(0)
+    xs = rng.normal(0.0, 0.01, size=200)
+    rs = RollingStats(20)
+    for i, x in enumerate(xs):
+        rs.push(x)
+        w = xs[max(0, i - 19) : i + 1]
+        assert rs.count == len(w)
+        assert abs(rs.mean - w.mean()) < 1e-12
+        if len(w) > 1:
+            assert abs(rs.std() - np.std(w, ddof=1)) < 1e-12
+
+
+def test_ewma_stats_matches_recursion():
+    xs = [0.01, -0.02, 0.015, 0.0, 0.03]
+    ew = EWMAStats(0.2, initial=0.0)
+    v = 0.0
+    for x in xs:
+        ew.push(x)
+        v = 0.8 * v + 0.2 * x
+    assert abs(ew.mean - v) < 1e-15
+    assert ew.variance() >= 0.0
+
+
+def test_size_by_volatility_accepts_rolling_stats():
+    prices = 100 * np.cumprod(1 + np.random.default_rng(1).normal(0, 0.01, size=30))
+    rs = RollingStats(len(prices) - 1)
+    for prev, cur in zip(prices[:-1], prices[1:]):
+        rs.push(cur / prev - 1.0)
+    assert abs(size_by_volatility(0.01, rs) - size_by_volatility(0.01, prices)) < 1e-9
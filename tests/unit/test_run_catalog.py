@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+from qt.utils.run_artifacts import read_run_dataset, save_run_artifacts, write_run_dataset
+from qt.utils.run_catalog import RunCatalog
+
+
+def test_catalog_top_runs_with_param_filter(tmp_path):
+    cat = RunCatalog(str(tmp_path / "catalog.sqlite"))
+    for i in range(10):
+        fee = 0.0005 if i % 2 else 0.0
+        cat.record_run(
+            f"r{i}",
+            params={"execution_fee": fee, "window": 10 + i, "strategy": "pairs"},
+            metrics={"sharpe": float(i), "note": "x"},
+        )
+    top = cat.top_runs("sharpe", n=3, where={"execution_fee": 0.0005}, params=["window"])
+    assert top["run_id"].tolist() == ["r9", "r7", "r5"]
+    assert top["window"].tolist() == [19.0, 17.0, 15.0]
+    assert cat.top_runs("sharpe", n=1, ascending=True, strategy="pairs")["run_id"].tolist() == ["r0"]
+    run = cat.get_run("r3")
+    assert run["params"]["execution_fee"] == 0.0005 and run["metrics"] == {"sharpe": 3.0}
+
+
+def test_parquet_run_dataset_roundtrip(tmp_path):
+    pytest.importorskip("pyarrow")
+    trades = [{"timestamp": 1.0, "order_id": "a", "symbol": "X", "side": "BUY", "price": 10.0, "quantity": 1.0, "fee": 0.0}]
+    write_run_dataset("run-a", [(0.0, 100.0), (1.0, 101.0)], trades, root=str(tmp_path / "ds"))
+    write_run_dataset("run-b", [(0.0, 50.0)], [], root=str(tmp_path / "ds"))
+    eq = read_run_dataset(str(tmp_path / "ds"), "equity", run_ids=["run-a"], columns=["equity"])
+    assert eq["equity"].tolist() == [100.0, 101.0] and set(eq["run_id"]) == {"run-a"}
+    assert len(read_run_dataset(str(tmp_path / "ds"), "trades")) == 1
+
+    run_id = save_run_artifacts(
+        "demo", {"fee": 0.001}, {"sharpe": 1.5}, [(0.0, 1.0)], [], out_dir=str(tmp_path), fmt="parquet"
+    )
+    top = RunCatalog(str(tmp_path / "catalog.sqlite")).top_runs("sharpe", where={"fee": 0.001})
+    assert top["run_id"].tolist() == [run_id]
+
+
+def test_catalog_closes_its_connections(tmp_path, monkeypatch):
+    cat = RunCatalog(str(tmp_path / "catalog.sqlite"))
+    opened = []
+    connect = cat._connect
+
+    def tracking_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(cat, "_connect", tracking_connect)
+    cat.record_run("r0", params={"fee": 0.0}, metrics={"sharpe": 1.0})
+    cat.top_runs("sharpe", params=["fee"])
+    cat.get_run("r0")
+    cat.runs_table()
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_runs_table_handles_more_ids_than_one_query_binds(tmp_path):
+    cat = RunCatalog(str(tmp_path / "catalog.sqlite"))
+    ids = [f"r{i:04d}" for i in range(1200)]
+    for i, run_id in enumerate(ids):
+        cat.record_run(run_id, params={"fee": i}, metrics={"sharpe": float(i)})
+    table = cat.runs_table(run_ids=ids[:1100] + ["missing"])
+    assert len(table) == 1100
+    assert (table["sharpe"] == table["fee"]).all()
+    assert len(cat.runs_table()) == 1200
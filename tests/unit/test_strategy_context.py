@@ -0,0 +1,37 @@
+from qt.engine.engine import SimulationEngine
+from qt.engine.event import FillEvent, MarketEvent
+from qt.engine.order_book import OrderBook
+from qt.strategies.market_maker import SimpleMarketMaker
+
+
+def test_context_matches_order_book_and_account():
+    eng = SimulationEngine()
+    mm = SimpleMarketMaker("X")
+    eng.register_strategy(mm)
+    ctx = mm.ctx
+    assert ctx is eng.context("X")
+    # no book yet: falls back to the default price
+    assert ctx.mid() == 100.0
+
+    book = eng._set_order_book("X", OrderBook())
+    book.update_from_snapshot([(99.0, 10)], [(101.0, 10)])
+    assert ctx.best_bid() == 99.0
+    assert ctx.best_ask() == 101.0
+    assert ctx.mid() == book.mid_price() == 100.0
+
+    eng._process_market_event(MarketEvent(timestamp=1.0, type="TRADE", symbol="X", price=100.5, size=1.0, side=None))
+    assert ctx.last() == 100.5
+
+    eng.account.on_fill(FillEvent(order_id="f1", timestamp=1.0, symbol="X", side="BUY", price=100.0, quantity=2.0))
+    assert ctx.position() == 2.0
+
+
+def test_context_rebinds_when_book_replaced():
+    eng = SimulationEngine()
+    ctx = eng.context("X")
+    first = eng._set_order_book("X", OrderBook())
+    first.update_from_snapshot([(9.0, 1)], [(11.0, 1)])
+    assert ctx.mid() == 10.0
+    second = eng._set_order_book("X", OrderBook())
+    second.update_from_snapshot([(19.0, 1)], [(21.0, 1)])
+    assert ctx.mid() == 20.0
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from qt.analytics.metrics import (
+    compute_cagr,
+    compute_calmar,
+    compute_drawdown,
+    compute_drawdown_duration,
+    compute_returns,
+    compute_sharpe,
+    compute_sortino,
+)
+from qt.risk.accounting import Account
+
+
+def test_account_streaming_metrics_match_batch():
+    rng = np.random.RandomState(4)
+    eq = 1000.0 * np.cumprod(1 + rng.normal(0.0002, 0.01, size=400))
+    assert Account(initial_cash=0.0).metrics is None
+    acc = Account(initial_cash=0.0, streaming_stats=True)
+    for t, e in enumerate(eq):
+        acc.cash = float(e)
+        acc.mark_to_market(float(t), {})
+
+    s = acc.metrics.summary()
+    rets = compute_returns(eq)
+    dur = compute_drawdown_duration(eq)
+    assert np.isclose(s["sharpe"], compute_sharpe(rets))
+    assert np.isclose(s["sortino"], compute_sortino(rets))
+    assert np.isclose(s["max_drawdown"], compute_drawdown(eq)["max_drawdown"])
+    assert np.isclose(s["calmar"], compute_calmar(eq))
+    assert s["max_drawdown_duration"] == dur["max_duration"]
+    assert np.isclose(s["avg_drawdown_duration"], dur["avg_duration"])
+    assert np.isclose(s["hit_rate"], np.mean(rets > 0))
+    assert s["n_points"] == 400 and s["avg_gross_exposure"] == 0.0
+
+
+def test_streaming_tail_risk_matches_batch_and_merges():
+    import pickle
+    from statistics import NormalDist
+
+    from qt.analytics.risk import compute_cvar, compute_var
+    from qt.analytics.streaming import StreamingTailRisk, TDigest
+
+    rets = np.random.default_rng(0).standard_t(3, size=50_000) * 0.01
+    full = StreamingTailRisk(alpha=0.01)
+    for r in rets:
+        full.update_return(r)
+    assert full.digest.n_centroids < 200
+    assert np.isclose(full.var(), compute_var(rets, 0.01), rtol=0.02)
+    assert np.isclose(full.cvar(), compute_cvar(rets, 0.01), rtol=0.02)
+
+    left, right = StreamingTailRisk(alpha=0.01), StreamingTailRisk(alpha=0.01)
+    for r in rets[:20_000]:
+        left.update_return(r)
+    for r in rets[20_000:]:
+        right.update_return(r)
+    merged = pickle.loads(pickle.dumps(left)).merge(right)
+    assert merged.n_returns == rets.size
+    assert np.isclose(merged.var(), full.var(), rtol=0.02)
+
+    digest = TDigest()
+    for x in [3.0, 1.0, 2.0]:
+        digest.update(x)
+    assert digest.quantile(0.0) == 1.0 and digest.quantile(1.0) == 3.0
+
+    # EWMA parametric VaR follows a volatility regime change quickly
+    calm = StreamingTailRisk(alpha=0.05)
+    for r in np.random.default_rng(1).normal(0.0, 0.01, size=2000):
+        calm.update_return(r)
+    for r in np.random.default_rng(2).normal(0.0, 0.03, size=200):
+        calm.update_return(r)
+    assert np.isclose(calm.parametric_var(), -NormalDist().inv_cdf(0.05) * 0.03, rtol=0.15)
+    assert calm.parametric_cvar() > calm.parametric_var()
+
+
+def test_account_tracks_tail_risk():
+    eq = 1000.0 * np.cumprod(1 + np.random.RandomState(3).normal(0.0, 0.01, size=300))
+    assert Account(initial_cash=0.0).tail_risk is None
+    acc = Account(initial_cash=0.0, streaming_stats=True)
+    for t, e in enumerate(eq):
+        acc.cash = float(e)
+        acc.mark_to_market(float(t), {})
+    summary = acc.tail_risk.summary()
+    assert summary["n_returns"] == 299
+    assert summary["cvar"] >= summary["var"] > 0.0
+
+
+def test_streaming_cagr_nan_when_equity_goes_negative():
+    from qt.analytics.streaming import StreamingMetrics
+
+    eq = [100.0, 50.0, -10.0, -20.0, -30.0, -40.0]
+    m = StreamingMetrics()
+    for e in eq:
+        m.update(e)
+    s = m.summary()
+    with np.errstate(invalid="ignore"):
+        assert np.isnan(compute_cagr(eq))
+    assert np.isnan(s["cagr"])
+
+
+def test_streaming_sortino_matches_batch_for_one_downside_return():
+    from qt.analytics.streaming import StreamingMetrics
+
+    eq = [100.0, 101.0, 99.0, 100.0]
+    m = StreamingMetrics()
+    for e in eq:
+        m.update(e)
+    with pytest.warns(RuntimeWarning), np.errstate(invalid="ignore", divide="ignore"):
+        expected = compute_sortino(compute_returns(eq))
+    assert np.isnan(expected) and np.isnan(m.sortino())
@@ -5,6 +5,9 @@ from qt.engine.engine import SimulationEngine
 from qt.strategies.market_maker import SimpleMarketMaker, AvellanedaMarketMaker
 from qt.strategies.pairs import PairsStrategy
 from qt.analytics.metrics import compute_returns, compute_sharpe, compute_drawdown
+from qt.analytics.reporting import generate_batch_reports
+from qt.utils.run_artifacts import PYARROW_AVAILABLE, new_run_id, save_run_artifacts, write_run_dataset
+from qt.utils.run_catalog import RunCatalog
 
 
 def run_demo_with_params(strategy="simple", **params):
@@ -37,7 +40,19 @@ def run_demo_with_params(strategy="simple", **params):
     return eng.account.equity_history, eng
 
 
-def sweep_and_save(strategy="simple", param_combos=None, out_csv="sweep_results.csv"):
+def sweep_and_save(strategy="simple", param_combos=None, out_csv="sweep_results.csv", out_root="runs", reports_dir=None):
+    """Run a parameter sweep.
+
+    Per-run equity/trades are written to the Parquet dataset under
+    `<out_root>/dataset` and configs/metrics to `<out_root>/catalog.sqlite`,
+    e.g. ``RunCatalog("runs/catalog.sqlite").top_runs("sharpe", where={"execution_fee": 0.0005})``.
+    `out_csv` gets one summary row per combo with its run id. With
+    `reports_dir`, HTML reports for every run plus a ranked `index.html`
+    are rendered in parallel after the sweep. Without pyarrow each run's
+    equity/trades go to `<out_root>/<run_id>.json` instead of the Parquet
+    dataset (the catalog is still written), and reports are rendered from
+    the in-memory results.
+    """
     if param_combos is None:
         if strategy == "pairs":
             param_combos = itertools.product(
@@ -55,59 +70,57 @@ def sweep_and_save(strategy="simple", param_combos=None, out_csv="sweep_results.
         else:
             param_names = ["base_spread", "inventory_coeff", "execution_fee", "slippage_coeff"]
 
-    rows = [param_names + ["strategy", "final_equity", "sharpe", "max_drawdown", "turnover", "equity_path", "trades_path"]]
-    out_dir = Path("notebooks")
+    rows = [param_names + ["strategy", "final_equity", "sharpe", "max_drawdown", "turnover", "run_id"]]
+    out_dir = Path(out_root)
     out_dir.mkdir(parents=True, exist_ok=True)
+    catalog = RunCatalog(str(out_dir / "catalog.sqlite"))
+    dataset_root = str(out_dir / "dataset") if PYARROW_AVAILABLE else None
+    report_runs = []
     for combo in param_combos:
         params = dict(zip(param_names, combo))
         history, eng = run_demo_with_params(strategy, **params)
         turnover = None
-        trades_path = ""
+        run_id = ""
         if not history:
             final_equity = None
             sharpe = None
             max_dd = None
-            equity_path = ""
         else:
             # history is list of (timestamp, equity)
-            fname_parts = [f"{k}{v}" for k, v in params.items() if k not in ["strategy", "execution_fee", "slippage_coeff"]]
-            fname = out_dir / f"equity_{'_'.join(fname_parts)}.csv"
-            with open(fname, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(("timestamp", "equity"))
-                for ts, eq in history:
-                    writer.writerow((ts, eq))
             equity_vals = [eq for (_, eq) in history]
             final_equity = equity_vals[-1]
             rets = compute_returns(equity_vals)
             sharpe = compute_sharpe(rets)
             max_dd = compute_drawdown(equity_vals)["max_drawdown"]
-            equity_path = str(fname)
-            # save trades and compute turnover
-            trades_fname = out_dir / f"trades_{'_'.join(fname_parts)}.csv"
-            with open(trades_fname, "w", newline="") as f:
-                w = csv.writer(f)
-                w.writerow(("timestamp", "order_id", "symbol", "side", "price", "quantity", "fee"))
-                turnover = 0.0
-                for t in eng.trade_log:
-                    w.writerow(
-                        (
-                            t["timestamp"],
-                            t["order_id"],
-                            t.get("symbol"),
-                            t.get("side"),
-                            t.get("price"),
-                            t.get("quantity"),
-                            t.get("fee"),
-                        )
+            turnover = sum(abs(float(t.get("price", 0)) * float(t.get("quantity", 0))) for t in eng.trade_log)
+            # equity and trades go to the partitioned Parquet dataset, config and metrics to the catalog
+            run_id = new_run_id(f"sweep-{strategy}")
+            metrics = {"final_equity": final_equity, "sharpe": sharpe, "max_drawdown": max_dd, "turnover": turnover}
+            if dataset_root is not None:
+                write_run_dataset(run_id, history, eng.trade_log, root=dataset_root)
+                report_runs.append(run_id)
+            else:
+                config = dict(params, strategy=strategy)
+                save_run_artifacts(run_id, config, metrics, history, eng.trade_log, out_dir=str(out_dir), fmt="json")
+                if reports_dir is not None:
+                    report_runs.append(
+                        {"run_name": run_id, "summary": metrics, "equity_history": history, "trade_log": list(eng.trade_log)}
                     )
-                    turnover += abs(float(t.get("price", 0)) * float(t.get("quantity", 0)))
-            trades_path = str(trades_fname)
-        row = list(combo) + [strategy, final_equity, sharpe, max_dd, turnover, equity_path, trades_path]
+            catalog.record_run(
+                run_id,
+                params=dict(params, strategy=strategy),
+                metrics=metrics,
+                name="param_sweep",
+                strategy=strategy,
+                artifact_root=dataset_root,
+            )
+        row = list(combo) + [strategy, final_equity, sharpe, max_dd, turnover, run_id]
         rows.append(row)
     with open(out_csv, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerows(rows)
+    if reports_dir is not None:
+        generate_batch_reports(report_runs, out_dir=reports_dir, catalog_path=str(out_dir / "catalog.sqlite"))
 
 
 if __name__ == "__main__":
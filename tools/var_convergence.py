@@ -0,0 +1,80 @@
+"""Convergence benchmark for Monte Carlo VaR/CVaR samplers.
+
+For each sampler and sample count, repeats `compute_var` / `compute_cvar`
+(method="mc") with independent seeds on normal returns and reports the
+RMSE against the closed-form normal VaR/CVaR, plus the sample count each
+scheme needs to match plain pseudo-random sampling at the reference size.
+
+    python tools/var_convergence.py [--alpha 0.01] [--repeats 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.stats import norm
+
+# Ensure project root is on sys.path
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from qt.analytics.risk import compute_cvar, compute_var
+
+SCHEMES = [
+    ("pseudo", "pseudo", False),
+    ("antithetic", "antithetic", False),
+    ("moment_match", "pseudo", True),
+    ("sobol", "sobol", False),
+    ("sobol+mm", "sobol", True),
+]
+SIZES = [256, 1024, 4096, 16384, 65536]
+
+
+def run(alpha=0.01, repeats=200, reference=10000, seed=0):
+    returns = np.random.default_rng(seed).normal(0.0005, 0.01, size=2000)
+    mu, sigma = returns.mean(), returns.std(ddof=1)
+    z = norm.ppf(alpha)
+    true_var = -(mu + sigma * z)
+    true_cvar = -(mu - sigma * norm.pdf(z) / alpha)
+
+    rows = []
+    for name, sampler, mm in SCHEMES:
+        for n in SIZES:
+            start = time.perf_counter()
+            v = [compute_var(returns, alpha, "mc", n, rng=r, sampler=sampler, moment_match=mm) for r in range(repeats)]
+            elapsed = (time.perf_counter() - start) / repeats
+            c = [compute_cvar(returns, alpha, "mc", n, rng=r, sampler=sampler, moment_match=mm) for r in range(repeats)]
+            rows.append(
+                {
+                    "scheme": name,
+                    "n": n,
+                    "var_rmse": float(np.sqrt(np.mean((np.array(v) - true_var) ** 2))),
+                    "cvar_rmse": float(np.sqrt(np.mean((np.array(c) - true_cvar) ** 2))),
+                    "ms_per_call": elapsed * 1000,
+                }
+            )
+
+    # pseudo-random error at the reference size, interpolated in log-log space
+    pseudo = [r for r in rows if r["scheme"] == "pseudo"]
+    target = float(np.exp(np.interp(np.log(reference), np.log(SIZES), np.log([r["var_rmse"] for r in pseudo]))))
+    print(f"alpha={alpha} true VaR={true_var:.6f} true CVaR={true_cvar:.6f} repeats={repeats}")
+    print(f"{'scheme':<14}{'n':>8}{'VaR RMSE':>14}{'CVaR RMSE':>14}{'ms/call':>10}")
+    for r in rows:
+        print(f"{r['scheme']:<14}{r['n']:>8}{r['var_rmse']:>14.3e}{r['cvar_rmse']:>14.3e}{r['ms_per_call']:>10.3f}")
+    print(f"\nsamples needed to match pseudo-random VaR RMSE at n={reference} ({target:.3e}):")
+    for name, _, _ in SCHEMES:
+        errs = np.array([r["var_rmse"] for r in rows if r["scheme"] == name])
+        # errors decrease with n: interpolate log(n) against log(error)
+        needed = float(np.exp(np.interp(np.log(target), np.log(errs[::-1]), np.log(SIZES[::-1]))))
+        print(f"  {name:<14}{needed:>10.0f}  (reduction {reference / needed:.1f}x)")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alpha", type=float, default=0.01)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+    run(alpha=args.alpha, repeats=args.repeats)